@@ -0,0 +1,50 @@
+import pytest
+from App import logic
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.List import single_linked_list as lt
+from DataStructures.Map import map_linear_probing as m
+
+servicefile = 'bus_routes_test.csv'
+
+
+def setup_tests(transfer_penalty=logic.TRANSFER_PENALTY):
+    analyzer = logic.init()
+    logic.load_services(analyzer, servicefile, transfer_penalty)
+    return analyzer
+
+
+def routes(analyzer, stop):
+    lstroutes = m.get(analyzer['stops'], stop)
+    return sorted(lt.get_element(lstroutes, i) for i in range(lt.size(lstroutes)))
+
+
+def test_load_services_records_routes():
+    analyzer = setup_tests()
+    assert routes(analyzer, '200') == ['10', '20', '50']
+    assert routes(analyzer, '300') == ['10', '50']
+    assert routes(analyzer, '400') == ['20', '30']
+    assert routes(analyzer, '100') == ['10']
+
+    # 11 vértices estación-ruta, 7 estaciones de transbordo
+    assert logic.total_stops(analyzer) == 11
+    assert logic.total_stations(analyzer) == 7
+    assert logic.connected_components(analyzer) == 2
+    assert logic.same_component(analyzer, '100-10', '500-30')
+    assert not logic.same_component(analyzer, '100-10', '700-40')
+
+
+def test_transfer_penalty():
+    analyzer = setup_tests(transfer_penalty=1.0)
+    assert logic.set_station(analyzer, '200-10')
+    paths = analyzer['paths']
+    assert dj.dist_to(paths, '200-20') == pytest.approx(1.0)
+    assert dj.dist_to(paths, '200-50') == pytest.approx(1.0)
+    assert dj.path_to(paths, '200-20')['elements'] == ['200-10', '200', '200-20']
+
+    # 100 -> 200 en la ruta 10, 200 -> 400 en la 20 y 400 -> 500 en la 30
+    assert logic.set_station(analyzer, '100-10')
+    assert dj.dist_to(analyzer['paths'], '500-30') == pytest.approx(1.5 + 2.0 + 0.5 + 2 * 1.0)
+
+    free = setup_tests()
+    logic.set_station(free, '200-10')
+    assert dj.dist_to(free['paths'], '200-20') == 0.0
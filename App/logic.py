@@ -30,13 +30,18 @@ import os
 
 data_dir = os.path.dirname(os.path.realpath('__file__')) + '/Data/'
 
+# Costo de cambiar de ruta en una misma estación, en las unidades de 'Distance'
+TRANSFER_PENALTY = 0.0
+
 
 # ___________________________________________________
 #  Importaciones
 # ___________________________________________________
 
 from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
 from DataStructures.Map import map_linear_probing as m
+from DataStructures.Lists import array_list as al
 from DataStructures.List import single_linked_list as lt
 """
 El controlador se encarga de mediar entre la vista y el modelo.
@@ -62,23 +67,25 @@ def init():
 def new_analyzer():
     """ Inicializa el analizador
 
-   stops: Tabla de hash para guardar los vertices del grafo
-   connections: Grafo para representar las rutas entre estaciones
-   components: Almacena la informacion de los componentes conectados
+   stops: Tabla de hash con las rutas servidas en cada estación
+   stations: Número de vértices de estación agregados para los
+           transbordos (ver add_route_connections)
+   connections: Grafo para representar las rutas entre estaciones; mantiene
+           sus componentes conectados (ver connected_components)
    paths: Estructura que almancena los caminos de costo minimo desde un
            vertice determinado a todos los otros vértices del grafo
     """
     try:
         analyzer = {
             'stops': None,
+            'stations': 0,
             'connections': None,
-            'components': None,
             'paths': None
         }
 
         analyzer['stops'] = m.new_map(num_elements=14000,load_factor=0.7,prime=109345121) 
 
-        analyzer['connections'] = gr.new_graph(size=14000,directed=False)
+        analyzer['connections'] = gr.new_graph(size=14000,directed=False,track_components=True)
         return analyzer
     except Exception as exp:
         return exp
@@ -89,14 +96,15 @@ def new_analyzer():
 # ___________________________________________________
 
 
-def load_services(analyzer, servicesfile):
+def load_services(analyzer, servicesfile, transfer_penalty=TRANSFER_PENALTY):
     """
     Carga los datos de los archivos CSV en el modelo.
     Se crea un arco entre cada par de estaciones que
     pertenecen al mismo servicio y van en el mismo sentido.
 
-    addRouteConnection crea conexiones entre diferentes rutas
-    servidas en una misma estación.
+    Al terminar la carga, add_route_connections crea conexiones
+    entre diferentes rutas servidas en una misma estación, con
+    costo transfer_penalty por cada cambio de ruta.
     """
     servicesfile = data_dir + servicesfile
     input_file = csv.DictReader(open(servicesfile, encoding="utf-8"),
@@ -110,7 +118,7 @@ def load_services(analyzer, servicesfile):
             if sameservice and samedirection and not samebusStop:
                 add_stop_connection(analyzer, lastservice, service)
         lastservice = service
-  
+    add_route_connections(analyzer, transfer_penalty)
     return analyzer
 
 def set_station(analyzer, station):
@@ -119,10 +127,8 @@ def set_station(analyzer, station):
     """
     try:
         station = str(station)
-        vertex = gr.get_vertex(analyzer['connections'], station)
-        if vertex is not None:
-            analyzer['components'] = gr.connected_components(analyzer['connections'])
-            analyzer['paths'] = gr.dijkstra(analyzer['connections'], vertex)
+        if gr.vertex_id(analyzer['connections'], station) is not None:
+            analyzer['paths'] = dj.dijkstra(analyzer['connections'], station)
             return True
         else:
             return False
@@ -135,9 +141,17 @@ def set_station(analyzer, station):
 
 def total_stops(analyzer):
     """
-    Total de paradas de autobus
+    Total de paradas de autobus, contadas como parejas estación-ruta
+    (sin los vértices de estación de los transbordos)
+    """
+    return gr.num_vertices(analyzer['connections']) - analyzer['stations']
+
+
+def total_stations(analyzer):
+    """
+    Total de estaciones con vértice de transbordo
     """
-    return gr.num_vertices(analyzer['connections'])
+    return analyzer['stations']
      
 
 def total_connections(analyzer):
@@ -145,6 +159,20 @@ def total_connections(analyzer):
     Total de enlaces entre las paradas
     """
     return gr.num_edges(analyzer['connections'])
+
+
+def connected_components(analyzer):
+    """
+    Número de componentes conectados de la red de paradas
+    """
+    return gr.num_components(analyzer['connections'])
+
+
+def same_component(analyzer, station_a, station_b):
+    """
+    Indica si hay una ruta entre dos estaciones
+    """
+    return gr.same_component(analyzer['connections'], station_a, station_b)
      
 
 
@@ -218,19 +246,58 @@ def add_route_stop(analyzer, service):
         lt.add_last(lstroutes, service['ServiceNo'])
         m.put(analyzer['stops'], service['BusStopCode'], lstroutes)
     else:
-        lstroutes = lstroutes['value']
         info = service['ServiceNo']
-        if not lt.is_present(lstroutes, info):
+        if lt.is_present(lstroutes, info, lt.defaultfunction) == -1:
             lt.add_last(lstroutes, info)
     return analyzer
 
 
+def add_route_connections(analyzer, transfer_penalty=TRANSFER_PENALTY):
+    """
+    Crea los arcos de transbordo entre las rutas servidas en una
+    misma estación, a partir del índice 'stops' ya cargado.
+
+    Por cada estación se agrega un vértice con su código (por
+    ejemplo 75009) unido a cada vértice estación-ruta (75009-10,
+    75009-101, ...) con un arco de peso transfer_penalty / 2.
+    Cambiar de ruta cuesta así transfer_penalty, y el número de
+    arcos crece con el número de rutas de la estación y no con
+    su cuadrado. El vértice de la estación sirve además como
+    origen en set_station para consultar desde cualquier ruta;
+    esas distancias incluyen transfer_penalty / 2 al salir de la
+    estación y otro tanto al llegar a un vértice de estación.
+
+    Los arcos se agregan juntos y, si había caminos calculados,
+    se recalculan una sola vez al final.
+    """
+    connections = analyzer['connections']
+    stops = m.key_set(analyzer['stops'])
+    weight = transfer_penalty / 2
+    for i in range(al.size(stops)):
+        stop = al.get_element(stops, i)
+        lstroutes = m.get(analyzer['stops'], stop)
+        if gr.vertex_id(connections, stop) is None:
+            add_stop(analyzer, stop)
+            analyzer['stations'] += 1
+        for j in range(lt.size(lstroutes)):
+            route = stop_route_vertex(stop, lt.get_element(lstroutes, j))
+            gr.add_edge(connections, stop, route, weight)
+    if analyzer['paths'] is not None:
+        analyzer['paths'] = dj.dijkstra(connections, analyzer['paths']['source'])
+    return analyzer
+
+
 def add_connection(analyzer, origin, destination, distance):
     """
     Adiciona un arco entre dos estaciones
+
+    Si ya hay caminos calculados desde una estación base (``set_station``),
+    se reparan localmente con el nuevo arco en lugar de quedar desactualizados.
     """
-   
-    gr.add_edge(analyzer['connections'], origin, destination, distance)
+    if analyzer['paths'] is not None:
+        dj.add_edge(analyzer['paths'], origin, destination, distance)
+    else:
+        gr.add_edge(analyzer['connections'], origin, destination, distance)
  
 
 
@@ -255,8 +322,14 @@ def format_vertex(service):
     Se formatea el nombrer del vertice con el id de la estación
     seguido de la ruta.
     """
-    name = service['BusStopCode'] + '-'
-    name = name + service['ServiceNo']
-    return name
+    return stop_route_vertex(service['BusStopCode'], service['ServiceNo'])
+
+
+def stop_route_vertex(stop, route):
+    """
+    Retorna el nombre del vértice de la ruta route en la
+    estación stop, por ejemplo 75009-10.
+    """
+    return stop + '-' + route
 
 
@@ -26,7 +26,6 @@
 
 
 import sys
-import threading
 from App import logic
 
 """
@@ -64,9 +63,10 @@ def option_two(cont):
     logic.load_services(cont, servicefile)
     numedges = logic.total_connections(cont)
     numvertex = logic.total_stops(cont)
-    print('Numero de vertices: ' + str(numvertex))
+    numstations = logic.total_stations(cont)
+    print('Numero de paradas (estacion-ruta): ' + str(numvertex))
+    print('Numero de estaciones de transbordo: ' + str(numstations))
     print('Numero de arcos: ' + str(numedges))
-    print('El limite de recursion actual: ' + str(sys.getrecursionlimit()))
 
 
 """
@@ -94,7 +94,4 @@ def main():
 
 
 if __name__ == "__main__":
-    threading.stack_size(67108864)  # 64MB stack
-    sys.setrecursionlimit(2 ** 20)
-    thread = threading.Thread(target=main)
-    thread.start()
+    main()
@@ -0,0 +1,112 @@
+"""
+Compara el número de vértices cerrados y la latencia mediana de consultas de
+un vértice a otro entre Dijkstra (A* sin heurística, que se detiene al cerrar
+el destino) y A* con la distancia de círculo máximo como heurística.
+
+La heurística necesita la latitud y longitud de cada parada en la información
+del vértice. Si el archivo ``Data/bus_routes_14000.csv`` existe y sus
+vértices traen coordenadas se usa la red de buses; si no, una red sintética de
+paradas alrededor de Singapur con arcos cuyo peso (en km) es la distancia en
+línea recta multiplicada por un factor de desvío mayor o igual a 1.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_astar [num_consultas]
+"""
+
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import astar
+from DataStructures.Lists import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+
+servicefile = 'bus_routes_14000.csv'
+
+
+def get_time():
+    """
+    devuelve el instante tiempo de procesamiento en milisegundos
+    """
+    return float(time.perf_counter()*1000)
+
+
+def build_network(side):
+    """
+    Crea una red no dirigida de ``side`` x ``side`` paradas con coordenadas
+    """
+    rnd = random.Random(1225)
+    heuristic = astar.great_circle()
+    graph = gr.new_graph(side * side, directed=False)
+    for row in range(side):
+        for col in range(side):
+            gr.insert_vertex(graph, row * side + col,
+                             {'latitude': 1.25 + row * 0.002 + rnd.uniform(-0.0005, 0.0005),
+                              'longitude': 103.65 + col * 0.002 + rnd.uniform(-0.0005, 0.0005)})
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            for w in (v + 1 if col + 1 < side else None, v + side if row + 1 < side else None):
+                if w is not None:
+                    straight = heuristic(mp.get(graph['information'], v),
+                                         mp.get(graph['information'], w))
+                    gr.add_edge(graph, v, w, straight * rnd.uniform(1.0, 1.6))
+    return graph
+
+
+def has_coordinates(graph):
+    keys = gr.vertices(graph)
+    if lt.size(keys) == 0:
+        return False
+    info = mp.get(graph['information'], lt.get_element(keys, 0))
+    return isinstance(info, dict) and 'latitude' in info and 'longitude' in info
+
+
+def load_graph():
+    if os.path.exists(os.path.join('Data', servicefile)):
+        from App import logic
+        analyzer = logic.init()
+        logic.load_services(analyzer, servicefile)
+        if has_coordinates(analyzer['connections']):
+            return analyzer['connections']
+        print('la red de buses no tiene coordenadas, se usa la red sintetica')
+    return build_network(120)
+
+
+def run(num_queries):
+    graph = load_graph()
+    heuristic = astar.great_circle()
+    keys = gr.vertices(graph)
+    rnd = random.Random(10)
+    pairs = []
+    for i in range(num_queries):
+        pairs.append((lt.get_element(keys, rnd.randrange(lt.size(keys))),
+                      lt.get_element(keys, rnd.randrange(lt.size(keys)))))
+
+    settled = {'dijkstra': [], 'astar': []}
+    times = {'dijkstra': [], 'astar': []}
+    for source, target in pairs:
+        results = {}
+        for name, function in (('dijkstra', None), ('astar', heuristic)):
+            start = get_time()
+            results[name] = astar.astar(graph, source, target, function)
+            times[name].append(get_time() - start)
+            settled[name].append(results[name]['settled'])
+        assert math.isclose(results['dijkstra']['distance'], results['astar']['distance'])
+
+    print('vertices: {}  arcos: {}  consultas: {}'.format(
+        gr.num_vertices(graph), gr.num_edges(graph), num_queries))
+    for name in ('dijkstra', 'astar'):
+        print('{:9s} cerrados (mediana): {:8.0f}   tiempo (mediana): {:8.2f} ms'.format(
+            name, statistics.median(settled[name]), statistics.median(times[name])))
+    print('reduccion de vertices cerrados: {:5.1f}%'.format(
+        100 * (1 - sum(settled['astar']) / max(sum(settled['dijkstra']), 1))))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,74 @@
+"""
+Mide el preprocesamiento de ``contraction_hierarchy`` y compara la latencia
+mediana de consultas de un vértice a otro contra ``bidirectional_dijkstra``.
+
+Usa el mismo grafo de ``bench_point_to_point``: la red de buses si el archivo
+``Data/bus_routes_14000.csv`` existe, o una malla de 120 x 120 vértices.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_contraction_hierarchy [num_consultas]
+"""
+
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import contraction_hierarchy as ch
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+from Benchmarks.bench_point_to_point import get_time, load_graph, measure
+
+
+def run(num_queries):
+    graph = load_graph()
+    start = get_time()
+    hierarchy = ch.build_hierarchy(graph)
+    build_ms = get_time() - start
+
+    filename = os.path.join(tempfile.mkdtemp(), 'hierarchy.ch')
+    ch.save(hierarchy, filename)
+    start = get_time()
+    hierarchy = ch.load(filename)
+    load_ms = get_time() - start
+
+    keys = gr.vertices(graph)
+    rnd = random.Random(10)
+    pairs = []
+    for i in range(num_queries):
+        pairs.append((lt.get_element(keys, rnd.randrange(lt.size(keys))),
+                      lt.get_element(keys, rnd.randrange(lt.size(keys)))))
+
+    def bidirectional(source, target):
+        return dj.bidirectional_dijkstra(graph, source, target)['distance']
+
+    def ch_distance(source, target):
+        return ch.distance(hierarchy, source, target)
+
+    def ch_path(source, target):
+        return ch.shortest_path(hierarchy, source, target)['distance']
+
+    for source, target in pairs:
+        expected = bidirectional(source, target)
+        assert math.isclose(ch_distance(source, target), expected)
+        assert math.isclose(ch_path(source, target), expected)
+    bidirectional_ms = measure(bidirectional, pairs)
+    distance_ms = measure(ch_distance, pairs)
+    path_ms = measure(ch_path, pairs)
+    print('vertices: {}  arcos: {}  atajos: {}  consultas: {}'.format(
+        gr.num_vertices(graph), gr.num_edges(graph), ch.num_shortcuts(hierarchy), num_queries))
+    print('preprocesamiento:         {:8.0f} ms'.format(build_ms))
+    print('carga desde archivo:      {:8.0f} ms ({} KB)'.format(
+        load_ms, os.path.getsize(filename) // 1024))
+    print('mediana bidireccional:    {:8.2f} ms'.format(bidirectional_ms))
+    print('mediana ch (distancia):   {:8.2f} ms'.format(distance_ms))
+    print('mediana ch (camino):      {:8.2f} ms'.format(path_ms))
+    print('aceleracion (distancia):  {:8.1f}x'.format(bidirectional_ms / distance_ms))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,48 @@
+"""
+Mide la latencia mediana de ``k_shortest_paths`` (Yen) entre pares de
+vértices al azar para varios valores de ``k``.
+
+Usa el mismo grafo de ``bench_point_to_point``: la red de buses si el archivo
+``Data/bus_routes_14000.csv`` existe, o una malla de 120 x 120 vértices.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_k_shortest_paths [num_consultas]
+"""
+
+import math
+import random
+import sys
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Graph import k_shortest_paths as ksp
+from DataStructures.Lists import array_list as lt
+from Benchmarks.bench_point_to_point import load_graph, measure
+
+
+def run(num_queries):
+    graph = load_graph()
+    keys = gr.vertices(graph)
+    rnd = random.Random(10)
+    pairs = []
+    for i in range(num_queries):
+        pairs.append((lt.get_element(keys, rnd.randrange(lt.size(keys))),
+                      lt.get_element(keys, rnd.randrange(lt.size(keys)))))
+
+    for source, target in pairs:
+        paths = ksp.k_shortest_paths(graph, source, target, 20)
+        expected = dj.bidirectional_dijkstra(graph, source, target)['distance']
+        if lt.size(paths) > 0:
+            assert math.isclose(lt.get_element(paths, 0)['distance'], expected)
+
+    print('vertices: {}  arcos: {}  consultas: {}'.format(
+        gr.num_vertices(graph), gr.num_edges(graph), num_queries))
+    for k in (1, 5, 20):
+        def yen(source, target):
+            return ksp.k_shortest_paths(graph, source, target, k)
+        print('mediana k = {:2d}:           {:8.2f} ms'.format(k, measure(yen, pairs)))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,59 @@
+"""
+Mide la escalabilidad de ``array_list.parallel_merge_sort`` al ordenar una
+lista grande de arcos por peso con distinto número de procesos.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_parallel_merge_sort [num_elementos]
+"""
+
+import os
+import random
+import sys
+import time
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import edge as e
+
+
+def get_time():
+    """
+    devuelve el instante tiempo de procesamiento en milisegundos
+    """
+    return float(time.perf_counter()*1000)
+
+
+def build_edges(num_elements):
+    """
+    Crea una array_list con ``num_elements`` arcos de peso aleatorio
+    """
+    rnd = random.Random(1225)
+    edges = lt.new_list()
+    for i in range(num_elements):
+        lt.add_last(edges, e.new_edge(i, i + 1, rnd.random() * 1000))
+    return edges
+
+
+def run(num_elements):
+    edges = build_edges(num_elements)
+    key = e.weight
+    max_processes = os.cpu_count() or 1
+    processes = 1
+    base = None
+    print('elementos: ' + str(num_elements) + '  cpus: ' + str(max_processes))
+    print('procesos   tiempo (ms)   aceleracion')
+    while processes <= max_processes:
+        work = lt.new_list()
+        work['elements'] = list(edges['elements'])
+        work['size'] = edges['size']
+        start = get_time()
+        lt.parallel_merge_sort(work, key=key, processes=processes)
+        elapsed = get_time() - start
+        if base is None:
+            base = elapsed
+        print('{:>8} {:>13.1f} {:>13.2f}'.format(processes, elapsed, base / elapsed))
+        processes *= 2
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000000)
@@ -0,0 +1,97 @@
+"""
+Compara la latencia mediana de consultas de un vértice a otro usando el
+árbol completo de ``dijkstra`` contra ``bidirectional_dijkstra``.
+
+Si el archivo ``Data/bus_routes_14000.csv`` existe se usa la red de buses;
+si no, una malla de 120 x 120 vértices con pesos aleatorios.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_point_to_point [num_consultas]
+"""
+
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+
+servicefile = 'bus_routes_14000.csv'
+
+
+def get_time():
+    """
+    devuelve el instante tiempo de procesamiento en milisegundos
+    """
+    return float(time.perf_counter()*1000)
+
+
+def build_grid(side):
+    """
+    Crea una malla no dirigida de ``side`` x ``side`` vértices
+    """
+    rnd = random.Random(1225)
+    graph = gr.new_graph(side * side, directed=False)
+    for i in range(side * side):
+        gr.insert_vertex(graph, i, None)
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            if col + 1 < side:
+                gr.add_edge(graph, v, v + 1, rnd.uniform(1, 10))
+            if row + 1 < side:
+                gr.add_edge(graph, v, v + side, rnd.uniform(1, 10))
+    return graph
+
+
+def load_graph():
+    if os.path.exists(os.path.join('Data', servicefile)):
+        from App import logic
+        analyzer = logic.init()
+        logic.load_services(analyzer, servicefile)
+        return analyzer['connections']
+    return build_grid(120)
+
+
+def measure(function, pairs):
+    times = []
+    for source, target in pairs:
+        start = get_time()
+        function(source, target)
+        times.append(get_time() - start)
+    return statistics.median(times)
+
+
+def run(num_queries):
+    graph = load_graph()
+    keys = gr.vertices(graph)
+    rnd = random.Random(10)
+    pairs = []
+    for i in range(num_queries):
+        pairs.append((lt.get_element(keys, rnd.randrange(lt.size(keys))),
+                      lt.get_element(keys, rnd.randrange(lt.size(keys)))))
+
+    def full_tree(source, target):
+        return dj.dist_to(dj.dijkstra(graph, source), target)
+
+    def bidirectional(source, target):
+        return dj.bidirectional_dijkstra(graph, source, target)['distance']
+
+    for source, target in pairs:
+        assert math.isclose(full_tree(source, target), bidirectional(source, target))
+    full_ms = measure(full_tree, pairs)
+    bidirectional_ms = measure(bidirectional, pairs)
+    print('vertices: {}  arcos: {}  consultas: {}'.format(
+        gr.num_vertices(graph), gr.num_edges(graph), num_queries))
+    print('mediana arbol completo:   {:8.2f} ms'.format(full_ms))
+    print('mediana bidireccional:    {:8.2f} ms'.format(bidirectional_ms))
+    print('aceleracion:              {:8.1f}x'.format(full_ms / bidirectional_ms))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
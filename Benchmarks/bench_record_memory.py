@@ -0,0 +1,86 @@
+"""
+Compara la memoria de los registros con ``__slots__`` (arcos, entradas de
+mapa y nodos de lista) contra los diccionarios que se usaban antes.
+
+Si el archivo ``Data/bus_routes_14000.csv`` existe, además se carga completo
+con ``App.logic`` y se estima el ahorro total sobre esa carga.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m Benchmarks.bench_record_memory
+"""
+
+import os
+import tracemalloc
+
+from DataStructures.Graph import edge as e
+from DataStructures.Map import map_entry as me
+from DataStructures.Lists import list_node as node
+
+servicefile = 'bus_routes_14000.csv'
+num_records = 100000
+
+
+def record_cost(factory):
+    """
+    Bytes por registro al crear ``num_records`` registros con ``factory``
+    """
+    tracemalloc.start()
+    records = [factory(i) for i in range(num_records)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Se descuenta la lista que guarda los registros
+    return (used - 8 * len(records)) / num_records
+
+
+def compare_records():
+    kinds = {
+        'edge': (lambda i: {"vertex_a": i, "vertex_b": i, "weight": 0.0},
+                 lambda i: e.new_edge(i, i, 0.0)),
+        'map_entry': (lambda i: {'key': i, 'value': i},
+                      lambda i: me.new_map_entry(i, i)),
+        'single_node': (lambda i: {'info': i, 'next': None},
+                        lambda i: node.new_single_node(i)),
+    }
+    costs = {}
+    print('registro        dict (B)   slots (B)   reduccion')
+    for name, (as_dict, as_slots) in kinds.items():
+        dict_cost = record_cost(as_dict)
+        slots_cost = record_cost(as_slots)
+        costs[name] = dict_cost - slots_cost
+        print('{:<12} {:>11.1f} {:>11.1f} {:>10.0%}'.format(
+            name, dict_cost, slots_cost, 1 - slots_cost / dict_cost))
+    return costs
+
+
+def full_load(costs):
+    from App import logic
+    from DataStructures.Graph import adj_list_graph as gr
+    from DataStructures.Map import map_linear_probing as m
+
+    tracemalloc.start()
+    analyzer = logic.init()
+    logic.load_services(analyzer, servicefile)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    graph = analyzer['connections']
+    num_edges = gr.num_edges(graph) * (1 if graph['directed'] else 2)
+    num_entries = 2 * gr.num_vertices(graph) + m.size(analyzer['stops'])
+    num_nodes = 0
+    routes = m.value_set(analyzer['stops'])
+    for i in range(routes['size']):
+        num_nodes += routes['elements'][i]['size']
+    saved = (num_edges * costs['edge'] + num_entries * costs['map_entry'] +
+             num_nodes * costs['single_node'])
+    print('\nCarga completa de ' + servicefile)
+    print('arcos: {}  entradas de mapa: {}  nodos: {}'.format(num_edges, num_entries, num_nodes))
+    print('memoria de la carga: {:.1f} MB'.format(used / 2**20))
+    print('ahorro estimado frente a diccionarios: {:.1f} MB ({:.0%})'.format(
+        saved / 2**20, saved / (used + saved)))
+
+
+if __name__ == '__main__':
+    costs = compare_records()
+    if os.path.exists(os.path.join('Data', servicefile)):
+        full_load(costs)
@@ -0,0 +1,21 @@
+import random
+
+from DataStructures.Graph import adj_list_graph as gl
+
+
+def random_graph(num_vertex, num_edges, directed=True, seed=0, max_weight=9,
+                 prefix=None, self_loops=True):
+    # Grafo aleatorio reproducible: vértices 0 .. num_vertex - 1 (o prefix + número)
+    # con num_edges arcos al azar de peso entero entre 1 y max_weight
+    rnd = random.Random(seed)
+    graph = gl.new_graph(num_vertex, directed)
+    keys = [v if prefix is None else prefix + str(v) for v in range(num_vertex)]
+    for v in range(num_vertex):
+        gl.insert_vertex(graph, keys[v], v)
+    for i in range(num_edges):
+        a = rnd.randrange(num_vertex)
+        b = rnd.randrange(num_vertex)
+        weight = rnd.randint(1, max_weight)
+        if self_loops or a != b:
+            gl.add_edge(graph, keys[a], keys[b], weight)
+    return graph
@@ -137,3 +137,120 @@ def test_add_edge():
     gl.add_edge(some_graph, 1, 3, 3.0)
 
     assert gl.num_edges(some_graph) == 2
+
+
+@handle_not_implemented
+def test_vertex_index():
+    graph = gl.new_graph(10, False)
+    gl.insert_vertex(graph, "75009-10", None)
+    gl.insert_vertex(graph, "75019-10", None)
+    gl.insert_vertex(graph, "75029-10", None)
+    gl.add_edge(graph, "75009-10", "75019-10", 1.5)
+    gl.add_edge(graph, "75019-10", "75029-10", 2.5)
+
+    id_a = gl.vertex_id(graph, "75009-10")
+    id_b = gl.vertex_id(graph, "75019-10")
+    id_c = gl.vertex_id(graph, "75029-10")
+    assert sorted([id_a, id_b, id_c]) == [0, 1, 2]
+    assert gl.vertex_id(graph, "no existe") is None
+    assert gl.vertex_key(graph, id_b) == "75019-10"
+
+    assert list(gl.adjacent_ids(graph, id_b)["elements"]) == [id_a, id_c]
+    assert list(gl.adjacent_weights(graph, id_b)["elements"]) == [1.5, 2.5]
+
+    # Reemplazar un arco actualiza ambos sentidos sin duplicarlo
+    gl.add_edge(graph, "75019-10", "75009-10", 4.0)
+    assert gl.num_edges(graph) == 2
+    assert list(gl.adjacent_weights(graph, id_a)["elements"]) == [4.0]
+    assert list(gl.adjacent_weights(graph, id_b)["elements"]) == [4.0, 2.5]
+
+
+@handle_not_implemented
+def test_vertex_index_rebuild():
+    empty_graph, some_graph = setup_tests()
+
+    # some_graph se construye sin pasar por insert_vertex
+    id_1 = gl.vertex_id(some_graph, 1)
+    id_2 = gl.vertex_id(some_graph, 2)
+    assert list(gl.adjacent_ids(some_graph, id_1)["elements"]) == [id_2]
+    assert list(gl.adjacent_weights(some_graph, id_2)["elements"]) == [3.0]
+
+
+@handle_not_implemented
+def test_vertex_index_keeps_ids():
+    empty_graph, some_graph = setup_tests()
+
+    gl.track_components(some_graph)
+    id_1 = gl.vertex_id(some_graph, 1)
+    id_2 = gl.vertex_id(some_graph, 2)
+    components = some_graph["components"]
+
+    # Un vértice escrito directamente en el mapa recibe el siguiente identificador
+    # sin renumerar los anteriores ni reemplazar los componentes
+    edges_3 = lt.new_list()
+    lt.add_last(edges_3, edge.new_edge(3, 1, 1.0))
+    mp.put(some_graph["vertices"], 3, edges_3)
+    id_3 = gl.vertex_id(some_graph, 3)
+    assert gl.vertex_id(some_graph, 1) == id_1
+    assert gl.vertex_id(some_graph, 2) == id_2
+    assert id_3 == 2
+    assert list(gl.adjacent_ids(some_graph, id_3)["elements"]) == [id_1]
+    assert some_graph["components"] is components
+    assert gl.same_component(some_graph, 3, 2)
+
+    gl.insert_vertex(some_graph, 4, None)
+    assert gl.vertex_id(some_graph, 4) == 3
+    assert gl.vertex_id(some_graph, 1) == id_1
+
+
+@handle_not_implemented
+def test_csr_arrays():
+    empty_graph, some_graph = setup_tests()
+
+    csr = gl.csr_arrays(empty_graph)
+    assert list(csr["offsets"]) == [0]
+    assert len(csr["targets"]) == 0
+
+    csr = gl.csr_arrays(some_graph)
+    id_1 = gl.vertex_id(some_graph, 1)
+    id_2 = gl.vertex_id(some_graph, 2)
+    assert list(csr["offsets"]) == [0, 1, 2]
+    start = csr["offsets"][id_1]
+    assert csr["targets"][start] == id_2
+    assert csr["weights"][start] == 3.0
+
+
+@handle_not_implemented
+def test_track_components():
+    graph = gl.new_graph(10, False, track_components=True)
+    for vertex in ["A", "B", "C", "D"]:
+        gl.insert_vertex(graph, vertex, None)
+    assert gl.num_components(graph) == 4
+
+    gl.add_edge(graph, "A", "B", 1.0)
+    gl.add_edge(graph, "C", "D", 1.0)
+    assert gl.num_components(graph) == 2
+    assert gl.same_component(graph, "A", "B")
+    assert not gl.same_component(graph, "A", "D")
+    assert not gl.same_component(graph, "A", "Z")
+
+    gl.add_edge(graph, "B", "C", 1.0)
+    gl.insert_vertex(graph, "E", None)
+    assert gl.num_components(graph) == 2
+    assert gl.same_component(graph, "A", "D")
+
+
+@handle_not_implemented
+def test_components_on_demand():
+    empty_graph, some_graph = setup_tests()
+
+    # some_graph se construye sin pasar por insert_vertex ni add_edge
+    assert some_graph["components"] is None
+    assert gl.num_components(some_graph) == 1
+    assert gl.same_component(some_graph, 1, 2)
+
+    gl.insert_vertex(some_graph, 3, {"name": "C"})
+    assert gl.num_components(some_graph) == 2
+    gl.add_edge(some_graph, 3, 1, 2.0)
+    assert gl.num_components(some_graph) == 1
+    assert gl.num_components(empty_graph) == 0
@@ -0,0 +1,67 @@
+import math
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import astar
+from DataStructures.Graph import dijkstra as dj
+
+
+def setup_tests(side=10):
+    # Malla de paradas separadas 0.01 grados; el peso es la distancia real
+    # más un recargo, por lo que la distancia en línea recta es admisible
+    heuristic = astar.great_circle()
+    graph = gl.new_graph(side * side, False)
+    for row in range(side):
+        for col in range(side):
+            gl.insert_vertex(graph, (row, col),
+                             {"latitude": 1.30 + row * 0.01, "longitude": 103.80 + col * 0.01})
+    for row in range(side):
+        for col in range(side):
+            info = {"latitude": 1.30 + row * 0.01, "longitude": 103.80 + col * 0.01}
+            for d_row, d_col in ((0, 1), (1, 0)):
+                if row + d_row < side and col + d_col < side:
+                    other = {"latitude": 1.30 + (row + d_row) * 0.01,
+                             "longitude": 103.80 + (col + d_col) * 0.01}
+                    weight = heuristic(info, other) * (1 + ((row * 7 + col * 3) % 5) / 10)
+                    gl.add_edge(graph, (row, col), (row + d_row, col + d_col), weight)
+    return graph, heuristic
+
+
+@handle_not_implemented
+def test_great_circle():
+    heuristic = astar.great_circle()
+    a = {"latitude": 0.0, "longitude": 0.0}
+    b = {"latitude": 0.0, "longitude": 1.0}
+    assert math.isclose(heuristic(a, b), 2 * math.pi * astar.EARTH_RADIUS / 360)
+    assert heuristic(a, a) == 0.0
+    assert heuristic(a, None) == 0.0
+    assert heuristic(a, {"name": "sin coordenadas"}) == 0.0
+
+
+@handle_not_implemented
+def test_astar_matches_dijkstra():
+    graph, heuristic = setup_tests()
+
+    tree = dj.dijkstra(graph, (0, 0))
+    for target in [(9, 9), (3, 7), (0, 0), (5, 0)]:
+        result = astar.astar(graph, (0, 0), target, heuristic)
+        assert math.isclose(result["distance"], dj.dist_to(tree, target), abs_tol=1e-9)
+        assert result["path"]["elements"][0] == (0, 0)
+        assert result["path"]["elements"][-1] == target
+
+    plain = astar.astar(graph, (0, 0), (2, 2))
+    guided = astar.astar(graph, (0, 0), (2, 2), heuristic)
+    assert math.isclose(plain["distance"], guided["distance"])
+    assert guided["settled"] < plain["settled"]
+
+
+@handle_not_implemented
+def test_astar_no_path():
+    graph, heuristic = setup_tests(3)
+    gl.insert_vertex(graph, "aislado", None)
+
+    result = astar.astar(graph, (0, 0), "aislado", heuristic)
+    assert result["distance"] == math.inf
+    assert result["path"] is None
+    assert astar.astar(graph, (0, 0), "Z", heuristic) is None
@@ -0,0 +1,71 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import bellman_ford as bf
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(weight_5_4=0.35):
+    # Grafo tinyEWDn de Sedgewick; con 5->4 = -0.66 tiene el ciclo negativo 4->5->4
+    graph = gl.new_graph(8, True)
+    for v in range(8):
+        gl.insert_vertex(graph, v, None)
+    for a, b, weight in [(4, 5, 0.35), (5, 4, weight_5_4), (4, 7, 0.37), (5, 7, 0.28),
+                         (7, 5, 0.28), (5, 1, 0.32), (0, 4, 0.38), (0, 2, 0.26),
+                         (7, 3, 0.39), (1, 3, 0.29), (2, 7, 0.34), (6, 2, -1.20),
+                         (3, 6, 0.52), (6, 0, -1.40), (6, 4, -1.25)]:
+        gl.add_edge(graph, a, b, weight)
+    return graph
+
+
+@handle_not_implemented
+def test_negative_weights():
+    graph = setup_tests()
+    search = bf.bellman_ford(graph, 0)
+
+    assert not bf.has_negative_cycle(search)
+    assert bf.negative_cycle(search) is None
+    expected = [0.0, 0.93, 0.26, 0.99, 0.26, 0.61, 1.51, 0.60]
+    for v in range(8):
+        assert bf.has_path_to(search, v)
+        assert round(bf.dist_to(search, v), 2) == expected[v]
+    assert bf.path_to(search, 6)["elements"] == [0, 2, 7, 3, 6]
+    assert bf.path_to(search, 4)["elements"] == [0, 2, 7, 3, 6, 4]
+    # La estructura es intercambiable con la de dijkstra
+    assert dj.path_to(search, 4)["elements"] == [0, 2, 7, 3, 6, 4]
+    assert bf.bellman_ford(graph, "Z") is None
+
+
+@handle_not_implemented
+def test_negative_cycle():
+    graph = setup_tests(-0.66)
+    search = bf.bellman_ford(graph, 0)
+
+    assert bf.has_negative_cycle(search)
+    cycle = bf.negative_cycle(search)["elements"]
+    assert cycle[0] == cycle[-1]
+    assert sorted(cycle[:-1]) == [4, 5]
+    assert bf.path_to(search, 3) is None
+
+
+@handle_not_implemented
+def test_matches_dijkstra():
+    rnd = random.Random(21)
+    graph = gl.new_graph(50, True)
+    for v in range(50):
+        gl.insert_vertex(graph, v, None)
+    for i in range(200):
+        gl.add_edge(graph, rnd.randrange(50), rnd.randrange(50), rnd.randint(0, 20))
+    gl.insert_vertex(graph, "aislado", None)
+
+    expected = dj.dijkstra(graph, 0)
+    search = bf.bellman_ford(graph, 0)
+    assert not bf.has_negative_cycle(search)
+    for v in list(range(50)) + ["aislado"]:
+        assert bf.dist_to(search, v) == dj.dist_to(expected, v)
+        assert bf.has_path_to(search, v) == dj.has_path_to(expected, v)
+    assert bf.path_to(search, "aislado") is None
@@ -0,0 +1,71 @@
+import math
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import bfs
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(directed=False):
+    graph = gl.new_graph(10, directed)
+    for vertex in ["A", "B", "C", "D", "E", "F"]:
+        gl.insert_vertex(graph, vertex, None)
+    gl.add_edge(graph, "A", "B", 1.0)
+    gl.add_edge(graph, "B", "C", 1.0)
+    gl.add_edge(graph, "C", "D", 1.0)
+    gl.add_edge(graph, "A", "D", 10.0)
+    gl.add_edge(graph, "E", "F", 1.0)
+    return graph
+
+
+@handle_not_implemented
+def test_bfs():
+    graph = setup_tests()
+
+    search = bfs.bfs(graph, "A")
+
+    assert bfs.has_path_to(search, "A")
+    assert bfs.has_path_to(search, "D")
+    assert not bfs.has_path_to(search, "E")
+    assert not bfs.has_path_to(search, "Z")
+
+    assert bfs.dist_to(search, "A") == 0
+    assert bfs.dist_to(search, "C") == 2
+    assert bfs.dist_to(search, "D") == 1
+    assert bfs.dist_to(search, "F") == math.inf
+
+    path = bfs.path_to(search, "C")
+    assert lt.size(path) == 3
+    assert lt.first_element(path) == "A"
+    assert lt.last_element(path) == "C"
+    assert bfs.path_to(search, "F") is None
+
+
+@handle_not_implemented
+def test_bfs_directed():
+    graph = setup_tests(directed=True)
+
+    search = bfs.bfs(graph, "B")
+    assert bfs.has_path_to(search, "D")
+    assert not bfs.has_path_to(search, "A")
+    assert bfs.path_to(search, "D")["elements"] == ["B", "C", "D"]
+
+
+@handle_not_implemented
+def test_bfs_missing_source():
+    graph = setup_tests()
+    assert bfs.bfs(graph, "Z") is None
+
+
+@handle_not_implemented
+def test_bfs_long_path():
+    graph = gl.new_graph(5000, False)
+    for i in range(5000):
+        gl.insert_vertex(graph, i, None)
+    for i in range(4999):
+        gl.add_edge(graph, i, i + 1, 1.0)
+
+    search = bfs.bfs(graph, 0)
+    assert bfs.dist_to(search, 4999) == 4999
+    assert lt.size(bfs.path_to(search, 4999)) == 5000
@@ -0,0 +1,166 @@
+import math
+import sys
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph.Tests.graph_factory import random_graph
+from DataStructures.Graph import centrality as ct
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(num_vertex=30, num_edges=70, directed=True, seed=5):
+    return random_graph(num_vertex, num_edges, directed, seed, max_weight=4, self_loops=False)
+
+
+def shortest_counts(graph, weighted):
+    # Distancia y número de caminos mínimos entre todos los pares, por fuerza bruta
+    csr = gl.csr_arrays(graph)
+    n = len(csr["offsets"]) - 1
+    dist = [[math.inf] * n for i in range(n)]
+    sigma = [[0] * n for i in range(n)]
+    for s in range(n):
+        dist[s][s] = 0
+        sigma[s][s] = 1
+        changed = True
+        while changed:
+            changed = False
+            for v in range(n):
+                for i in range(csr["offsets"][v], csr["offsets"][v + 1]):
+                    w = csr["targets"][i]
+                    nd = dist[s][v] + (csr["weights"][i] if weighted else 1)
+                    if nd < dist[s][w]:
+                        dist[s][w] = nd
+                        changed = True
+        order = sorted(range(n), key=lambda v: dist[s][v])
+        for w in order:
+            if w == s or dist[s][w] == math.inf:
+                continue
+            for v in range(n):
+                for i in range(csr["offsets"][v], csr["offsets"][v + 1]):
+                    step = csr["weights"][i] if weighted else 1
+                    if csr["targets"][i] == w and dist[s][v] + step == dist[s][w]:
+                        sigma[s][w] += sigma[s][v]
+    return dist, sigma
+
+
+def brute_betweenness(graph, weighted):
+    dist, sigma = shortest_counts(graph, weighted)
+    n = len(dist)
+    scores = [0.0] * n
+    for s in range(n):
+        for t in range(n):
+            if s == t or sigma[s][t] == 0:
+                continue
+            for v in range(n):
+                if v != s and v != t and dist[s][v] + dist[v][t] == dist[s][t]:
+                    scores[v] += sigma[s][v] * sigma[v][t] / sigma[s][t]
+    if not graph["directed"]:
+        scores = [x / 2 for x in scores]
+    return scores
+
+
+@handle_not_implemented
+def test_degree_centrality():
+    graph = gl.new_graph(5, True)
+    for v in "ABCD":
+        gl.insert_vertex(graph, v, None)
+    gl.add_edge(graph, "A", "B", 1)
+    gl.add_edge(graph, "A", "C", 1)
+    gl.add_edge(graph, "C", "B", 1)
+
+    out = ct.degree_centrality(graph, normalized=False)
+    assert ct.score(out, "A") == 2 and ct.score(out, "B") == 0
+    inward = ct.degree_centrality(graph, "in", normalized=False)
+    assert ct.score(inward, "B") == 2 and ct.score(inward, "D") == 0
+    total = ct.degree_centrality(graph, "total")
+    assert ct.score(total, "C") == pytest.approx(2 / 3)
+    assert ct.score(total, "Z") is None
+    assert lt.get_element(ct.ranking(out, 1), 0) == "A"
+
+
+@handle_not_implemented
+def test_pagerank():
+    graph = setup_tests()
+    rank = ct.pagerank(graph)
+    assert sum(rank["scores"]) == pytest.approx(1.0)
+    assert all(x > 0 for x in rank["scores"])
+
+    # En un ciclo dirigido todos los vértices tienen el mismo puntaje
+    ring = gl.new_graph(4, True)
+    for v in range(4):
+        gl.insert_vertex(ring, v, None)
+    for v in range(4):
+        gl.add_edge(ring, v, (v + 1) % 4, 1)
+    assert list(ct.pagerank(ring)["scores"]) == pytest.approx([0.25] * 4)
+
+
+def test_pagerank_without_numpy(monkeypatch):
+    graph = setup_tests()
+    expected = ct.pagerank(graph, weighted=True)["scores"]
+    monkeypatch.setitem(sys.modules, "DataStructures.Graph.numpy_graph", None)
+    rank = ct.pagerank(graph, weighted=True)["scores"]
+    assert list(rank) == pytest.approx(list(expected), abs=1e-9)
+
+
+@handle_not_implemented
+def test_closeness_centrality():
+    # Camino A - B - C y un vértice aislado D
+    graph = gl.new_graph(5, False)
+    for v in "ABCD":
+        gl.insert_vertex(graph, v, None)
+    gl.add_edge(graph, "A", "B", 5)
+    gl.add_edge(graph, "B", "C", 5)
+
+    done = []
+    closeness = ct.closeness_centrality(graph, progress=lambda d, t: done.append((d, t)))
+    assert ct.score(closeness, "B") == pytest.approx(1.0 * 2 / 3)
+    assert ct.score(closeness, "A") == pytest.approx(2 / 3 * 2 / 3)
+    assert ct.score(closeness, "D") == 0.0
+    assert done[-1] == (4, 4)
+    assert lt.get_element(ct.ranking(closeness), 0) == "B"
+
+
+@handle_not_implemented
+def test_betweenness_centrality():
+    for directed in (True, False):
+        graph = setup_tests(directed=directed)
+        for weighted in (False, True):
+            scores = ct.betweenness_centrality(graph, weighted=weighted)["scores"]
+            assert list(scores) == pytest.approx(brute_betweenness(graph, weighted))
+
+    graph = gl.new_graph(5, False)
+    for v in "ABC":
+        gl.insert_vertex(graph, v, None)
+    gl.add_edge(graph, "A", "B", 1)
+    gl.add_edge(graph, "B", "C", 1)
+    normalized = ct.betweenness_centrality(graph, normalized=True)
+    assert ct.score(normalized, "B") == pytest.approx(1.0)
+
+
+@handle_not_implemented
+def test_betweenness_sampled():
+    graph = setup_tests(num_vertex=60, num_edges=200)
+    exact = ct.betweenness_centrality(graph)["scores"]
+    all_sources = ct.betweenness_centrality(graph, samples=60, seed=1)["scores"]
+    assert list(all_sources) == pytest.approx(list(exact))
+
+    done = []
+    sampled = ct.betweenness_centrality(graph, samples=30, seed=1,
+                                        progress=lambda d, t: done.append(d))
+    assert done[-1] == 30
+    # La muestra se escala por V / samples: el total estimado es del mismo orden
+    assert sum(sampled["scores"]) == pytest.approx(sum(exact), rel=0.5)
+
+
+def test_centrality_processes(monkeypatch):
+    graph = setup_tests(num_vertex=40, num_edges=120)
+    monkeypatch.setattr(ct, "PARALLEL_SOURCES_THRESHOLD", 2)
+    done = []
+    parallel = ct.betweenness_centrality(graph, weighted=True, processes=2,
+                                         progress=lambda d, t: done.append(d))
+    assert list(parallel["scores"]) == pytest.approx(list(ct.betweenness_centrality(graph, weighted=True)["scores"]))
+    assert sorted(done) == done and done[-1] == 40
+
+    closeness = ct.closeness_centrality(graph, processes=2)
+    assert list(closeness["scores"]) == list(ct.closeness_centrality(graph)["scores"])
@@ -0,0 +1,108 @@
+import math
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph.Tests.graph_factory import random_graph
+from DataStructures.Graph import contraction_hierarchy as ch
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(directed, num_vertex=60, num_edges=180, seed=7):
+    return random_graph(num_vertex, num_edges, directed, seed, max_weight=20, prefix="v")
+
+
+def path_cost(graph, path):
+    # Costo del camino usando el arco más liviano entre vértices consecutivos
+    cost = 0
+    elements = path["elements"]
+    for i in range(1, lt.size(path)):
+        a = gl.vertex_id(graph, elements[i - 1])
+        b = gl.vertex_id(graph, elements[i])
+        neighbors = gl.adjacent_ids(graph, a)["elements"]
+        weights = gl.adjacent_weights(graph, a)["elements"]
+        cost += min(weights[j] for j in range(len(neighbors)) if neighbors[j] == b)
+    return cost
+
+
+def check_matches_dijkstra(directed):
+    graph = setup_tests(directed)
+    hierarchy = ch.build_hierarchy(graph)
+
+    for source in ["v0", "v13", "v42"]:
+        tree = dj.dijkstra(graph, source)
+        for t in range(60):
+            target = "v" + str(t)
+            result = ch.shortest_path(hierarchy, source, target)
+            assert result["distance"] == dj.dist_to(tree, target)
+            assert ch.distance(hierarchy, source, target) == result["distance"]
+            if result["path"] is None:
+                assert not dj.has_path_to(tree, target)
+            else:
+                assert lt.first_element(result["path"]) == source
+                assert lt.last_element(result["path"]) == target
+                assert path_cost(graph, result["path"]) == result["distance"]
+
+
+@handle_not_implemented
+def test_matches_dijkstra_directed():
+    check_matches_dijkstra(True)
+
+
+@handle_not_implemented
+def test_matches_dijkstra_undirected():
+    check_matches_dijkstra(False)
+
+
+@handle_not_implemented
+def test_shortcuts_and_missing_vertices():
+    graph = gl.new_graph(5, True)
+    for key in "ABCDE":
+        gl.insert_vertex(graph, key, None)
+    gl.add_edge(graph, "A", "B", 1)
+    gl.add_edge(graph, "B", "C", 1)
+    gl.add_edge(graph, "C", "D", 1)
+    gl.add_edge(graph, "A", "D", 5)
+    hierarchy = ch.build_hierarchy(graph)
+
+    result = ch.shortest_path(hierarchy, "A", "D")
+    assert result["distance"] == 3
+    assert result["path"]["elements"] == ["A", "B", "C", "D"]
+    assert ch.shortest_path(hierarchy, "D", "A")["path"] is None
+    assert ch.distance(hierarchy, "E", "A") == math.inf
+    assert ch.distance(hierarchy, "A", "A") == 0
+    assert ch.distance(hierarchy, "A", "Z") is None
+    assert ch.shortest_path(hierarchy, "Z", "A") is None
+    assert ch.num_shortcuts(hierarchy) >= 0
+
+
+def test_save_and_load(tmp_path):
+    graph = setup_tests(False)
+    hierarchy = ch.build_hierarchy(graph)
+    filename = str(tmp_path / "hierarchy.ch")
+
+    ch.save(hierarchy, filename)
+    loaded = ch.load(filename)
+    assert ch.num_shortcuts(loaded) == ch.num_shortcuts(hierarchy)
+    for t in range(60):
+        target = "v" + str(t)
+        expected = ch.shortest_path(hierarchy, "v3", target)
+        result = ch.shortest_path(loaded, "v3", target)
+        assert result["distance"] == expected["distance"]
+        if expected["path"] is not None:
+            assert result["path"]["elements"] == expected["path"]["elements"]
+
+    # Un archivo de pickle, uno truncado o uno de otra versión no se cargan
+    with open(filename, "rb") as file:
+        data = file.read()
+    for content in (b"\x80\x04N.", data[:-5], data[:40], data.replace(b"ADJCH", b"ADJCX")):
+        with open(filename, "wb") as file:
+            file.write(content)
+        with pytest.raises(ValueError):
+            ch.load(filename)
+
+    graph = gl.new_graph(5, False)
+    gl.insert_vertex(graph, ("a", 1), None)
+    with pytest.raises(ValueError):
+        ch.save(ch.build_hierarchy(graph), filename)
@@ -0,0 +1,85 @@
+import sys
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import dfs
+from DataStructures.Graph import dfo
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(directed=False):
+    graph = gl.new_graph(10, directed)
+    for vertex in ["A", "B", "C", "D", "E", "F"]:
+        gl.insert_vertex(graph, vertex, None)
+    gl.add_edge(graph, "A", "B", 1.0)
+    gl.add_edge(graph, "B", "C", 1.0)
+    gl.add_edge(graph, "A", "D", 1.0)
+    gl.add_edge(graph, "D", "C", 1.0)
+    gl.add_edge(graph, "E", "F", 1.0)
+    return graph
+
+
+def position(my_list, element):
+    return my_list["elements"].index(element)
+
+
+@handle_not_implemented
+def test_dfs():
+    graph = setup_tests()
+
+    search = dfs.dfs(graph, "A")
+    assert dfs.has_path_to(search, "C")
+    assert not dfs.has_path_to(search, "E")
+    assert not dfs.has_path_to(search, "Z")
+
+    path = dfs.path_to(search, "D")
+    assert lt.first_element(path) == "A"
+    assert lt.last_element(path) == "D"
+    for i in range(lt.size(path) - 1):
+        a = lt.get_element(path, i)
+        b = lt.get_element(path, i + 1)
+        assert gl.find_adjacent_id(graph, gl.vertex_id(graph, a), gl.vertex_id(graph, b)) >= 0
+    assert dfs.path_to(search, "F") is None
+    assert dfs.dfs(graph, "Z") is None
+
+
+@handle_not_implemented
+def test_dfs_deep_graph_without_recursion():
+    graph = gl.new_graph(20000, True)
+    for i in range(20000):
+        gl.insert_vertex(graph, i, None)
+    for i in range(19999):
+        gl.add_edge(graph, i, i + 1, 1.0)
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(100)
+    try:
+        search = dfs.dfs(graph, 0)
+        order = dfo.depth_first_order(graph)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert dfs.has_path_to(search, 19999)
+    assert lt.size(dfs.path_to(search, 19999)) == 20000
+    assert order["reverse_post"]["elements"] == list(range(20000))
+
+
+@handle_not_implemented
+def test_depth_first_order():
+    graph = setup_tests(directed=True)
+
+    order = dfo.depth_first_order(graph)
+    pre = order["pre"]
+    post = order["post"]
+    reverse_post = order["reverse_post"]
+
+    assert lt.size(pre) == 6
+    assert lt.size(post) == 6
+    assert reverse_post["elements"] == list(reversed(post["elements"]))
+
+    # En un DAG el postorden inverso es un orden topológico
+    for a, b in [("A", "B"), ("B", "C"), ("A", "D"), ("D", "C"), ("E", "F")]:
+        assert position(reverse_post, a) < position(reverse_post, b)
+        assert position(post, b) < position(post, a)
+    # Cada vértice aparece en preorden antes que sus descendientes del recorrido
+    assert position(pre, "A") < position(pre, "C")
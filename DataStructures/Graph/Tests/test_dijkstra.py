@@ -0,0 +1,184 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(directed=False):
+    graph = gl.new_graph(10, directed)
+    for vertex in ["A", "B", "C", "D", "E", "F"]:
+        gl.insert_vertex(graph, vertex, None)
+    gl.add_edge(graph, "A", "B", 1.0)
+    gl.add_edge(graph, "B", "C", 2.0)
+    gl.add_edge(graph, "A", "C", 5.0)
+    gl.add_edge(graph, "C", "D", 1.0)
+    gl.add_edge(graph, "B", "D", 4.0)
+    gl.add_edge(graph, "E", "F", 1.0)
+    return graph
+
+
+@handle_not_implemented
+def test_dijkstra():
+    graph = setup_tests()
+
+    search = dj.dijkstra(graph, "A")
+    assert dj.dist_to(search, "A") == 0.0
+    assert dj.dist_to(search, "C") == 3.0
+    assert dj.dist_to(search, "D") == 4.0
+    assert dj.dist_to(search, "E") == math.inf
+    assert dj.has_path_to(search, "D")
+    assert not dj.has_path_to(search, "F")
+    assert dj.path_to(search, "D")["elements"] == ["A", "B", "C", "D"]
+    assert dj.path_to(search, "F") is None
+    assert dj.dijkstra(graph, "Z") is None
+
+
+@handle_not_implemented
+def test_bidirectional_dijkstra():
+    graph = setup_tests()
+
+    result = dj.bidirectional_dijkstra(graph, "A", "D")
+    assert result["distance"] == 4.0
+    assert result["path"]["elements"] == ["A", "B", "C", "D"]
+
+    result = dj.bidirectional_dijkstra(graph, "D", "A")
+    assert result["distance"] == 4.0
+    assert result["path"]["elements"] == ["D", "C", "B", "A"]
+
+    result = dj.bidirectional_dijkstra(graph, "A", "A")
+    assert result["distance"] == 0.0
+    assert result["path"]["elements"] == ["A"]
+
+    result = dj.bidirectional_dijkstra(graph, "A", "F")
+    assert result["distance"] == math.inf
+    assert result["path"] is None
+
+    assert dj.bidirectional_dijkstra(graph, "A", "Z") is None
+
+
+@handle_not_implemented
+def test_bidirectional_dijkstra_directed():
+    graph = setup_tests(directed=True)
+
+    result = dj.bidirectional_dijkstra(graph, "A", "D")
+    assert result["distance"] == 4.0
+    assert result["path"]["elements"] == ["A", "B", "C", "D"]
+
+    assert dj.bidirectional_dijkstra(graph, "D", "A")["distance"] == math.inf
+
+    # Agregar un arco invalida el índice de arcos de entrada
+    gl.add_edge(graph, "D", "A", 1.0)
+    assert dj.bidirectional_dijkstra(graph, "D", "A")["distance"] == 1.0
+
+
+@handle_not_implemented
+def test_bidirectional_matches_dijkstra():
+    graph = gl.new_graph(200, True)
+    for i in range(200):
+        gl.insert_vertex(graph, i, None)
+    for i in range(200):
+        for step in (1, 7, 31):
+            gl.add_edge(graph, i, (i * 3 + step) % 200, float((i * step) % 13 + 1))
+
+    for source in (0, 17, 99):
+        tree = dj.dijkstra(graph, source)
+        for target in range(0, 200, 11):
+            result = dj.bidirectional_dijkstra(graph, source, target)
+            assert result["distance"] == dj.dist_to(tree, target)
+            path = result["path"]
+            total = 0.0
+            for i in range(lt.size(path) - 1):
+                a = gl.vertex_id(graph, lt.get_element(path, i))
+                b = gl.vertex_id(graph, lt.get_element(path, i + 1))
+                pos = gl.find_adjacent_id(graph, a, b)
+                total += gl.adjacent_weights(graph, a)["elements"][pos]
+            assert total == result["distance"]
+
+
+@handle_not_implemented
+def test_add_edge_repairs_search():
+    graph = setup_tests()
+    search = dj.dijkstra(graph, "A")
+
+    # Un arco nuevo que acorta el camino a D y conecta E y F
+    dj.add_edge(search, "A", "D", 2.0)
+    assert dj.dist_to(search, "D") == 2.0
+    assert dj.path_to(search, "D")["elements"] == ["A", "D"]
+    dj.add_edge(search, "D", "E", 1.0)
+    assert dj.dist_to(search, "F") == 4.0
+    assert dj.path_to(search, "F")["elements"] == ["A", "D", "E", "F"]
+
+    # Un vértice agregado después de la búsqueda
+    gl.insert_vertex(graph, "G", None)
+    assert not dj.has_path_to(search, "G")
+    dj.add_edge(search, "G", "F", 0.5)
+    assert dj.dist_to(search, "G") == 4.5
+
+    # Aumentar el peso de un arco del árbol obliga a recalcular
+    dj.add_edge(search, "A", "D", 10.0)
+    assert dj.dist_to(search, "D") == 4.0
+    assert dj.dist_to(search, "G") == 6.5
+
+
+@handle_not_implemented
+def test_add_edge_matches_dijkstra():
+    rnd = random.Random(8)
+    for directed in [True, False]:
+        graph = gl.new_graph(40, directed)
+        for v in range(40):
+            gl.insert_vertex(graph, v, None)
+        for i in range(40):
+            gl.add_edge(graph, rnd.randrange(40), rnd.randrange(40), rnd.randint(1, 20))
+        search = dj.dijkstra(graph, 0)
+        for i in range(80):
+            dj.add_edge(search, rnd.randrange(40), rnd.randrange(40), rnd.randint(1, 20))
+            expected = dj.dijkstra(graph, 0)
+            for v in range(40):
+                assert dj.dist_to(search, v) == dj.dist_to(expected, v)
+
+
+@handle_not_implemented
+def test_multi_source_dijkstra():
+    graph = setup_tests()
+    sources = lt.new_list()
+    for key in ["A", "D", "Z"]:
+        lt.add_last(sources, key)
+
+    search = dj.multi_source_dijkstra(graph, sources)
+    assert dj.nearest_source(search, "A") == "A"
+    assert dj.nearest_source(search, "B") == "A"
+    assert dj.dist_to(search, "B") == 1.0
+    assert dj.nearest_source(search, "C") == "D"
+    assert dj.dist_to(search, "C") == 1.0
+    assert dj.path_to(search, "C")["elements"] == ["D", "C"]
+    assert dj.nearest_source(search, "E") is None
+    assert dj.dist_to(search, "F") == math.inf
+
+
+@handle_not_implemented
+def test_multi_source_matches_dijkstra():
+    rnd = random.Random(4)
+    for directed in [True, False]:
+        graph = gl.new_graph(50, directed)
+        for v in range(50):
+            gl.insert_vertex(graph, v, None)
+        for i in range(120):
+            gl.add_edge(graph, rnd.randrange(50), rnd.randrange(50), rnd.randint(1, 20))
+        keys = rnd.sample(range(50), 5)
+        sources = lt.new_list()
+        for key in keys:
+            lt.add_last(sources, key)
+        search = dj.multi_source_dijkstra(graph, sources)
+        trees = [dj.dijkstra(graph, key) for key in keys]
+        for v in range(50):
+            best = min(dj.dist_to(tree, v) for tree in trees)
+            assert dj.dist_to(search, v) == best
+            nearest = dj.nearest_source(search, v)
+            if best == math.inf:
+                assert nearest is None
+            else:
+                assert dj.dist_to(trees[keys.index(nearest)], v) == best
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph.Tests.graph_factory import random_graph
+from DataStructures.Graph import distance_matrix as dm
+from DataStructures.Graph import dijkstra as dj
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests(num_vertex=40, num_edges=120, seed=3):
+    return random_graph(num_vertex, num_edges, True, seed)
+
+
+def keys_list(keys):
+    my_list = lt.new_list()
+    for key in keys:
+        lt.add_last(my_list, key)
+    return my_list
+
+
+def check_matrix(graph, matrix, sources, targets):
+    assert matrix["rows"] == len(sources)
+    assert matrix["columns"] == len(targets)
+    for i, source in enumerate(sources):
+        tree = dj.dijkstra(graph, source)
+        for j, target in enumerate(targets):
+            expected = math.inf if tree is None else dj.dist_to(tree, target)
+            assert dm.get_distance(matrix, i, j) == expected
+        assert list(dm.row(matrix, i)) == [dm.get_distance(matrix, i, j) for j in range(len(targets))]
+
+
+@handle_not_implemented
+def test_distance_matrix():
+    graph = setup_tests()
+    sources = [0, 5, 5, 17, "Z", 39]
+    targets = [1, 0, "Y", 22, 39, 5]
+
+    matrix = dm.distance_matrix(graph, keys_list(sources), keys_list(targets), processes=1)
+    check_matrix(graph, matrix, sources, targets)
+    assert dm.get_distance(matrix, 1, 5) == 0
+    assert dm.get_distance(matrix, 4, 0) == math.inf
+    assert dm.get_distance(matrix, 0, 2) == math.inf
+
+    view = dm.as_memoryview(matrix)
+    assert view.shape == (len(sources), len(targets))
+    assert view[3, 3] == dm.get_distance(matrix, 3, 3)
+
+    empty = dm.distance_matrix(graph, lt.new_list(), keys_list(targets), processes=1)
+    assert empty["rows"] == 0 and len(empty["data"]) == 0
+    assert len(dm.as_memoryview(empty)) == 0
+
+
+def test_distance_matrix_processes(monkeypatch):
+    graph = setup_tests()
+    sources = list(range(0, 40, 3))
+    targets = list(range(40))
+
+    monkeypatch.setattr(dm, "PARALLEL_ROWS_THRESHOLD", 2)
+    matrix = dm.distance_matrix(graph, keys_list(sources), keys_list(targets), processes=2)
+    check_matrix(graph, matrix, sources, targets)
@@ -0,0 +1,98 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import k_shortest_paths as ksp
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests():
+    # Ejemplo clásico de Yen: C -> H con 3 caminos
+    graph = gl.new_graph(10, True)
+    for vertex in "CDEFGH":
+        gl.insert_vertex(graph, vertex, None)
+    gl.add_edge(graph, "C", "D", 3)
+    gl.add_edge(graph, "C", "E", 2)
+    gl.add_edge(graph, "D", "F", 4)
+    gl.add_edge(graph, "E", "D", 1)
+    gl.add_edge(graph, "E", "F", 2)
+    gl.add_edge(graph, "E", "G", 3)
+    gl.add_edge(graph, "F", "G", 2)
+    gl.add_edge(graph, "F", "H", 1)
+    gl.add_edge(graph, "G", "H", 2)
+    return graph
+
+
+def edge_weight(graph, a, b):
+    adj = gl.adjacent_edges(graph, a)
+    for i in range(lt.size(adj)):
+        edge = lt.get_element(adj, i)
+        if edge.vertex_b == b:
+            return edge.weight
+    return None
+
+
+def simple_paths(graph, source, target):
+    # Todos los caminos sin ciclos, por fuerza bruta
+    paths = []
+
+    def visit(v, path, cost):
+        if v == target:
+            paths.append((cost, list(path)))
+            return
+        adj = gl.adjacent_edges(graph, v)
+        for i in range(lt.size(adj)):
+            edge = lt.get_element(adj, i)
+            w = edge.vertex_b
+            if w not in path:
+                path.append(w)
+                visit(w, path, cost + edge.weight)
+                path.pop()
+
+    visit(source, [source], 0.0)
+    return sorted(paths, key=lambda p: p[0])
+
+
+@handle_not_implemented
+def test_k_shortest_paths():
+    graph = setup_tests()
+    paths = ksp.k_shortest_paths(graph, "C", "H", 3)
+    assert lt.size(paths) == 3
+    assert [lt.get_element(paths, i)["distance"] for i in range(3)] == [5, 7, 8]
+    assert lt.get_element(paths, 0)["path"]["elements"] == ["C", "E", "F", "H"]
+    assert lt.get_element(paths, 1)["path"]["elements"] in (["C", "E", "G", "H"], ["C", "E", "F", "G", "H"])
+
+    assert lt.size(ksp.k_shortest_paths(graph, "C", "H", 50)) == len(simple_paths(graph, "C", "H"))
+    assert lt.size(ksp.k_shortest_paths(graph, "H", "C", 3)) == 0
+    assert lt.get_element(ksp.k_shortest_paths(graph, "C", "C", 3), 0)["distance"] == 0
+    assert ksp.k_shortest_paths(graph, "C", "Z", 3) is None
+
+
+@handle_not_implemented
+def test_k_shortest_matches_brute_force():
+    rnd = random.Random(12)
+    for directed in [True, False]:
+        for trial in range(15):
+            graph = gl.new_graph(10, directed)
+            for v in range(8):
+                gl.insert_vertex(graph, v, None)
+            for i in range(16):
+                a, b = rnd.randrange(8), rnd.randrange(8)
+                if a != b:
+                    gl.add_edge(graph, a, b, rnd.randint(1, 6))
+            expected = simple_paths(graph, 0, 7)
+            paths = ksp.k_shortest_paths(graph, 0, 7, 10)
+            assert lt.size(paths) == min(10, len(expected))
+            found = set()
+            for i in range(lt.size(paths)):
+                path = lt.get_element(paths, i)
+                keys = path["path"]["elements"]
+                assert path["distance"] == expected[i][0]
+                assert len(set(keys)) == len(keys)
+                assert keys[0] == 0 and keys[-1] == 7
+                assert sum(edge_weight(graph, keys[j], keys[j + 1])
+                           for j in range(len(keys) - 1)) == path["distance"]
+                found.add(tuple(keys))
+            assert len(found) == lt.size(paths)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import mst
+from DataStructures.Graph import edge
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests():
+    # Grafo clásico de 8 vértices (tinyEWG), su MST pesa 1.81
+    graph = gl.new_graph(8, False)
+    for v in range(8):
+        gl.insert_vertex(graph, v, None)
+    for a, b, weight in [(4, 5, 0.35), (4, 7, 0.37), (5, 7, 0.28), (0, 7, 0.16),
+                         (1, 5, 0.32), (0, 4, 0.38), (2, 3, 0.17), (1, 7, 0.19),
+                         (0, 2, 0.26), (1, 2, 0.36), (1, 3, 0.29), (2, 7, 0.34),
+                         (6, 2, 0.40), (3, 6, 0.52), (6, 0, 0.58), (6, 4, 0.93)]:
+        gl.add_edge(graph, a, b, weight)
+    return graph
+
+
+def brute_force_weight(graph, num_vertex):
+    # Kruskal sencillo sobre la lista de arcos como referencia
+    parent = list(range(num_vertex))
+
+    def find(v):
+        while parent[v] != v:
+            v = parent[v]
+        return v
+
+    all_edges = []
+    for v in range(num_vertex):
+        vid = gl.vertex_id(graph, v)
+        neighbors = gl.adjacent_ids(graph, vid)["elements"]
+        weights = gl.adjacent_weights(graph, vid)["elements"]
+        for i in range(len(neighbors)):
+            all_edges.append((weights[i], v, gl.vertex_key(graph, neighbors[i])))
+    total = 0
+    for weight, a, b in sorted(all_edges):
+        if find(a) != find(b):
+            parent[find(a)] = find(b)
+            total += weight
+    return total
+
+
+@handle_not_implemented
+def test_prim_and_kruskal():
+    graph = setup_tests()
+    for function in [mst.prim_mst, mst.kruskal_mst]:
+        tree = function(graph)
+        assert round(mst.weight(tree), 2) == 1.81
+        assert lt.size(mst.edges(tree)) == 7
+        total = 0
+        for i in range(lt.size(mst.edges(tree))):
+            total += edge.weight(lt.get_element(mst.edges(tree), i))
+        assert round(total, 2) == 1.81
+
+
+@handle_not_implemented
+def test_spanning_forest():
+    rnd = random.Random(11)
+    graph = gl.new_graph(60, False)
+    for v in range(60):
+        gl.insert_vertex(graph, v, None)
+    for i in range(100):
+        a = rnd.randrange(60)
+        b = rnd.randrange(60)
+        if a != b:
+            gl.add_edge(graph, a, b, rnd.randint(1, 30))
+
+    expected = brute_force_weight(graph, 60)
+    prim = mst.prim_mst(graph)
+    kruskal = mst.kruskal_mst(graph)
+    assert mst.weight(prim) == expected
+    assert mst.weight(kruskal) == expected
+    assert lt.size(mst.edges(prim)) == lt.size(mst.edges(kruskal))
+
+
+@handle_not_implemented
+def test_directed_and_empty():
+    assert mst.prim_mst(gl.new_graph(5, True)) is None
+    assert mst.kruskal_mst(gl.new_graph(5, True)) is None
+    empty = gl.new_graph()
+    assert mst.weight(mst.prim_mst(empty)) == 0
+    assert lt.size(mst.edges(mst.kruskal_mst(empty))) == 0
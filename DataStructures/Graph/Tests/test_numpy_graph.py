@@ -0,0 +1,84 @@
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph.Tests.graph_factory import random_graph
+from DataStructures.Graph import bfs
+
+np = pytest.importorskip("numpy")
+from DataStructures.Graph import numpy_graph as ng
+
+
+def setup_tests(directed=True, num_vertex=50, num_edges=150, seed=4):
+    return random_graph(num_vertex, num_edges, directed, seed, max_weight=5)
+
+
+@handle_not_implemented
+def test_to_numpy_csr():
+    graph = setup_tests()
+    csr = gl.to_numpy_csr(graph)
+
+    assert csr["indptr"].dtype == np.int64
+    assert csr["indptr"].size == 51
+    assert csr["indices"].size == gl.num_edges(graph)
+    for v in range(50):
+        vid = gl.vertex_id(graph, v)
+        start, end = csr["indptr"][vid], csr["indptr"][vid + 1]
+        assert list(csr["indices"][start:end]) == list(gl.adjacent_ids(graph, vid)["elements"])
+        assert list(csr["weights"][start:end]) == list(gl.adjacent_weights(graph, vid)["elements"])
+
+    empty = gl.to_numpy_csr(gl.new_graph())
+    assert empty["indptr"].tolist() == [0]
+    assert ng.degree_stats(empty)["max"] == 0
+    assert ng.pagerank(empty).size == 0
+
+
+@handle_not_implemented
+def test_degree_stats():
+    graph = setup_tests()
+    csr = gl.to_numpy_csr(graph)
+    stats = ng.degree_stats(csr)
+
+    for v in range(50):
+        vid = gl.vertex_id(graph, v)
+        assert stats["out_degree"][vid] == gl.degree(graph, v)
+        assert stats["in_degree"][vid] == gl.in_degree(graph, v)
+        assert stats["strength"][vid] == sum(gl.adjacent_weights(graph, vid)["elements"])
+    assert stats["max"] == max(gl.degree(graph, v) for v in range(50))
+    assert stats["mean"] == pytest.approx(gl.num_edges(graph) / 50)
+
+
+@handle_not_implemented
+def test_bfs_levels():
+    for directed in [True, False]:
+        graph = setup_tests(directed, num_edges=70)
+        csr = gl.to_numpy_csr(graph)
+        for source in [0, 17, 33]:
+            levels = ng.bfs_levels(csr, gl.vertex_id(graph, source))
+            search = bfs.bfs(graph, source)
+            assert levels.tolist() == list(search["dist_to"])
+
+
+@handle_not_implemented
+def test_pagerank():
+    graph = setup_tests()
+    csr = gl.to_numpy_csr(graph)
+    rank = ng.pagerank(csr, tolerance=1e-12, max_iterations=500)
+    assert rank.sum() == pytest.approx(1.0)
+
+    # Iteración de potencia sin vectorizar como referencia
+    num_vertex = 50
+    expected = [1.0 / num_vertex] * num_vertex
+    for iteration in range(500):
+        new = [0.15 / num_vertex] * num_vertex
+        dangling = 0.0
+        for v in range(num_vertex):
+            neighbors = gl.adjacent_ids(graph, v)["elements"]
+            if len(neighbors) == 0:
+                dangling += expected[v]
+            for w in neighbors:
+                new[w] += 0.85 * expected[v] / len(neighbors)
+        expected = [x + 0.85 * dangling / num_vertex for x in new]
+    assert rank.tolist() == pytest.approx(expected, abs=1e-9)
+
+    weighted = ng.pagerank(csr, weighted=True)
+    assert weighted.sum() == pytest.approx(1.0)
@@ -0,0 +1,67 @@
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import scc
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests():
+    # Dos ciclos A-B-C y D-E unidos por arcos de un solo sentido, F aislado
+    graph = gl.new_graph(10, True)
+    for vertex in ["A", "B", "C", "D", "E", "F"]:
+        gl.insert_vertex(graph, vertex, None)
+    gl.add_edge(graph, "A", "B", 1.0)
+    gl.add_edge(graph, "B", "C", 1.0)
+    gl.add_edge(graph, "C", "A", 1.0)
+    gl.add_edge(graph, "C", "D", 5.0)
+    gl.add_edge(graph, "B", "E", 2.0)
+    gl.add_edge(graph, "D", "E", 1.0)
+    gl.add_edge(graph, "E", "D", 1.0)
+    return graph
+
+
+@handle_not_implemented
+def test_strongly_connected_components():
+    graph = setup_tests()
+
+    components = scc.strongly_connected_components(graph)
+
+    assert scc.count(components) == 3
+    assert scc.strongly_connected(components, "A", "C")
+    assert scc.strongly_connected(components, "D", "E")
+    assert not scc.strongly_connected(components, "A", "D")
+    assert not scc.strongly_connected(components, "F", "A")
+    assert not scc.strongly_connected(components, "A", "Z")
+    # Orden topológico inverso: {A,B,C} llega a {D,E}
+    assert scc.component_of(components, "A") > scc.component_of(components, "D")
+
+
+@handle_not_implemented
+def test_condensation():
+    graph = setup_tests()
+
+    components = scc.strongly_connected_components(graph)
+    dag = scc.condensation(components)
+
+    assert gl.num_vertices(dag) == 3
+    assert gl.num_edges(dag) == 1
+    c_abc = scc.component_of(components, "A")
+    c_de = scc.component_of(components, "D")
+    edge_list = gl.edges(dag)
+    edge = lt.first_element(edge_list)
+    assert edge["vertex_a"] == c_abc
+    assert edge["vertex_b"] == c_de
+    assert edge["weight"] == 2.0
+
+
+@handle_not_implemented
+def test_long_cycle_without_recursion():
+    graph = gl.new_graph(20000, True)
+    for i in range(20000):
+        gl.insert_vertex(graph, i, None)
+    for i in range(20000):
+        gl.add_edge(graph, i, (i + 1) % 20000, 1.0)
+
+    components = scc.strongly_connected_components(graph)
+    assert scc.count(components) == 1
+    assert scc.strongly_connected(components, 0, 19999)
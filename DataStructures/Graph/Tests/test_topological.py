@@ -0,0 +1,118 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import adj_list_graph as gl
+from DataStructures.Graph import topological as tp
+from DataStructures.Graph import edge as ed
+from DataStructures.Lists import array_list as lt
+
+
+def setup_tests():
+    # Grafo tinyEWDAG de Sedgewick
+    graph = gl.new_graph(8, True)
+    for v in range(8):
+        gl.insert_vertex(graph, v, None)
+    for a, b, weight in [(5, 4, 0.35), (4, 7, 0.37), (5, 7, 0.28), (5, 1, 0.32),
+                         (4, 0, 0.38), (0, 2, 0.26), (3, 7, 0.39), (1, 3, 0.29),
+                         (7, 2, 0.34), (6, 2, 0.40), (3, 6, 0.52), (6, 0, 0.58),
+                         (6, 4, 0.93)]:
+        gl.add_edge(graph, a, b, weight)
+    return graph
+
+
+def check_order(graph, order):
+    position = {}
+    for i in range(lt.size(order)):
+        position[lt.get_element(order, i)] = i
+    assert len(position) == gl.num_vertices(graph)
+    all_edges = gl.edges(graph)
+    for i in range(lt.size(all_edges)):
+        edge = lt.get_element(all_edges, i)
+        vertex_a = ed.either(edge)
+        assert position[vertex_a] < position[ed.other(edge, vertex_a)]
+
+
+@handle_not_implemented
+def test_in_degree_maintained():
+    graph = setup_tests()
+    assert gl.in_degree(graph, 2) == 3
+    assert gl.in_degree(graph, 5) == 0
+    gl.add_edge(graph, 6, 2, 1.0)
+    assert gl.in_degree(graph, 2) == 3
+
+
+@handle_not_implemented
+def test_topological_order():
+    graph = setup_tests()
+    result = tp.topological_order(graph)
+
+    assert result["cycle"] is None
+    check_order(graph, result["order"])
+
+    rnd = random.Random(2)
+    dag = gl.new_graph(40, True)
+    for v in range(40):
+        gl.insert_vertex(dag, v, None)
+    for i in range(150):
+        a, b = sorted(rnd.sample(range(40), 2))
+        gl.add_edge(dag, b, a, 1)
+    check_order(dag, tp.topological_order(dag)["order"])
+
+
+@handle_not_implemented
+def test_cycle():
+    graph = setup_tests()
+    gl.add_edge(graph, 2, 1, 0.5)
+    result = tp.topological_order(graph)
+
+    assert result["order"] is None
+    cycle = result["cycle"]["elements"]
+    assert cycle[0] == cycle[-1]
+    for a, b in zip(cycle, cycle[1:]):
+        assert b in [gl.vertex_key(graph, w) for w in gl.adjacent_ids(graph, gl.vertex_id(graph, a))["elements"]]
+
+    search = tp.dag_shortest_path(graph, 5)
+    assert tp.has_cycle(search)
+    assert tp.cycle(search)["elements"][0] == tp.cycle(search)["elements"][-1]
+    assert tp.path_to(search, 2) is None
+
+    loop = gl.new_graph(3, True)
+    gl.insert_vertex(loop, "A", None)
+    gl.add_edge(loop, "A", "A", 1)
+    assert tp.topological_order(loop)["cycle"]["elements"] == ["A", "A"]
+
+
+@handle_not_implemented
+def test_dag_shortest_path():
+    graph = setup_tests()
+    search = tp.dag_shortest_path(graph, 5)
+
+    assert not tp.has_cycle(search)
+    expected = [0.73, 0.32, 0.62, 0.61, 0.35, 0.0, 1.13, 0.28]
+    for v in range(8):
+        assert round(tp.dist_to(search, v), 2) == expected[v]
+    assert tp.path_to(search, 0)["elements"] == [5, 4, 0]
+    assert tp.path_to(search, 6)["elements"] == [5, 1, 3, 6]
+
+    search = tp.dag_shortest_path(graph, 3)
+    assert not tp.has_path_to(search, 5)
+    assert tp.dist_to(search, 5) == math.inf
+    assert tp.path_to(search, 5) is None
+    assert tp.dag_shortest_path(graph, "Z") is None
+
+
+@handle_not_implemented
+def test_dag_longest_path():
+    graph = setup_tests()
+    search = tp.dag_longest_path(graph, 5)
+
+    expected = [2.44, 0.32, 2.77, 0.61, 2.06, 0.0, 1.13, 2.43]
+    for v in range(8):
+        assert round(tp.dist_to(search, v), 2) == expected[v]
+    assert tp.path_to(search, 2)["elements"] == [5, 1, 3, 6, 4, 7, 2]
+
+    search = tp.dag_longest_path(graph, 3)
+    assert tp.dist_to(search, 5) == -math.inf
+    assert tp.path_to(search, 1) is None
@@ -0,0 +1,25 @@
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import union_find as uf
+
+
+@handle_not_implemented
+def test_union_find():
+    sets = uf.new_union_find(6)
+    assert uf.count(sets) == 6
+    assert not uf.connected(sets, 0, 1)
+
+    assert uf.union(sets, 0, 1)
+    assert uf.union(sets, 2, 3)
+    assert uf.union(sets, 1, 3)
+    assert not uf.union(sets, 0, 2)
+    assert uf.connected(sets, 0, 3)
+    assert not uf.connected(sets, 0, 4)
+    assert uf.count(sets) == 3
+    assert uf.set_size(sets, 2) == 4
+    assert uf.set_size(sets, 5) == 1
+
+    assert uf.add(sets) == 6
+    assert uf.count(sets) == 4
+    assert uf.union(sets, 6, 5)
+    assert uf.connected(sets, 5, 6)
@@ -1,33 +1,56 @@
+from array import array
 from DataStructures.Lists import array_list as lt 
+from DataStructures.Lists import typed_array_list as tal
 from DataStructures.Map import map_linear_probing as mp
 from . import edge as e
+from . import union_find as uf
 
-def new_graph(size=15, directed=False):
+def new_graph(size=15, directed=False, track_components=False):
     """
     Crea un grafo vacío.
     
     El grafo tiene los siguientes atributos:
-    - vertices: Mapa que almacena los vértices y sus listas de adyacencia (usando map_linear_probing)
+    - vertices: Mapa que asigna a cada vértice un identificador entero denso (0, 1, 2, ...) (usando map_linear_probing)
     - information: Mapa que almacena la información de los vértices (usando map_linear_probing)
     - edges: Número de aristas en el grafo (inicializado en 0)
     - directed: Indica si el grafo es dirigido
     - type: Tipo de implementación (inicializado en 'ADJ_LIST')
-    - in_degree: Mapa que almacena los grados de entrada de los vértices (solo para grafos dirigidos)
+    - in_degree: Lista, indexada por identificador, con los grados de entrada de los vértices (solo para grafos dirigidos)
+    - keys: Lista con la llave de cada vértice, indexada por su identificador
+    - adj_ids: Lista, indexada por identificador, con los identificadores de los vecinos de cada vértice
+    - adj_weights: Lista, indexada por identificador, con los pesos de los arcos de cada vértice
+    - reverse: Índice de los arcos de entrada de cada vértice (ver ``reverse_index()``)
+    - components: Conjuntos disjuntos (``union_find``) de los componentes
+      conectados, indexados por identificador, o None si no se mantienen
+      (ver ``track_components()``)
+    
+    Las listas de adyacencia son ``adj_ids`` y ``adj_weights``: la posición
+    ``i`` de ambas corresponde al mismo arco. Las llaves se traducen a
+    identificadores una sola vez al entrar a cada función y los algoritmos
+    del paquete recorren los arcos con enteros. Los arcos como objetos
+    ``edge`` se construyen solo al pedirlos (ver ``adjacent_edges()`` y ``edges()``).
     
     Args:
         size (int): Capacidad inicial de los mapas (por defecto=15)
         directed (bool): Indica si el grafo es dirigido (por defecto=False)
+        track_components (bool): Indica si se mantienen los componentes conectados
+            al agregar vértices y arcos (por defecto=False)
     
     Returns:
         dict: El grafo vacío recién creado
     """
     graph = {
-        'vertices': mp.new_map(size, 0.5),      # Mapa para almacenar vértices y listas de adyacencia
+        'vertices': mp.new_map(size, 0.5),      # Mapa de cada vértice a su identificador
         'information': mp.new_map(size, 0.5),   # Mapa para almacenar información de los vértices  
         'edges': 0,                              # Contador de aristas
         'directed': directed,                    # Indica si el grafo es dirigido
         'type': 'ADJ_LIST',                      # Tipo de implementación
-        'in_degree': None if not directed else mp.new_map(size, 0.5)  # Grados de entrada para grafos dirigidos
+        'in_degree': None if not directed else tal.new_list('q'),  # Grados de entrada para grafos dirigidos
+        'keys': lt.new_list(),                   # Llave de cada identificador
+        'adj_ids': lt.new_list(),                # Vecinos de cada identificador
+        'adj_weights': lt.new_list(),            # Pesos de los arcos de cada identificador
+        'reverse': None,                         # Índice de arcos de entrada, se construye bajo demanda
+        'components': uf.new_union_find() if track_components else None  # Componentes conectados
     }
     return graph
 
@@ -42,30 +65,24 @@ def edges(graph):
     Returns:
         array_list: La lista con los arcos del grafo
     """
+    update_vertex_index(graph)
     # Crear una nueva lista para almacenar los arcos
     edges_list = lt.new_list()
-    
-    # Obtener la lista de vértices
-    vertex_list = vertices(graph)
+    keys = graph['keys']['elements']
     
     # Para cada vértice
-    for i in range(lt.size(vertex_list)):
-        vertex = lt.get_element(vertex_list, i)
-        
-        # Obtener su lista de adyacencia
-        adj_list = mp.get(graph['vertices'], vertex)
+    for v in range(len(keys)):
+        neighbors = adjacent_ids(graph, v)['elements']
+        weights = adjacent_weights(graph, v)['elements']
         
         # Para cada arco en la lista de adyacencia
-        for j in range(lt.size(adj_list)):
-            edge = lt.get_element(adj_list, j)
+        for i in range(len(neighbors)):
+            w = neighbors[i]
             
-            # Si el grafo no es dirigido, solo agregar el arco si vertex_a <= vertex_b
+            # Si el grafo no es dirigido, solo agregar el arco si v <= w
             # para evitar duplicados
-            if not graph['directed']:
-                if e.either(edge) <= e.other(edge, e.either(edge)):
-                    lt.add_last(edges_list, edge)
-            else:
-                lt.add_last(edges_list, edge)
+            if graph['directed'] or v <= w:
+                lt.add_last(edges_list, e.new_edge(keys[v], keys[w], weights[i]))
                     
     return edges_list
 
@@ -83,35 +100,41 @@ def add_edge(graph, vertex_a, vertex_b, weight=0):
         dict: El grafo actualizado
     """
     # Verificar si ambos vértices existen
-    if not (mp.contains(graph['vertices'], vertex_a) and 
-            mp.contains(graph['vertices'], vertex_b)):
+    id_a = vertex_id(graph, vertex_a)
+    id_b = vertex_id(graph, vertex_b)
+    if id_a is None or id_b is None:
         return graph
 
-    # Crear el nuevo arco
-    new_edge = e.new_edge(vertex_a, vertex_b, weight)
+    graph['reverse'] = None
+    weights_a = lt.get_element(graph['adj_weights'], id_a)
     
-    # Obtener la lista de adyacencia del vértice a
-    adj_list_a = mp.get(graph['vertices'], vertex_a)
-    
-    # Verificar si el arco ya existe
-    edge_found = False
-    for i in range(lt.size(adj_list_a)):
-        edge = lt.get_element(adj_list_a, i)
-        if (e.either(edge) == vertex_a and e.other(edge, vertex_a) == vertex_b):
-            lt.change_info(adj_list_a, i, new_edge)
-            edge_found = True
-            break
+    # Verificar si el arco ya existe buscando el identificador de b entre los vecinos de a
+    pos = find_adjacent_id(graph, id_a, id_b)
+    if pos >= 0:
+        tal.change_info(weights_a, pos, weight)
+        # En el grafo no dirigido se actualiza también el arco de regreso
+        if not graph['directed'] and id_a != id_b:
+            pos_b = find_adjacent_id(graph, id_b, id_a)
+            if pos_b >= 0:
+                tal.change_info(lt.get_element(graph['adj_weights'], id_b), pos_b, weight)
+        return graph
     
     # Si el arco no existe, agregarlo
-    if not edge_found:
-        lt.add_last(adj_list_a, new_edge)
-        graph['edges'] += 1
+    tal.add_last(weights_a, weight)
+    tal.add_last(lt.get_element(graph['adj_ids'], id_a), id_b)
+    graph['edges'] += 1
+    if graph['components'] is not None:
+        uf.union(graph['components'], id_a, id_b)
+
+    # En el grafo dirigido se mantiene el grado de entrada del vértice b
+    if graph['directed']:
+        in_degrees = graph['in_degree']['elements']
+        in_degrees[id_b] += 1
         
-        # Si el grafo es no dirigido, agregar el arco en la otra dirección
-        if not graph['directed']:
-            adj_list_b = mp.get(graph['vertices'], vertex_b)
-            reverse_edge = e.new_edge(vertex_b, vertex_a, weight)
-            lt.add_last(adj_list_b, reverse_edge)
+    # Si el grafo es no dirigido, agregar el arco en la otra dirección
+    else:
+        tal.add_last(lt.get_element(graph['adj_weights'], id_b), weight)
+        tal.add_last(lt.get_element(graph['adj_ids'], id_b), id_a)
     return graph
 
 def num_edges(graph):
@@ -130,7 +153,7 @@ def insert_vertex(graph, key_vertex, info_vertex):
     """
     Inserta un nuevo vértice en el grafo si no existe ya.
     
-    Crea una lista de adyacencia vacía para el nuevo vértice y almacena su información.
+    Le asigna un identificador con listas de vecinos y pesos vacías y almacena su información.
     Para grafos dirigidos, inicializa el contador de grados de entrada en 0.
     
     Args:
@@ -142,19 +165,12 @@ def insert_vertex(graph, key_vertex, info_vertex):
         dict: El grafo actualizado
     """
     # Verifica si el vértice ya existe
-    if not mp.contains(graph['vertices'], key_vertex):
-        # Crea una lista de adyacencia vacía para el nuevo vértice
-        adj_list = lt.new_list()
-        
-        # Agrega el vértice y su lista de adyacencia al mapa de vértices
-        mp.put(graph['vertices'], key_vertex, adj_list)
+    if vertex_id(graph, key_vertex) is None:
+        add_vertex_id(graph, key_vertex)
+        graph['reverse'] = None
         
         # Agrega la información del vértice
         mp.put(graph['information'], key_vertex, info_vertex)
-        
-        # Inicializa el grado de entrada para grafos dirigidos
-        if graph['directed'] and graph['in_degree'] is not None:
-            mp.put(graph['in_degree'], key_vertex, 0)
     
     return
 
@@ -181,10 +197,10 @@ def num_vertices(graph):
         graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion.
     
     Returns:
-        array_list: La lista con los vertices del grafo
+        int: El numero de vertices del grafo
     """
         
-    return lt.size(vertices(graph))
+    return mp.size(graph['vertices'])
 
 def degree(graph, key_vertex):
     """
@@ -197,18 +213,20 @@ def degree(graph, key_vertex):
     Retorna:
     int: Grado del vértice.
     """
-    #Verifica si -> vértice existe en mapa de vértices
-    if mp.contains(graph['vertices'], key_vertex):
-        #Obtiene -> lista  adyacencia del vértice key_vertex
-        adj_list = mp.get(graph['vertices'], key_vertex)
-        #Retorna -> tamaño lista de adyacencia como el grado del vértice
-        return lt.size(adj_list)
-    # Retorna None si -> vértice no está en el grafo
-    return None
+    #Obtiene -> identificador del vértice, None si no está en el grafo
+    id_v = vertex_id(graph, key_vertex)
+    if id_v is None:
+        return None
+    #Retorna -> tamaño lista de vecinos como el grado del vértice
+    return tal.size(adjacent_ids(graph, id_v))
 
 def in_degree(graph, key_vertex):
     """
     Retorna el número de arcos que llegan al vértice 'key_vertex'.
+
+    En un grafo dirigido el grado se lee de la lista ``in_degree``, que
+    ``add_edge`` actualiza, en O(1). En un grafo no dirigido cada arco entra
+    y sale del vértice, así que es igual a ``degree()``.
     
     Args:
         graph (adj_list_graph): El grafo sobre el que se ejecuta la operación.
@@ -218,24 +236,357 @@ def in_degree(graph, key_vertex):
         int: El grado de entrada del vértice.
     """
     #Verificar si -> vértice existe
-    if not mp.contains(graph['vertices'], key_vertex):
+    id_v = vertex_id(graph, key_vertex)
+    if id_v is None:
         return None
-    
-    #Contador -> grado entrada
-    contador_grado = 0
 
-    #Recorrer -> vértices grafo
+    #Grafo dirigido -> grado mantenido por add_edge
+    if graph['directed']:
+        return tal.get_element(graph['in_degree'], id_v)
+    return tal.size(adjacent_ids(graph, id_v))
+
+def adjacent_edges(graph, key_vertex):
+    """
+    Retorna la lista de adyacencia del vértice "key_vertex" como arcos.
+
+    Los arcos se construyen a partir de ``adj_ids`` y ``adj_weights`` en cada
+    llamada; son una copia y modificarlos no cambia el grafo.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        key_vertex (any): Llave del vértice
+
+    Returns:
+        array_list: Los arcos que salen del vértice, en el orden de ``adjacent_ids()``,
+        o None si el vértice no existe
+    """
+    id_v = vertex_id(graph, key_vertex)
+    if id_v is None:
+        return None
+    keys = graph['keys']['elements']
+    neighbors = adjacent_ids(graph, id_v)['elements']
+    weights = adjacent_weights(graph, id_v)['elements']
+    adj_list = lt.new_list()
+    for i in range(len(neighbors)):
+        lt.add_last(adj_list, e.new_edge(key_vertex, keys[neighbors[i]], weights[i]))
+    return adj_list
+
+def update_vertex_index(graph):
+    """
+    Garantiza que todos los vértices del grafo tengan identificador.
+
+    Si hay vértices sin identificador, porque el grafo se construyó
+    escribiendo directamente en ``graph['vertices']`` una lista de
+    adyacencia de arcos (``edge``) para una llave nueva, se indexan con
+    ``index_missing_vertices()``. Los identificadores existentes nunca
+    cambian, de modo que los resultados indexados por identificador
+    (búsquedas, componentes, exportaciones CSR) siguen siendo válidos.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: El grafo con el índice actualizado
+    """
+    if mp.size(graph['vertices']) != lt.size(graph['keys']):
+        index_missing_vertices(graph)
+    return graph
+
+def index_missing_vertices(graph):
+    """
+    Asigna identificadores a los vértices de ``graph['vertices']`` que tienen
+    una lista de adyacencia de arcos en lugar de un identificador, y pasa sus
+    arcos a ``adj_ids`` y ``adj_weights`` en el mismo orden.
+
+    Los identificadores nuevos continúan la numeración existente.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: El grafo con el índice actualizado
+    """
     vertex_list = vertices(graph)
+    missing = lt.new_list()
     for i in range(lt.size(vertex_list)):
         vertex = lt.get_element(vertex_list, i)
-        
-        #Obtener -> lista adyacencia de cada vértice
         adj_list = mp.get(graph['vertices'], vertex)
-        
-        #Contar -> aristas que apuntan a key_vertex
+        if not isinstance(adj_list, int):
+            lt.add_last(missing, (vertex, adj_list))
+    graph['reverse'] = None
+    for i in range(lt.size(missing)):
+        add_vertex_id(graph, lt.get_element(missing, i)[0])
+    for i in range(lt.size(missing)):
+        vertex, adj_list = lt.get_element(missing, i)
+        id_v = mp.get(graph['vertices'], vertex)
+        neighbors = adjacent_ids(graph, id_v)
+        weights = adjacent_weights(graph, id_v)
         for j in range(lt.size(adj_list)):
             edge = lt.get_element(adj_list, j)
-            if e.other(edge, vertex) == key_vertex: 
-                contador_grado += 1
-                
-    return contador_grado
\ No newline at end of file
+            id_w = mp.get(graph['vertices'], e.other(edge, vertex))
+            tal.add_last(neighbors, id_w)
+            tal.add_last(weights, e.weight(edge))
+            if graph['directed']:
+                graph['in_degree']['elements'][id_w] += 1
+            if graph['components'] is not None:
+                uf.union(graph['components'], id_v, id_w)
+    return graph
+
+def add_vertex_id(graph, key_vertex):
+    """
+    Asigna el siguiente identificador entero libre al vértice ``key_vertex``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        key_vertex (any): Llave del vértice
+
+    Returns:
+        int: El identificador asignado
+    """
+    vertex_id = lt.size(graph['keys'])
+    mp.put(graph['vertices'], key_vertex, vertex_id)
+    lt.add_last(graph['keys'], key_vertex)
+    lt.add_last(graph['adj_ids'], tal.new_list('q'))
+    lt.add_last(graph['adj_weights'], tal.new_list('d'))
+    if graph['directed']:
+        tal.add_last(graph['in_degree'], 0)
+    if graph['components'] is not None:
+        uf.add(graph['components'])
+    return vertex_id
+
+def find_adjacent_id(graph, vertex_id, adjacent_id):
+    """
+    Busca ``adjacent_id`` entre los vecinos del vértice con identificador ``vertex_id``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        vertex_id (int): Identificador del vértice de origen
+        adjacent_id (int): Identificador del vecino buscado
+
+    Returns:
+        int: La posición del arco en la lista de adyacencia, o -1 si no existe
+    """
+    neighbors = lt.get_element(graph['adj_ids'], vertex_id)['elements']
+    try:
+        return neighbors.index(adjacent_id)
+    except ValueError:
+        return -1
+
+def vertex_id(graph, key_vertex):
+    """
+    Retorna el identificador entero del vértice ``key_vertex``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        key_vertex (any): Llave del vértice
+
+    Returns:
+        int: El identificador del vértice, o None si el vértice no existe
+    """
+    update_vertex_index(graph)
+    return mp.get(graph['vertices'], key_vertex)
+
+def vertex_key(graph, vertex_id):
+    """
+    Retorna la llave del vértice con identificador ``vertex_id``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        vertex_id (int): Identificador del vértice
+
+    Returns:
+        any: La llave del vértice
+    """
+    return lt.get_element(graph['keys'], vertex_id)
+
+def adjacent_ids(graph, vertex_id):
+    """
+    Retorna los identificadores de los vecinos del vértice ``vertex_id``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        vertex_id (int): Identificador del vértice
+
+    Returns:
+        typed_array_list: Identificadores de los vecinos, en el orden de la lista de adyacencia
+    """
+    return lt.get_element(graph['adj_ids'], vertex_id)
+
+def adjacent_weights(graph, vertex_id):
+    """
+    Retorna los pesos de los arcos que salen del vértice ``vertex_id``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        vertex_id (int): Identificador del vértice
+
+    Returns:
+        typed_array_list: Pesos de los arcos, alineados con ``adjacent_ids()``
+    """
+    return lt.get_element(graph['adj_weights'], vertex_id)
+
+def reverse_index(graph):
+    """
+    Retorna el índice de arcos de entrada del grafo: para cada identificador,
+    los identificadores de los vértices con un arco hacia él y sus pesos.
+
+    En un grafo no dirigido los arcos de entrada son los mismos de salida. En
+    un grafo dirigido el índice se construye en O(V + E) la primera vez y se
+    guarda en ``graph['reverse']`` hasta que el grafo se modifique.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: Estructura con ``adj_ids`` y ``adj_weights`` (listas indexadas por identificador)
+    """
+    update_vertex_index(graph)
+    if not graph['directed']:
+        return {'adj_ids': graph['adj_ids'], 'adj_weights': graph['adj_weights']}
+    if graph.get('reverse') is None:
+        num_vertex = lt.size(graph['keys'])
+        rev_ids = lt.new_list()
+        rev_weights = lt.new_list()
+        for v in range(num_vertex):
+            lt.add_last(rev_ids, tal.new_list('q'))
+            lt.add_last(rev_weights, tal.new_list('d'))
+        for v in range(num_vertex):
+            neighbors = adjacent_ids(graph, v)['elements']
+            weights = adjacent_weights(graph, v)['elements']
+            for i in range(len(neighbors)):
+                tal.add_last(lt.get_element(rev_ids, neighbors[i]), v)
+                tal.add_last(lt.get_element(rev_weights, neighbors[i]), weights[i])
+        graph['reverse'] = {'adj_ids': rev_ids, 'adj_weights': rev_weights}
+    return graph['reverse']
+
+def csr_arrays(graph):
+    """
+    Exporta los arcos del grafo en formato CSR (Compressed Sparse Row).
+
+    Los vecinos del vértice con identificador ``v`` son ``targets[offsets[v]:offsets[v + 1]]``
+    y sus pesos las mismas posiciones de ``weights``. Son tres ``array.array``
+    contiguos: ocupan poca memoria, se serializan sin recorrer objetos y
+    pueden compartirse con otros procesos o con ``numpy.frombuffer``. Es una
+    copia: no refleja cambios posteriores del grafo.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: Estructura con ``offsets`` (enteros, V + 1 posiciones), ``targets``
+        (enteros) y ``weights`` (reales)
+    """
+    update_vertex_index(graph)
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('d')
+    for v in range(lt.size(graph['keys'])):
+        targets.extend(adjacent_ids(graph, v)['elements'])
+        weights.extend(adjacent_weights(graph, v)['elements'])
+        offsets.append(len(targets))
+    return {'offsets': offsets, 'targets': targets, 'weights': weights}
+
+def track_components(graph):
+    """
+    Activa el seguimiento de los componentes conectados del grafo.
+
+    Construye un ``union_find`` con los vértices y arcos actuales en
+    O(V + E); desde entonces ``insert_vertex`` y ``add_edge`` lo actualizan,
+    de modo que ``num_components()`` y ``same_component()`` responden en
+    tiempo casi constante sin recorrer el grafo. En un grafo dirigido los
+    componentes son los débilmente conectados (se ignora el sentido de los arcos).
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: El grafo con el seguimiento activado
+    """
+    update_vertex_index(graph)
+    if graph['components'] is None:
+        build_components(graph)
+    return graph
+
+def build_components(graph):
+    """
+    Reconstruye los componentes conectados a partir de ``adj_ids``, en O(V + E).
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: El grafo con los componentes reconstruidos
+    """
+    num_vertex = lt.size(graph['keys'])
+    components = uf.new_union_find(num_vertex)
+    for v in range(num_vertex):
+        for w in adjacent_ids(graph, v)['elements']:
+            uf.union(components, v, w)
+    graph['components'] = components
+    return graph
+
+def num_components(graph):
+    """
+    Retorna el número de componentes conectados del grafo.
+
+    Si el grafo no mantiene sus componentes, se activa ``track_components()``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        int: El número de componentes conectados
+    """
+    track_components(graph)
+    return uf.count(graph['components'])
+
+def same_component(graph, vertex_a, vertex_b):
+    """
+    Indica si ``vertex_a`` y ``vertex_b`` están en el mismo componente conectado.
+
+    Si el grafo no mantiene sus componentes, se activa ``track_components()``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+        vertex_a (any): Llave del primer vértice
+        vertex_b (any): Llave del segundo vértice
+
+    Returns:
+        bool: True si hay un camino entre los vértices sin importar el sentido de los arcos
+    """
+    track_components(graph)
+    id_a = mp.get(graph['vertices'], vertex_a)
+    id_b = mp.get(graph['vertices'], vertex_b)
+    if id_a is None or id_b is None:
+        return False
+    return uf.connected(graph['components'], id_a, id_b)
+
+def to_numpy_csr(graph):
+    """
+    Exporta los arcos del grafo como arreglos de NumPy en formato CSR.
+
+    Los arreglos se construyen sobre los de ``csr_arrays()`` con
+    ``numpy.frombuffer``, sin copiar los datos. NumPy es una dependencia
+    opcional: solo se importa al llamar esta función. Los algoritmos
+    vectorizados sobre este formato están en ``numpy_graph``.
+
+    Args:
+        graph (adj_list_graph): El grafo sobre el que se ejecuta la operacion
+
+    Returns:
+        dict: Estructura con ``indptr`` (int64, V + 1 posiciones), ``indices``
+        (int64), ``weights`` (float64), ``ids`` (mapa de llave a identificador)
+        y ``keys`` (lista de la llave de cada identificador)
+
+    Raises:
+        ImportError: Si NumPy no está instalado
+    """
+    import numpy as np
+
+    csr = csr_arrays(graph)
+    return {'indptr': np.frombuffer(csr['offsets'], dtype=np.int64),
+            'indices': np.frombuffer(csr['targets'], dtype=np.int64),
+            'weights': np.frombuffer(csr['weights'], dtype=np.float64),
+            'ids': graph['vertices'],
+            'keys': graph['keys'],
+            }
@@ -0,0 +1,133 @@
+"""
+  Búsqueda A* de un vértice a otro sobre un ``adj_list_graph``.
+
+  Es Dijkstra guiado por una heurística: en lugar de cerrar los vértices por
+  su distancia al origen, se cierran por distancia al origen más una cota
+  inferior de la distancia que falta hasta el destino. La heurística recibe
+  la información de dos vértices (la guardada con ``insert_vertex``) y debe
+  ser admisible y consistente (nunca sobreestimar el costo real) para que el
+  camino sea el de costo mínimo.
+"""
+
+import heapq
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+
+# Radio medio de la Tierra en kilómetros
+EARTH_RADIUS = 6371.0
+
+
+def astar(graph, source, target, heuristic=None):
+    """
+    Calcula el camino de costo mínimo de ``source`` a ``target`` con A*.
+
+    La heurística se evalúa como ``heuristic(info_vertex, info_target)`` sobre
+    la información de los vértices en ``graph['information']``, una sola vez
+    por vértice. Sin heurística la búsqueda es Dijkstra que se detiene al
+    cerrar el destino.
+
+    Retorna una estructura con los siguientes atributos:
+    - distance: Costo del camino mínimo (``math.inf`` si no hay camino)
+    - path: array_list con las llaves del camino de ``source`` a ``target``, o None
+    - settled: Número de vértices cerrados por la búsqueda
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer, con pesos no negativos
+        source (any): Llave del vértice de origen
+        target (any): Llave del vértice destino
+        heuristic (function, optional): Cota inferior del costo entre dos vértices,
+            por ejemplo ``great_circle()``
+
+    Returns:
+        dict: La estructura con el resultado, o None si algún vértice no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    target_id = gr.vertex_id(graph, target)
+    if source_id is None or target_id is None:
+        return None
+
+    num_vertex = lt.size(graph['keys'])
+    keys = graph['keys']['elements']
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+    dist = array('d', [math.inf]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    settled = bytearray(num_vertex)
+    # Valor de la heurística de cada vértice, NaN si aún no se ha calculado
+    estimate = array('d', [math.nan]) * num_vertex
+    target_info = mp.get(graph['information'], target)
+
+    dist[source_id] = 0.0
+    heap = [(0.0, source_id)]
+    num_settled = 0
+    while heap:
+        f, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = 1
+        num_settled += 1
+        if v == target_id:
+            break
+        d = dist[v]
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                edge_to[w] = v
+                h = 0.0
+                if heuristic is not None:
+                    h = estimate[w]
+                    if h != h:
+                        h = heuristic(mp.get(graph['information'], keys[w]), target_info)
+                        estimate[w] = h
+                heapq.heappush(heap, (nd + h, w))
+
+    if not settled[target_id]:
+        return {'distance': math.inf, 'path': None, 'settled': num_settled}
+    ids = dj.ids_path(edge_to, target_id)
+    ids.reverse()
+    return {'distance': dist[target_id],
+            'path': dj.keys_path(graph, ids),
+            'settled': num_settled,
+            }
+
+
+def great_circle(latitude='latitude', longitude='longitude', scale=1.0):
+    """
+    Crea una heurística de distancia de círculo máximo (haversine) entre
+    vértices cuya información es un diccionario con latitud y longitud en grados.
+
+    La distancia se retorna en kilómetros multiplicada por ``scale``; para que
+    sea admisible, ``scale`` debe convertir kilómetros a las unidades de los
+    pesos del grafo y ningún arco puede ser más corto que la distancia en
+    línea recta entre sus extremos. Si algún vértice no tiene coordenadas la
+    heurística vale cero.
+
+    Args:
+        latitude (str): Llave de la latitud en la información del vértice
+        longitude (str): Llave de la longitud en la información del vértice
+        scale (float): Factor de conversión de kilómetros a unidades del peso
+
+    Returns:
+        function: Heurística ``heuristic(info_a, info_b)``
+    """
+    def heuristic(info_a, info_b):
+        try:
+            lat_a = math.radians(float(info_a[latitude]))
+            lat_b = math.radians(float(info_b[latitude]))
+            delta_lat = lat_b - lat_a
+            delta_lon = math.radians(float(info_b[longitude]) - float(info_a[longitude]))
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+        a = (math.sin(delta_lat / 2) ** 2 +
+             math.cos(lat_a) * math.cos(lat_b) * math.sin(delta_lon / 2) ** 2)
+        return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a))) * scale
+    return heuristic
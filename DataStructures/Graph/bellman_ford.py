@@ -0,0 +1,197 @@
+"""
+  Caminos de costo mínimo con el algoritmo de Bellman-Ford sobre un
+  ``adj_list_graph`` que puede tener pesos negativos.
+
+  Se usa la versión basada en cola (SPFA): solo se relajan los arcos de los
+  vértices cuya distancia cambió en la pasada anterior, y el algoritmo
+  termina en cuanto la cola se vacía, sin completar las V - 1 pasadas. Cada V
+  relajaciones se busca un ciclo en el árbol de caminos (``edge_to``); si lo
+  hay, es un ciclo de costo negativo alcanzable desde el origen y la
+  búsqueda se detiene.
+
+  El resultado tiene la misma forma que el de ``dijkstra.dijkstra()``, por
+  lo que ``has_path_to``, ``dist_to`` y ``path_to`` de ambos módulos son
+  intercambiables. En un grafo no dirigido un arco de peso negativo es por
+  sí mismo un ciclo negativo.
+"""
+
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Lists import ring_array_list as queue
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+
+
+def bellman_ford(graph, source):
+    """
+    Calcula los caminos de costo mínimo desde ``source`` a todos los vértices.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - source: Llave del vértice de origen
+    - source_id: Identificador entero del vértice de origen
+    - dist_to: Arreglo con la distancia mínima desde ``source`` (``math.inf`` si no es alcanzable)
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - cycle: array_list con las llaves de un ciclo negativo alcanzable desde
+      ``source``, o None si no hay
+    - graph: El grafo recorrido
+
+    Si hay un ciclo negativo las distancias no están definidas y los valores
+    de ``dist_to`` y ``edge_to`` son los de la última relajación.
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    if source_id is None:
+        return None
+    num_vertex = lt.size(graph['keys'])
+    dist = array('d', [math.inf]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    on_queue = bytearray(num_vertex)
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+
+    pending = queue.new_list(num_vertex)
+    dist[source_id] = 0.0
+    queue.add_last(pending, source_id)
+    on_queue[source_id] = 1
+    relaxations = 0
+    cycle = None
+    while not queue.is_empty(pending) and cycle is None:
+        v = queue.remove_first(pending)
+        on_queue[v] = 0
+        d = dist[v]
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                edge_to[w] = v
+                if not on_queue[w]:
+                    queue.add_last(pending, w)
+                    on_queue[w] = 1
+        relaxations += 1
+        if relaxations % num_vertex == 0:
+            cycle = find_cycle(edge_to)
+
+    if cycle is not None:
+        cycle = dj.keys_path(graph, cycle)
+    return {'source': source,
+            'source_id': source_id,
+            'dist_to': dist,
+            'edge_to': edge_to,
+            'cycle': cycle,
+            'graph': graph,
+            }
+
+
+def find_cycle(edge_to):
+    """
+    Busca un ciclo en el grafo de vértices anteriores ``edge_to``.
+
+    Args:
+        edge_to (array): Vértice anterior de cada vértice (-1 si no tiene)
+
+    Returns:
+        list: Identificadores del ciclo en el sentido de los arcos, con el
+        primero repetido al final, o None si no hay ciclo
+    """
+    num_vertex = len(edge_to)
+    # Número del recorrido que visitó cada vértice (-1 si ninguno)
+    stamp = array('q', [-1]) * num_vertex
+    for start in range(num_vertex):
+        v = start
+        while v != -1 and stamp[v] == -1:
+            stamp[v] = start
+            v = edge_to[v]
+        if v != -1 and stamp[v] == start:
+            # v está en un ciclo: se recorre hacia atrás y se invierte
+            cycle = [v]
+            w = edge_to[v]
+            while w != v:
+                cycle.append(w)
+                w = edge_to[w]
+            cycle.append(v)
+            cycle.reverse()
+            return cycle
+    return None
+
+
+def has_negative_cycle(search):
+    """
+    Indica si la búsqueda encontró un ciclo de costo negativo.
+
+    Args:
+        search (dict): Estructura retornada por ``bellman_ford()``
+
+    Returns:
+        bool: True si hay un ciclo negativo alcanzable desde el origen
+    """
+    return search['cycle'] is not None
+
+
+def negative_cycle(search):
+    """
+    Retorna el ciclo de costo negativo encontrado por la búsqueda.
+
+    Args:
+        search (dict): Estructura retornada por ``bellman_ford()``
+
+    Returns:
+        array_list: Llaves de los vértices del ciclo en el sentido de sus
+        arcos, con el primero repetido al final, o None si no hay ciclo
+    """
+    return search['cycle']
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde el origen de la búsqueda hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bellman_ford()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        bool: True si ``vertex`` es alcanzable desde el origen
+    """
+    return dj.has_path_to(search, vertex)
+
+
+def dist_to(search, vertex):
+    """
+    Retorna el costo del camino mínimo desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bellman_ford()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        float: Costo del camino, o ``math.inf`` si no hay camino
+    """
+    return dj.dist_to(search, vertex)
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino de costo mínimo desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bellman_ford()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        array_list: Llaves de los vértices del camino, desde el origen hasta ``vertex``,
+        o None si no hay camino o si la búsqueda encontró un ciclo negativo
+    """
+    if search['cycle'] is not None:
+        return None
+    return dj.path_to(search, vertex)
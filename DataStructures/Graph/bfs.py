@@ -0,0 +1,125 @@
+"""
+  Recorrido en anchura (Breadth First Search) sobre un ``adj_list_graph``.
+
+  El recorrido es iterativo: usa una cola ``ring_array_list`` y marca los
+  vértices visitados en un ``bytearray`` indexado por el identificador entero
+  de cada vértice (ver ``adj_list_graph.vertex_id``).
+"""
+
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Lists import ring_array_list as queue
+from DataStructures.Graph import adj_list_graph as gr
+
+
+def bfs(graph, source):
+    """
+    Recorre el grafo en anchura a partir del vértice ``source``.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - source: Llave del vértice de origen
+    - source_id: Identificador entero del vértice de origen
+    - visited: bytearray con 1 en los vértices alcanzables desde ``source``
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - dist_to: Arreglo con el número de arcos del camino más corto desde ``source`` (-1 si no es alcanzable)
+    - graph: El grafo recorrido
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    if source_id is None:
+        return None
+    num_vertex = lt.size(graph['keys'])
+    visited = bytearray(num_vertex)
+    edge_to = array('q', [-1]) * num_vertex
+    dist_to = array('q', [-1]) * num_vertex
+    adj_ids = graph['adj_ids']['elements']
+
+    pending = queue.new_list(num_vertex)
+    visited[source_id] = 1
+    dist_to[source_id] = 0
+    queue.add_last(pending, source_id)
+    while not queue.is_empty(pending):
+        v = queue.remove_first(pending)
+        next_dist = dist_to[v] + 1
+        for w in adj_ids[v]['elements']:
+            if not visited[w]:
+                visited[w] = 1
+                edge_to[w] = v
+                dist_to[w] = next_dist
+                queue.add_last(pending, w)
+
+    return {'source': source,
+            'source_id': source_id,
+            'visited': visited,
+            'edge_to': edge_to,
+            'dist_to': dist_to,
+            'graph': graph,
+            }
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde el origen de la búsqueda hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bfs()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        bool: True si ``vertex`` es alcanzable desde el origen
+    """
+    vid = gr.vertex_id(search['graph'], vertex)
+    if vid is None or vid >= len(search['visited']):
+        return False
+    return search['visited'][vid] == 1
+
+
+def dist_to(search, vertex):
+    """
+    Retorna el número de arcos del camino más corto desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bfs()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        int: Número de arcos del camino, o ``math.inf`` si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return math.inf
+    return search['dist_to'][gr.vertex_id(search['graph'], vertex)]
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino con menos arcos desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``bfs()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        array_list: Llaves de los vértices del camino, desde el origen hasta ``vertex``,
+        o None si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return None
+    graph = search['graph']
+    edge_to = search['edge_to']
+    ids = []
+    v = gr.vertex_id(graph, vertex)
+    while v != -1:
+        ids.append(v)
+        v = edge_to[v]
+    path = lt.new_list()
+    for v in reversed(ids):
+        lt.add_last(path, gr.vertex_key(graph, v))
+    return path
@@ -0,0 +1,419 @@
+"""
+  Medidas de centralidad de los vértices de un ``adj_list_graph``.
+
+  - ``degree_centrality()``: grado de cada vértice, leído de las listas de
+    adyacencia y del grado de entrada que mantiene el grafo, O(1) por vértice.
+  - ``pagerank()``: iteración de potencia sobre los arreglos CSR del grafo
+    (con NumPy, si está instalado, usa ``numpy_graph.pagerank()``).
+  - ``closeness_centrality()``: un BFS desde cada vértice de origen; la
+    cercanía es el inverso de la distancia promedio (en número de arcos) a
+    los vértices alcanzables.
+  - ``betweenness_centrality()``: algoritmo de Brandes, exacto o aproximado
+    con una muestra de orígenes.
+
+  Closeness y betweenness hacen una búsqueda por cada origen: los orígenes
+  se reparten en bloques entre los procesos de un ``ProcessPoolExecutor``
+  (el grafo congelado en arreglos CSR se envía una sola vez a cada proceso)
+  y el avance se informa con la función ``progress(done, total)``.
+
+  Todas retornan una estructura con el puntaje de cada vértice indexado por
+  su identificador entero; ``score()`` y ``ranking()`` la consultan por llave.
+"""
+
+import heapq
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+
+# Número mínimo de orígenes para repartir las búsquedas en varios procesos
+PARALLEL_SOURCES_THRESHOLD = 64
+
+# Grafo congelado de cada proceso, asignado por ``init_worker()``
+worker_state = None
+
+
+def new_centrality(graph, measure, scores):
+    """
+    Crea la estructura de resultado de una medida de centralidad.
+    """
+    return {'measure': measure,
+            'scores': scores,
+            'graph': graph,
+            'type': 'CENTRALITY',
+            }
+
+
+def degree_centrality(graph, mode='out', normalized=True):
+    """
+    Calcula la centralidad de grado de todos los vértices.
+
+    Args:
+        graph (adj_list_graph): El grafo
+        mode (str): ``'out'`` (arcos que salen), ``'in'`` (arcos que llegan) o
+            ``'total'`` (ambos). En un grafo no dirigido los tres coinciden
+            salvo ``'total'``, que cuenta cada arco dos veces.
+        normalized (bool): Si es True el grado se divide entre ``V - 1``
+
+    Returns:
+        dict: La centralidad, con el grado de cada vértice en ``scores``
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    keys = graph['keys']['elements']
+    scores = array('d', [0.0]) * num_vertex
+    for v in range(num_vertex):
+        out_degree = gr.degree(graph, keys[v])
+        if mode == 'out' or (mode == 'in' and not graph['directed']):
+            scores[v] = out_degree
+        elif mode == 'in':
+            scores[v] = gr.in_degree(graph, keys[v])
+        else:
+            scores[v] = out_degree + (gr.in_degree(graph, keys[v]) if graph['directed'] else out_degree)
+    if normalized and num_vertex > 1:
+        for v in range(num_vertex):
+            scores[v] /= num_vertex - 1
+    return new_centrality(graph, 'degree', scores)
+
+
+def pagerank(graph, damping=0.85, tolerance=1e-10, max_iterations=100, weighted=False):
+    """
+    Calcula el PageRank de todos los vértices por iteración de potencia.
+
+    Cada vértice reparte su puntaje entre sus vecinos (en proporción al peso
+    de los arcos si ``weighted`` es True); los vértices sin arcos de salida lo
+    reparten entre todos. Si NumPy está instalado el cálculo se hace con
+    ``numpy_graph.pagerank()``.
+
+    Args:
+        graph (adj_list_graph): El grafo
+        damping (float): Probabilidad de seguir un arco en lugar de saltar a un vértice al azar
+        tolerance (float): Suma mínima de los cambios para seguir iterando
+        max_iterations (int): Número máximo de iteraciones
+        weighted (bool): Si es True se usan los pesos (no negativos) de los arcos
+
+    Returns:
+        dict: La centralidad, con el puntaje de cada vértice en ``scores`` (suman 1)
+    """
+    try:
+        from DataStructures.Graph import numpy_graph
+    except ImportError:
+        numpy_graph = None
+    if numpy_graph is not None:
+        rank = numpy_graph.pagerank(gr.to_numpy_csr(graph), damping, tolerance,
+                                    max_iterations, weighted)
+        return new_centrality(graph, 'pagerank', array('d', rank.tobytes()))
+
+    csr = gr.csr_arrays(graph)
+    offsets = csr['offsets']
+    targets = csr['targets']
+    weights = csr['weights']
+    num_vertex = len(offsets) - 1
+    if num_vertex == 0:
+        return new_centrality(graph, 'pagerank', array('d'))
+    # Fracción del puntaje de cada vértice que recibe cada uno de sus arcos
+    share = array('d', [0.0]) * len(targets)
+    dangling = []
+    for v in range(num_vertex):
+        start, end = offsets[v], offsets[v + 1]
+        total = sum(weights[start:end]) if weighted else end - start
+        if total == 0:
+            dangling.append(v)
+            continue
+        for i in range(start, end):
+            share[i] = (weights[i] if weighted else 1.0) / total
+
+    rank = array('d', [1.0 / num_vertex]) * num_vertex
+    for iteration in range(max_iterations):
+        base = (1.0 - damping) / num_vertex + damping * sum(rank[v] for v in dangling) / num_vertex
+        new_rank = array('d', [base]) * num_vertex
+        for v in range(num_vertex):
+            contribution = damping * rank[v]
+            for i in range(offsets[v], offsets[v + 1]):
+                new_rank[targets[i]] += contribution * share[i]
+        change = sum(abs(new_rank[v] - rank[v]) for v in range(num_vertex))
+        rank = new_rank
+        if change < tolerance:
+            break
+    return new_centrality(graph, 'pagerank', rank)
+
+
+def closeness_centrality(graph, processes=1, progress=None):
+    """
+    Calcula la centralidad de cercanía de todos los vértices con un BFS
+    desde cada uno.
+
+    La cercanía de ``v`` es ``(r - 1) / suma`` por ``(r - 1) / (V - 1)``, donde
+    ``r`` es el número de vértices alcanzables desde ``v`` (incluido ``v``) y
+    ``suma`` la suma de sus distancias en número de arcos. El segundo factor
+    (Wasserman y Faust) evita que un vértice de un componente pequeño
+    parezca central. Un vértice que no alcanza a nadie tiene cercanía 0.
+
+    Args:
+        graph (adj_list_graph): El grafo
+        processes (int, optional): Número de procesos (por defecto 1; None usa
+            ``os.cpu_count()``)
+        progress (function, optional): Función ``progress(done, total)`` llamada
+            al terminar cada bloque de orígenes
+
+    Returns:
+        dict: La centralidad, con la cercanía de cada vértice en ``scores``
+    """
+    num_vertex = vertex_count(graph)
+    sources = list(range(num_vertex))
+    scores = array('d', [0.0]) * num_vertex
+    for partial in run_sources(graph, sources, closeness_chunk, processes, progress, weighted=False):
+        for v, value in partial:
+            scores[v] = value
+    return new_centrality(graph, 'closeness', scores)
+
+
+def betweenness_centrality(graph, samples=None, weighted=False, normalized=False,
+                           seed=None, processes=1, progress=None):
+    """
+    Calcula la centralidad de intermediación de todos los vértices con el
+    algoritmo de Brandes.
+
+    Para cada origen se hace una búsqueda que cuenta los caminos mínimos
+    (BFS, o Dijkstra si ``weighted`` es True) y se acumula, en orden inverso
+    de distancia, la fracción de esos caminos que pasa por cada vértice. Con
+    ``samples`` se usa solo esa cantidad de orígenes elegidos al azar y el
+    resultado se escala por ``V / samples``, una aproximación sin sesgo.
+
+    En un grafo no dirigido cada par de vértices se cuenta una sola vez.
+
+    Args:
+        graph (adj_list_graph): El grafo
+        samples (int, optional): Número de orígenes de la muestra (por defecto, todos)
+        weighted (bool): Si es True se usan los pesos de los arcos, que deben ser positivos
+        normalized (bool): Si es True se divide entre el número de pares ``(V - 1)(V - 2)``
+            (la mitad en un grafo no dirigido)
+        seed (int, optional): Semilla para elegir la muestra
+        processes (int, optional): Número de procesos (por defecto 1; None usa
+            ``os.cpu_count()``)
+        progress (function, optional): Función ``progress(done, total)`` llamada
+            al terminar cada bloque de orígenes
+
+    Returns:
+        dict: La centralidad, con la intermediación de cada vértice en ``scores``
+    """
+    num_vertex = vertex_count(graph)
+    sources = list(range(num_vertex))
+    if samples is not None and samples < num_vertex:
+        sources = random.Random(seed).sample(sources, samples)
+    scores = array('d', [0.0]) * num_vertex
+    for partial in run_sources(graph, sources, betweenness_chunk, processes, progress, weighted):
+        for v in range(num_vertex):
+            scores[v] += partial[v]
+
+    scale = num_vertex / len(sources) if sources else 1.0
+    if not graph['directed']:
+        scale /= 2
+    if normalized and num_vertex > 2:
+        pairs = (num_vertex - 1) * (num_vertex - 2)
+        scale /= pairs if graph['directed'] else pairs / 2
+    for v in range(num_vertex):
+        scores[v] *= scale
+    return new_centrality(graph, 'betweenness', scores)
+
+
+def score(centrality, vertex):
+    """
+    Retorna el puntaje de ``vertex``.
+
+    Args:
+        centrality (dict): Estructura retornada por una de las medidas
+        vertex (any): Llave del vértice
+
+    Returns:
+        float: El puntaje, o None si el vértice no estaba en el grafo
+    """
+    vid = gr.vertex_id(centrality['graph'], vertex)
+    if vid is None or vid >= len(centrality['scores']):
+        return None
+    return centrality['scores'][vid]
+
+
+def ranking(centrality, k=None):
+    """
+    Retorna los vértices de mayor puntaje, de mayor a menor.
+
+    Args:
+        centrality (dict): Estructura retornada por una de las medidas
+        k (int, optional): Número de vértices a retornar (por defecto, todos)
+
+    Returns:
+        array_list: Llaves de los vértices ordenadas por puntaje descendente
+    """
+    scores = centrality['scores']
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    if k is not None:
+        order = order[:k]
+    result = lt.new_list()
+    for v in order:
+        lt.add_last(result, gr.vertex_key(centrality['graph'], v))
+    return result
+
+
+def vertex_count(graph):
+    """
+    Actualiza el índice de identificadores del grafo y retorna su número de vértices.
+    """
+    gr.update_vertex_index(graph)
+    return lt.size(graph['keys'])
+
+
+def run_sources(graph, sources, chunk_function, processes, progress, weighted):
+    """
+    Ejecuta ``chunk_function(csr, chunk, weighted)`` sobre bloques de
+    ``sources``, en el proceso actual o en un ``ProcessPoolExecutor``, e
+    informa el avance. Retorna los resultados parciales de cada bloque.
+    """
+    csr = gr.csr_arrays(graph)
+    total = len(sources)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    parallel = processes > 1 and total >= PARALLEL_SOURCES_THRESHOLD
+    # Bloques pequeños para informar el avance, sin exceder 100 avisos
+    chunk_size = max(1, -(-total // (processes * 8 if parallel else 100)))
+    chunks = [sources[i:i + chunk_size] for i in range(0, total, chunk_size)]
+
+    results = []
+    done = 0
+    if not parallel:
+        for chunk in chunks:
+            results.append(chunk_function(csr, chunk, weighted))
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total)
+        return results
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_worker,
+                             initargs=(csr,)) as executor:
+        futures = {}
+        for chunk in chunks:
+            futures[executor.submit(worker_chunk, chunk_function, chunk, weighted)] = len(chunk)
+        for future in as_completed(futures):
+            results.append(future.result())
+            done += futures[future]
+            if progress is not None:
+                progress(done, total)
+    return results
+
+
+def init_worker(csr):
+    """
+    Guarda el grafo congelado en el proceso, es llamada una vez al crear cada proceso.
+    """
+    global worker_state
+    worker_state = csr
+
+
+def worker_chunk(chunk_function, chunk, weighted):
+    """
+    Ejecuta un bloque de orígenes en un proceso con el grafo de ``init_worker()``.
+    """
+    return chunk_function(worker_state, chunk, weighted)
+
+
+def closeness_chunk(csr, chunk, weighted):
+    """
+    Calcula la cercanía de los vértices de ``chunk``.
+
+    Returns:
+        list: Parejas ``(vértice, cercanía)``
+    """
+    offsets = csr['offsets']
+    targets = csr['targets']
+    num_vertex = len(offsets) - 1
+    result = []
+    for source in chunk:
+        dist = array('q', [-1]) * num_vertex
+        dist[source] = 0
+        frontier = [source]
+        reached = 1
+        total = 0
+        while frontier:
+            next_frontier = []
+            for v in frontier:
+                d = dist[v] + 1
+                for i in range(offsets[v], offsets[v + 1]):
+                    w = targets[i]
+                    if dist[w] == -1:
+                        dist[w] = d
+                        total += d
+                        reached += 1
+                        next_frontier.append(w)
+            frontier = next_frontier
+        value = 0.0
+        if total > 0:
+            value = (reached - 1) / total * (reached - 1) / (num_vertex - 1)
+        result.append((source, value))
+    return result
+
+
+def betweenness_chunk(csr, chunk, weighted):
+    """
+    Acumula la dependencia de Brandes de los orígenes de ``chunk``.
+
+    Returns:
+        array: Suma de las dependencias de cada vértice
+    """
+    offsets = csr['offsets']
+    targets = csr['targets']
+    weights = csr['weights']
+    num_vertex = len(offsets) - 1
+    partial = array('d', [0.0]) * num_vertex
+    for source in chunk:
+        dist = array('d', [math.inf]) * num_vertex
+        sigma = array('d', [0.0]) * num_vertex
+        delta = array('d', [0.0]) * num_vertex
+        dist[source] = 0.0
+        sigma[source] = 1.0
+        # Vértices en orden no decreciente de distancia
+        order = []
+        if weighted:
+            settled = bytearray(num_vertex)
+            heap = [(0.0, source)]
+            while heap:
+                d, v = heapq.heappop(heap)
+                if settled[v]:
+                    continue
+                settled[v] = 1
+                order.append(v)
+                for i in range(offsets[v], offsets[v + 1]):
+                    w = targets[i]
+                    nd = d + weights[i]
+                    if nd < dist[w]:
+                        dist[w] = nd
+                        sigma[w] = sigma[v]
+                        heapq.heappush(heap, (nd, w))
+                    elif nd == dist[w] and not settled[w]:
+                        sigma[w] += sigma[v]
+        else:
+            order.append(source)
+            pos = 0
+            while pos < len(order):
+                v = order[pos]
+                pos += 1
+                nd = dist[v] + 1
+                for i in range(offsets[v], offsets[v + 1]):
+                    w = targets[i]
+                    if dist[w] == math.inf:
+                        dist[w] = nd
+                        order.append(w)
+                    if dist[w] == nd:
+                        sigma[w] += sigma[v]
+        # Dependencias en orden inverso: cada vértice reparte hacia sus predecesores
+        for w in reversed(order):
+            for i in range(offsets[w], offsets[w + 1]):
+                v = targets[i]
+                step = weights[i] if weighted else 1.0
+                if dist[v] == dist[w] + step:
+                    delta[w] += sigma[w] / sigma[v] * (1.0 + delta[v])
+            if w != source:
+                partial[w] += delta[w]
+    return partial
@@ -0,0 +1,494 @@
+"""
+  Jerarquías de contracción (Contraction Hierarchies) sobre un ``adj_list_graph``.
+
+  Es una técnica para responder muchas consultas de camino mínimo de un
+  vértice a otro sobre un grafo que no cambia:
+
+  - ``build_hierarchy()`` es el preprocesamiento: ordena los vértices por
+    importancia y los contrae uno a uno. Al contraer ``v`` se agrega un atajo
+    ``u -> w`` por cada camino ``u -> v -> w`` que sea el único camino mínimo
+    entre ``u`` y ``w`` (no hay un "testigo" más corto que evite ``v``). El
+    resultado son dos grafos en formato CSR (arreglos de desplazamientos,
+    vecinos y pesos): el ascendente, con los arcos hacia vértices de mayor
+    rango, y el descendente, con los arcos de entrada desde vértices de mayor
+    rango.
+  - ``distance()`` y ``shortest_path()`` hacen un Dijkstra bidireccional que
+    solo sube en la jerarquía, por lo que cierran unos pocos cientos de
+    vértices aún en grafos grandes. ``shortest_path()`` expande los atajos
+    para retornar el camino en el grafo original.
+  - ``save()`` y ``load()`` guardan y recuperan la jerarquía en un archivo.
+
+  La jerarquía es una copia: si el grafo cambia hay que construirla de nuevo.
+  Requiere pesos no negativos.
+"""
+
+import heapq
+import math
+import json
+import sys
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Graph import adj_list_graph as gr
+
+# Máximo de vértices que cierra cada búsqueda de testigos. Un límite menor
+# acelera el preprocesamiento a cambio de agregar atajos innecesarios, que
+# no afectan la corrección de las consultas.
+WITNESS_SETTLE_LIMIT = 60
+
+# Peso de la diferencia de arcos en la prioridad de contracción
+EDGE_DIFFERENCE_FACTOR = 2
+
+FORMAT_VERSION = 2
+
+# Primeros bytes de los archivos de ``save()``
+FILE_MAGIC = b'ADJCH\x00'
+
+# Tipo de cada arreglo del archivo, en el orden en que se escriben: rango,
+# grafo ascendente, grafo descendente y los atajos (origen, destino, medio)
+SECTION_TYPES = ('q', 'q', 'q', 'd', 'q', 'q', 'd', 'q', 'q', 'q')
+
+
+def build_hierarchy(graph, witness_limit=WITNESS_SETTLE_LIMIT):
+    """
+    Construye la jerarquía de contracción del grafo.
+
+    El orden de contracción usa como prioridad la diferencia de arcos (atajos
+    agregados menos arcos eliminados), el número de vecinos ya contraídos y el
+    nivel del vértice en la jerarquía, y se actualiza de forma perezosa al
+    sacar cada vértice de la cola.
+
+    Retorna una estructura con los siguientes atributos:
+    - keys: array_list con la llave de cada identificador
+    - ids: Mapa de llave a identificador
+    - rank: Arreglo con la posición de cada vértice en el orden de contracción
+    - up_offsets, up_targets, up_weights: Grafo ascendente en formato CSR
+    - down_offsets, down_targets, down_weights: Grafo descendente en formato CSR
+    - middle: Diccionario ``(u, w) -> v`` con el vértice intermedio de cada atajo
+    - shortcuts: Número de atajos agregados
+
+    Args:
+        graph (adj_list_graph): El grafo a preprocesar, con pesos no negativos
+        witness_limit (int): Máximo de vértices cerrados por búsqueda de testigos
+
+    Returns:
+        dict: La jerarquía de contracción
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    reverse = gr.reverse_index(graph)
+    out_edges = adjacency_dicts(graph['adj_ids'], graph['adj_weights'], num_vertex)
+    in_edges = adjacency_dicts(reverse['adj_ids'], reverse['adj_weights'], num_vertex)
+
+    rank = array('q', [-1]) * num_vertex
+    contracted_neighbors = array('q', [0]) * num_vertex
+    level = array('q', [0]) * num_vertex
+    up = [None] * num_vertex
+    down = [None] * num_vertex
+    middle = {}
+
+    heap = []
+    for v in range(num_vertex):
+        shortcuts = find_shortcuts(out_edges, in_edges, v, witness_limit)
+        heap.append((priority(out_edges, in_edges, contracted_neighbors, level, v, shortcuts), v))
+    heapq.heapify(heap)
+
+    order = 0
+    while heap:
+        old_priority, v = heapq.heappop(heap)
+        if rank[v] != -1:
+            continue
+        # Actualización perezosa: si la prioridad empeoró, el vértice vuelve a la cola
+        shortcuts = find_shortcuts(out_edges, in_edges, v, witness_limit)
+        new_priority = priority(out_edges, in_edges, contracted_neighbors, level, v, shortcuts)
+        if heap and new_priority > heap[0][0]:
+            heapq.heappush(heap, (new_priority, v))
+            continue
+
+        rank[v] = order
+        order += 1
+        up[v] = out_edges[v]
+        down[v] = in_edges[v]
+        for w in out_edges[v]:
+            del in_edges[w][v]
+            contracted_neighbors[w] += 1
+            level[w] = max(level[w], level[v] + 1)
+        for u in in_edges[v]:
+            del out_edges[u][v]
+            contracted_neighbors[u] += 1
+            level[u] = max(level[u], level[v] + 1)
+        out_edges[v] = None
+        in_edges[v] = None
+        for u, w, weight in shortcuts:
+            if weight < out_edges[u].get(w, math.inf):
+                out_edges[u][w] = weight
+                in_edges[w][u] = weight
+                middle[(u, w)] = v
+
+    keys = lt.new_list()
+    for v in range(num_vertex):
+        lt.add_last(keys, gr.vertex_key(graph, v))
+    up_offsets, up_targets, up_weights = csr_arrays(up)
+    down_offsets, down_targets, down_weights = csr_arrays(down)
+    return new_hierarchy(keys, rank, up_offsets, up_targets, up_weights,
+                         down_offsets, down_targets, down_weights, middle)
+
+
+def new_hierarchy(keys, rank, up_offsets, up_targets, up_weights,
+                  down_offsets, down_targets, down_weights, middle):
+    """
+    Crea la estructura de la jerarquía a partir de sus arreglos y construye
+    el mapa de llaves a identificadores.
+    """
+    ids = mp.new_map(max(lt.size(keys), 1), 0.5)
+    for v in range(lt.size(keys)):
+        mp.put(ids, lt.get_element(keys, v), v)
+    return {'keys': keys,
+            'ids': ids,
+            'rank': rank,
+            'up_offsets': up_offsets,
+            'up_targets': up_targets,
+            'up_weights': up_weights,
+            'down_offsets': down_offsets,
+            'down_targets': down_targets,
+            'down_weights': down_weights,
+            'middle': middle,
+            'shortcuts': len(middle),
+            'type': 'CONTRACTION_HIERARCHY',
+            }
+
+
+def adjacency_dicts(adj_ids, adj_weights, num_vertex):
+    """
+    Copia las listas de adyacencia en diccionarios ``vecino -> peso`` sin
+    lazos, conservando el menor peso entre arcos paralelos.
+    """
+    result = []
+    for v in range(num_vertex):
+        neighbors = lt.get_element(adj_ids, v)['elements']
+        weights = lt.get_element(adj_weights, v)['elements']
+        edges = {}
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            if w != v and weights[i] < edges.get(w, math.inf):
+                edges[w] = weights[i]
+        result.append(edges)
+    return result
+
+
+def find_shortcuts(out_edges, in_edges, v, witness_limit):
+    """
+    Retorna los atajos ``(u, w, peso)`` necesarios para contraer ``v``.
+    """
+    shortcuts = []
+    outgoing = out_edges[v]
+    if not outgoing:
+        return shortcuts
+    max_out = max(outgoing.values())
+    for u, weight_uv in in_edges[v].items():
+        witness = witness_search(out_edges, u, v, weight_uv + max_out, witness_limit)
+        for w, weight_vw in outgoing.items():
+            if w == u:
+                continue
+            weight = weight_uv + weight_vw
+            if witness.get(w, math.inf) > weight:
+                shortcuts.append((u, w, weight))
+    return shortcuts
+
+
+def witness_search(out_edges, source, excluded, max_dist, witness_limit):
+    """
+    Dijkstra local desde ``source`` que evita ``excluded`` y se detiene al
+    superar ``max_dist`` o al cerrar ``witness_limit`` vértices.
+    """
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap and settled < witness_limit:
+        d, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        if d > max_dist:
+            break
+        settled += 1
+        for y, weight in out_edges[x].items():
+            if y == excluded:
+                continue
+            nd = d + weight
+            if nd < dist.get(y, math.inf):
+                dist[y] = nd
+                heapq.heappush(heap, (nd, y))
+    return dist
+
+
+def priority(out_edges, in_edges, contracted_neighbors, level, v, shortcuts):
+    """
+    Prioridad de contracción de ``v``: los vértices con menor prioridad se
+    contraen primero.
+    """
+    edge_difference = len(shortcuts) - len(out_edges[v]) - len(in_edges[v])
+    return EDGE_DIFFERENCE_FACTOR * edge_difference + contracted_neighbors[v] + level[v]
+
+
+def csr_arrays(edges):
+    """
+    Convierte una lista de diccionarios ``vecino -> peso`` en arreglos CSR.
+    """
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('d')
+    for vertex_edges in edges:
+        targets.extend(vertex_edges.keys())
+        weights.extend(vertex_edges.values())
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+def num_shortcuts(ch):
+    """
+    Retorna el número de atajos agregados por el preprocesamiento.
+
+    Args:
+        ch (dict): Jerarquía retornada por ``build_hierarchy()``
+
+    Returns:
+        int: Número de atajos
+    """
+    return ch['shortcuts']
+
+
+def distance(ch, source, target):
+    """
+    Retorna el costo del camino mínimo de ``source`` a ``target``.
+
+    Args:
+        ch (dict): Jerarquía retornada por ``build_hierarchy()`` o ``load()``
+        source (any): Llave del vértice de origen
+        target (any): Llave del vértice destino
+
+    Returns:
+        float: Costo del camino, ``math.inf`` si no hay camino, o None si algún
+        vértice no está en la jerarquía
+    """
+    result = search(ch, source, target)
+    if result is None:
+        return None
+    return result[0]
+
+
+def shortest_path(ch, source, target):
+    """
+    Calcula el camino de costo mínimo de ``source`` a ``target``, con los
+    atajos expandidos en los arcos del grafo original.
+
+    Retorna una estructura con los siguientes atributos:
+    - distance: Costo del camino mínimo (``math.inf`` si no hay camino)
+    - path: array_list con las llaves del camino de ``source`` a ``target``, o None
+    - settled: Número de vértices cerrados por las dos búsquedas
+
+    Args:
+        ch (dict): Jerarquía retornada por ``build_hierarchy()`` o ``load()``
+        source (any): Llave del vértice de origen
+        target (any): Llave del vértice destino
+
+    Returns:
+        dict: La estructura con el resultado, o None si algún vértice no está en la jerarquía
+    """
+    result = search(ch, source, target)
+    if result is None:
+        return None
+    mu, meeting, edge_to, settled = result
+    if meeting is None:
+        return {'distance': math.inf, 'path': None, 'settled': settled}
+    ids = []
+    v = meeting
+    while v != -1:
+        ids.append(v)
+        v = edge_to[0].get(v, -1)
+    ids.reverse()
+    v = edge_to[1].get(meeting, -1)
+    while v != -1:
+        ids.append(v)
+        v = edge_to[1].get(v, -1)
+
+    keys = ch['keys']
+    path = lt.new_list()
+    lt.add_last(path, lt.get_element(keys, ids[0]))
+    for i in range(1, len(ids)):
+        for v in unpack_edge(ch['middle'], ids[i - 1], ids[i]):
+            lt.add_last(path, lt.get_element(keys, v))
+    return {'distance': mu, 'path': path, 'settled': settled}
+
+
+def search(ch, source, target):
+    """
+    Dijkstra bidireccional sobre los grafos ascendente y descendente.
+
+    Returns:
+        tuple: ``(mu, meeting, edge_to, settled)`` con el costo mínimo, el
+        vértice donde se unen las búsquedas (None si no hay camino), los
+        diccionarios de vértice anterior de cada búsqueda y el número de
+        vértices cerrados; o None si algún vértice no está en la jerarquía
+    """
+    source_id = mp.get(ch['ids'], source)
+    target_id = mp.get(ch['ids'], target)
+    if source_id is None or target_id is None:
+        return None
+
+    graphs = ((ch['up_offsets'], ch['up_targets'], ch['up_weights']),
+              (ch['down_offsets'], ch['down_targets'], ch['down_weights']))
+    dist = ({source_id: 0.0}, {target_id: 0.0})
+    edge_to = ({}, {})
+    heaps = ([(0.0, source_id)], [(0.0, target_id)])
+    mu = 0.0 if source_id == target_id else math.inf
+    meeting = source_id if source_id == target_id else None
+    settled = 0
+    side = 0
+    # Cada búsqueda termina cuando su mínimo no puede mejorar ``mu``
+    while (heaps[0] and heaps[0][0][0] < mu) or (heaps[1] and heaps[1][0][0] < mu):
+        if not heaps[side] or heaps[side][0][0] >= mu:
+            side = 1 - side
+        d, v = heapq.heappop(heaps[side])
+        my_dist = dist[side]
+        if d > my_dist[v]:
+            continue
+        settled += 1
+        other = dist[1 - side].get(v)
+        if other is not None and d + other < mu:
+            mu = d + other
+            meeting = v
+        # Stall-on-demand: si un vértice de mayor rango ya alcanzado llega a
+        # ``v`` con menor costo, ``d`` no es su distancia y no se expande
+        offsets, targets, weights = graphs[1 - side]
+        stalled = False
+        for i in range(offsets[v], offsets[v + 1]):
+            u = my_dist.get(targets[i])
+            if u is not None and u + weights[i] < d:
+                stalled = True
+                break
+        if not stalled:
+            offsets, targets, weights = graphs[side]
+            my_edge_to = edge_to[side]
+            for i in range(offsets[v], offsets[v + 1]):
+                w = targets[i]
+                nd = d + weights[i]
+                if nd < my_dist.get(w, math.inf):
+                    my_dist[w] = nd
+                    my_edge_to[w] = v
+                    heapq.heappush(heaps[side], (nd, w))
+        side = 1 - side
+    return mu, meeting, edge_to, settled
+
+
+def unpack_edge(middle, u, w):
+    """
+    Expande el arco ``u -> w`` de la jerarquía en arcos del grafo original.
+
+    Returns:
+        list: Identificadores de los vértices después de ``u`` hasta ``w``
+    """
+    result = []
+    pending = [(u, w)]
+    while pending:
+        a, b = pending.pop()
+        m = middle.get((a, b))
+        if m is None:
+            result.append(b)
+        else:
+            pending.append((m, b))
+            pending.append((a, m))
+    return result
+
+
+def save(ch, filename):
+    """
+    Guarda la jerarquía en el archivo ``filename``.
+
+    El archivo tiene un encabezado (``FILE_MAGIC`` y un arreglo con la
+    versión, el orden de bytes y el tamaño de cada sección), las llaves en
+    JSON y los arreglos CSR escritos con ``array.tofile()``. No se usa
+    ``pickle``, así que cargar un archivo nunca ejecuta código. El mapa de
+    llaves a identificadores se reconstruye al cargar porque depende de la
+    función hash de cada ejecución.
+
+    Args:
+        ch (dict): Jerarquía retornada por ``build_hierarchy()``
+        filename (str): Ruta del archivo a escribir
+
+    Raises:
+        ValueError: Si alguna llave no es ``str``, ``int`` o ``float``
+    """
+    keys = list(ch['keys']['elements'][:lt.size(ch['keys'])])
+    for key in keys:
+        if type(key) not in (str, int, float):
+            raise ValueError('Las llaves deben ser str, int o float para guardar la jerarquía')
+    encoded_keys = json.dumps(keys).encode('utf-8')
+    middle = ch['middle']
+    sections = [ch['rank'],
+                ch['up_offsets'], ch['up_targets'], ch['up_weights'],
+                ch['down_offsets'], ch['down_targets'], ch['down_weights'],
+                array('q', [pair[0] for pair in middle]),
+                array('q', [pair[1] for pair in middle]),
+                array('q', middle.values())]
+    header = array('q', [FORMAT_VERSION, sys.byteorder == 'little', len(encoded_keys)])
+    header.extend(len(section) for section in sections)
+    with open(filename, 'wb') as file:
+        file.write(FILE_MAGIC)
+        header.tofile(file)
+        file.write(encoded_keys)
+        for section in sections:
+            section.tofile(file)
+
+
+def load(filename):
+    """
+    Carga una jerarquía guardada con ``save()``.
+
+    Solo se leen arreglos de números y una lista JSON de llaves, por lo que
+    un archivo corrupto o ajeno produce un error y no ejecuta código.
+
+    Args:
+        filename (str): Ruta del archivo a leer
+
+    Returns:
+        dict: La jerarquía de contracción
+
+    Raises:
+        ValueError: Si el archivo no es una jerarquía de una versión compatible
+    """
+    try:
+        with open(filename, 'rb') as file:
+            if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                raise ValueError('El archivo no contiene una jerarquía de contracción')
+            header = array('q')
+            header.fromfile(file, 3 + len(SECTION_TYPES))
+            # El indicador 1 o 0 sigue siendo distinto o igual a cero leído en el otro orden
+            swap = bool(header[1]) != (sys.byteorder == 'little')
+            if swap:
+                header.byteswap()
+            if header[0] != FORMAT_VERSION:
+                raise ValueError('El archivo no contiene una jerarquía de contracción compatible')
+            keys_data = file.read(header[2])
+            sections = []
+            for typecode, length in zip(SECTION_TYPES, header[3:]):
+                section = array(typecode)
+                section.fromfile(file, length)
+                if swap:
+                    section.byteswap()
+                sections.append(section)
+            if file.read(1):
+                raise ValueError('El archivo tiene datos de más')
+        decoded_keys = json.loads(keys_data.decode('utf-8'))
+    except (EOFError, UnicodeDecodeError, json.JSONDecodeError) as exp:
+        raise ValueError('El archivo de la jerarquía está incompleto o dañado') from exp
+    if not isinstance(decoded_keys, list) or len(decoded_keys) != len(sections[0]):
+        raise ValueError('El archivo de la jerarquía está incompleto o dañado')
+
+    keys = lt.new_list()
+    for key in decoded_keys:
+        lt.add_last(keys, key)
+    rank = sections[0]
+    shortcut_from, shortcut_to, shortcut_middle = sections[7:]
+    middle = dict(zip(zip(shortcut_from, shortcut_to), shortcut_middle))
+    return new_hierarchy(keys, rank, *sections[1:4], *sections[4:7], middle)
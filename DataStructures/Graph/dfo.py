@@ -0,0 +1,71 @@
+"""
+  Órdenes de recorrido en profundidad (Depth First Order) de un ``adj_list_graph``.
+
+  Se recorre todo el grafo con ``dfs.dfs_ids`` (sin recursión) y se registran
+  los vértices en preorden, postorden y postorden inverso. En un grafo
+  dirigido acíclico el postorden inverso es un orden topológico.
+"""
+
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dfs
+
+
+def depth_first_order(graph):
+    """
+    Calcula el preorden, postorden y postorden inverso de todos los vértices del grafo.
+
+    Retorna una estructura con los siguientes atributos:
+    - pre: array_list con las llaves de los vértices en preorden
+    - post: array_list con las llaves de los vértices en postorden
+    - reverse_post: array_list con las llaves de los vértices en postorden inverso
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer
+
+    Returns:
+        dict: La estructura con los tres órdenes
+    """
+    pre_ids, post_ids = depth_first_order_ids(graph)
+    keys = graph['keys']['elements']
+    pre = lt.new_list()
+    post = lt.new_list()
+    reverse_post = lt.new_list()
+    for v in pre_ids:
+        lt.add_last(pre, keys[v])
+    for v in post_ids:
+        lt.add_last(post, keys[v])
+    for v in reversed(post_ids):
+        lt.add_last(reverse_post, keys[v])
+    return {'pre': pre,
+            'post': post,
+            'reverse_post': reverse_post,
+            }
+
+
+def depth_first_order_ids(graph, order=None):
+    """
+    Calcula el preorden y el postorden del grafo como identificadores enteros.
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer
+        order (iterable, optional): Orden en que se toman los vértices de inicio
+            (por defecto, por identificador)
+
+    Returns:
+        tuple: Arreglos ``(pre, post)`` con los identificadores de los vértices
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    visited = bytearray(num_vertex)
+    pre = array('q')
+    post = array('q')
+    if order is None:
+        order = range(num_vertex)
+    for v in order:
+        if not visited[v]:
+            dfs.dfs_ids(adj_ids, v, visited, pre=pre, post=post)
+    return pre, post
@@ -0,0 +1,138 @@
+"""
+  Recorrido en profundidad (Depth First Search) sobre un ``adj_list_graph``.
+
+  El recorrido no usa recursión: mantiene una pila explícita con cada vértice
+  abierto y la posición del siguiente vecino por revisar, por lo que la memoria
+  adicional es O(V) y no depende del límite de recursión de Python.
+"""
+
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+
+
+def dfs(graph, source):
+    """
+    Recorre el grafo en profundidad a partir del vértice ``source``.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - source: Llave del vértice de origen
+    - source_id: Identificador entero del vértice de origen
+    - visited: bytearray con 1 en los vértices alcanzables desde ``source``
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - graph: El grafo recorrido
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    if source_id is None:
+        return None
+    num_vertex = lt.size(graph['keys'])
+    visited = bytearray(num_vertex)
+    edge_to = array('q', [-1]) * num_vertex
+    dfs_ids(graph['adj_ids']['elements'], source_id, visited, edge_to)
+    return {'source': source,
+            'source_id': source_id,
+            'visited': visited,
+            'edge_to': edge_to,
+            'graph': graph,
+            }
+
+
+def dfs_ids(adj_ids, source_id, visited, edge_to=None, pre=None, post=None):
+    """
+    Recorre en profundidad, sin recursión, los vértices alcanzables desde
+    ``source_id`` que aún no están marcados en ``visited``.
+
+    Es la base de ``dfs()``, ``dfo.depth_first_order()`` y los demás recorridos
+    del paquete que trabajan con identificadores enteros.
+
+    Args:
+        adj_ids (list): Listas de vecinos indexadas por identificador (``graph['adj_ids']['elements']``)
+        source_id (int): Identificador del vértice de origen
+        visited (bytearray): Marcas de vértices visitados, se actualiza
+        edge_to (array, optional): Si se da, recibe el vértice anterior de cada vértice visitado
+        pre (array, optional): Si se da, recibe los vértices en preorden
+        post (array, optional): Si se da, recibe los vértices en postorden
+
+    Returns:
+        bytearray: Las marcas de vértices visitados
+    """
+    visited[source_id] = 1
+    if pre is not None:
+        pre.append(source_id)
+    stack = [source_id]
+    next_pos = [0]
+    while stack:
+        v = stack[-1]
+        neighbors = adj_ids[v]['elements']
+        i = next_pos[-1]
+        num_neighbors = len(neighbors)
+        while i < num_neighbors and visited[neighbors[i]]:
+            i += 1
+        if i < num_neighbors:
+            w = neighbors[i]
+            next_pos[-1] = i + 1
+            visited[w] = 1
+            if edge_to is not None:
+                edge_to[w] = v
+            if pre is not None:
+                pre.append(w)
+            stack.append(w)
+            next_pos.append(0)
+        else:
+            stack.pop()
+            next_pos.pop()
+            if post is not None:
+                post.append(v)
+    return visited
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde el origen de la búsqueda hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dfs()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        bool: True si ``vertex`` es alcanzable desde el origen
+    """
+    vid = gr.vertex_id(search['graph'], vertex)
+    if vid is None or vid >= len(search['visited']):
+        return False
+    return search['visited'][vid] == 1
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino encontrado por el recorrido desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dfs()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        array_list: Llaves de los vértices del camino, desde el origen hasta ``vertex``,
+        o None si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return None
+    graph = search['graph']
+    edge_to = search['edge_to']
+    ids = []
+    v = gr.vertex_id(graph, vertex)
+    while v != -1:
+        ids.append(v)
+        v = edge_to[v]
+    path = lt.new_list()
+    for v in reversed(ids):
+        lt.add_last(path, gr.vertex_key(graph, v))
+    return path
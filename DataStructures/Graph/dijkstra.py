@@ -0,0 +1,456 @@
+"""
+  Caminos de costo mínimo con el algoritmo de Dijkstra sobre un ``adj_list_graph``.
+
+  - ``dijkstra()`` calcula el árbol de caminos mínimos desde un vértice a
+    todos los demás; ``shortest_path_tree()`` es el mismo cálculo sobre
+    listas de adyacencia por identificador (por ejemplo, las de entrada).
+  - ``add_edge()`` y ``repair_edge()`` mantienen ese árbol al agregar un arco
+    o disminuir su peso, relajando solo la región afectada.
+  - ``bidirectional_dijkstra()`` responde consultas de un vértice a otro:
+    busca al mismo tiempo desde el origen y hacia atrás desde el destino y se
+    detiene cuando las dos fronteras se encuentran, visitando muchos menos
+    vértices que el árbol completo.
+  - ``multi_source_dijkstra()`` parte de varios orígenes a la vez y calcula,
+    para cada vértice, el origen más cercano y la distancia a él.
+
+  Todos trabajan sobre los identificadores enteros del grafo, usan un heap
+  (``heapq``) con eliminación perezosa y requieren pesos no negativos.
+"""
+
+import heapq
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+
+
+def dijkstra(graph, source):
+    """
+    Calcula los caminos de costo mínimo desde ``source`` a todos los vértices.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - source: Llave del vértice de origen
+    - source_id: Identificador entero del vértice de origen
+    - dist_to: Arreglo con la distancia mínima desde ``source`` (``math.inf`` si no es alcanzable)
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - graph: El grafo recorrido
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer, con pesos no negativos
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    if source_id is None:
+        return None
+    dist, edge_to = shortest_path_tree(graph['adj_ids'], graph['adj_weights'], source_id)
+    return {'source': source,
+            'source_id': source_id,
+            'dist_to': dist,
+            'edge_to': edge_to,
+            'graph': graph,
+            }
+
+
+def shortest_path_tree(adj_ids, adj_weights, source_id):
+    """
+    Calcula el árbol de caminos mínimos desde ``source_id`` sobre listas de
+    adyacencia indexadas por identificador.
+
+    Recibe las listas ``adj_ids`` y ``adj_weights`` del grafo o las de
+    ``adj_list_graph.reverse_index()``; con estas últimas calcula la
+    distancia de cada vértice hacia ``source_id``.
+
+    Args:
+        adj_ids (array_list): Identificadores de los vecinos de cada vértice
+        adj_weights (array_list): Pesos no negativos de los arcos, alineados con ``adj_ids``
+        source_id (int): Identificador del vértice de origen
+
+    Returns:
+        tuple: ``(dist, edge_to)``: la distancia mínima (``math.inf`` si no es
+        alcanzable) y el vértice anterior en el camino (-1 si no tiene) de cada vértice
+    """
+    num_vertex = lt.size(adj_ids)
+    dist = array('d', [math.inf]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    settled = bytearray(num_vertex)
+    adj_ids = adj_ids['elements']
+    adj_weights = adj_weights['elements']
+
+    dist[source_id] = 0.0
+    heap = [(0.0, source_id)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = 1
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                edge_to[w] = v
+                heapq.heappush(heap, (nd, w))
+    return dist, edge_to
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde el origen de la búsqueda hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dijkstra()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        bool: True si ``vertex`` es alcanzable desde el origen
+    """
+    vid = gr.vertex_id(search['graph'], vertex)
+    if vid is None or vid >= len(search['dist_to']):
+        return False
+    return search['dist_to'][vid] < math.inf
+
+
+def dist_to(search, vertex):
+    """
+    Retorna el costo del camino mínimo desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dijkstra()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        float: Costo del camino, o ``math.inf`` si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return math.inf
+    return search['dist_to'][gr.vertex_id(search['graph'], vertex)]
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino de costo mínimo desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dijkstra()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        array_list: Llaves de los vértices del camino, desde el origen hasta ``vertex``,
+        o None si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return None
+    graph = search['graph']
+    ids = ids_path(search['edge_to'], gr.vertex_id(graph, vertex))
+    ids.reverse()
+    return keys_path(graph, ids)
+
+
+def add_edge(search, vertex_a, vertex_b, weight):
+    """
+    Agrega el arco ``vertex_a -> vertex_b`` al grafo de la búsqueda (con
+    ``adj_list_graph.add_edge()``) y actualiza los caminos mínimos.
+
+    Si el arco es nuevo o su peso disminuye, solo cambian los vértices cuyo
+    camino mejora al usarlo, y la búsqueda se repara localmente con
+    ``repair_edge()``. Si el arco ya existía con un peso menor, los caminos
+    que lo usaban pueden empeorar y la búsqueda se calcula de nuevo.
+
+    Args:
+        search (dict): Estructura retornada por ``dijkstra()``, se modifica en el lugar
+        vertex_a (any): Llave del vértice de inicio
+        vertex_b (any): Llave del vértice destino
+        weight (float): Peso no negativo del arco
+
+    Returns:
+        dict: La búsqueda actualizada
+    """
+    graph = search['graph']
+    id_a = gr.vertex_id(graph, vertex_a)
+    id_b = gr.vertex_id(graph, vertex_b)
+    old_weight = None
+    if id_a is not None and id_b is not None:
+        pos = gr.find_adjacent_id(graph, id_a, id_b)
+        if pos >= 0:
+            old_weight = gr.adjacent_weights(graph, id_a)['elements'][pos]
+    gr.add_edge(graph, vertex_a, vertex_b, weight)
+    if old_weight is not None and weight > old_weight:
+        search.update(dijkstra(graph, search['source']))
+        return search
+    return repair_edge(search, vertex_a, vertex_b, weight)
+
+
+def repair_edge(search, vertex_a, vertex_b, weight):
+    """
+    Actualiza la búsqueda después de que el grafo ganó el arco
+    ``vertex_a -> vertex_b`` o el peso de ese arco disminuyó a ``weight``.
+
+    Se relaja el arco y, si mejora la distancia de ``vertex_b``, se continúa
+    Dijkstra solo desde los vértices que mejoran; el resto del árbol no se
+    visita. En un grafo no dirigido se relajan los dos sentidos. Los
+    vértices agregados al grafo después de la búsqueda se incorporan como no
+    alcanzables antes de relajar.
+
+    Args:
+        search (dict): Estructura retornada por ``dijkstra()``, se modifica en el lugar
+        vertex_a (any): Llave del vértice de inicio del arco
+        vertex_b (any): Llave del vértice destino del arco
+        weight (float): Peso no negativo del arco
+
+    Returns:
+        dict: La búsqueda actualizada
+    """
+    graph = search['graph']
+    id_a = gr.vertex_id(graph, vertex_a)
+    id_b = gr.vertex_id(graph, vertex_b)
+    if id_a is None or id_b is None:
+        return search
+    dist = search['dist_to']
+    edge_to = search['edge_to']
+    missing = lt.size(graph['keys']) - len(dist)
+    if missing > 0:
+        dist.extend(array('d', [math.inf]) * missing)
+        edge_to.extend(array('q', [-1]) * missing)
+
+    heap = []
+    arcs = [(id_a, id_b)] if graph['directed'] else [(id_a, id_b), (id_b, id_a)]
+    for v, w in arcs:
+        nd = dist[v] + weight
+        if nd < dist[w]:
+            dist[w] = nd
+            edge_to[w] = v
+            heap.append((nd, w))
+    heapq.heapify(heap)
+
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > dist[v]:
+            continue
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                edge_to[w] = v
+                heapq.heappush(heap, (nd, w))
+    return search
+
+
+def bidirectional_dijkstra(graph, source, target):
+    """
+    Calcula el camino de costo mínimo de ``source`` a ``target``.
+
+    Se alterna una búsqueda hacia adelante desde ``source`` y una hacia atrás
+    desde ``target`` (sobre los arcos de entrada, ver
+    ``adj_list_graph.reverse_index()``). Cada vez que un arco une las dos
+    búsquedas se actualiza el mejor costo conocido ``mu``; la búsqueda termina
+    cuando la suma de los mínimos de las dos colas es mayor o igual a ``mu``.
+
+    Retorna una estructura con los siguientes atributos:
+    - distance: Costo del camino mínimo (``math.inf`` si no hay camino)
+    - path: array_list con las llaves del camino de ``source`` a ``target``, o None
+    - settled: Número de vértices cerrados por las dos búsquedas
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer, con pesos no negativos
+        source (any): Llave del vértice de origen
+        target (any): Llave del vértice destino
+
+    Returns:
+        dict: La estructura con el resultado, o None si algún vértice no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    target_id = gr.vertex_id(graph, target)
+    if source_id is None or target_id is None:
+        return None
+    if source_id == target_id:
+        return {'distance': 0.0, 'path': keys_path(graph, [source_id]), 'settled': 0}
+
+    num_vertex = lt.size(graph['keys'])
+    reverse = gr.reverse_index(graph)
+    adjacency = (
+        (graph['adj_ids']['elements'], graph['adj_weights']['elements']),
+        (reverse['adj_ids']['elements'], reverse['adj_weights']['elements']),
+    )
+    dist = (array('d', [math.inf]) * num_vertex, array('d', [math.inf]) * num_vertex)
+    edge_to = (array('q', [-1]) * num_vertex, array('q', [-1]) * num_vertex)
+    settled = (bytearray(num_vertex), bytearray(num_vertex))
+    heaps = ([(0.0, source_id)], [(0.0, target_id)])
+    dist[0][source_id] = 0.0
+    dist[1][target_id] = 0.0
+
+    mu = math.inf
+    meeting = None
+    num_settled = 0
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        # Se avanza la búsqueda con la cola más pequeña
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        d, v = heapq.heappop(heaps[side])
+        if settled[side][v]:
+            continue
+        settled[side][v] = 1
+        num_settled += 1
+        my_dist = dist[side]
+        other_dist = dist[1 - side]
+        my_edge_to = edge_to[side]
+        neighbors = adjacency[side][0][v]['elements']
+        weights = adjacency[side][1][v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < my_dist[w]:
+                my_dist[w] = nd
+                my_edge_to[w] = v
+                heapq.heappush(heaps[side], (nd, w))
+            total = nd + other_dist[w]
+            if total < mu:
+                mu = total
+                meeting = (side, v, w)
+
+    if meeting is None:
+        return {'distance': math.inf, 'path': None, 'settled': num_settled}
+    side, v, w = meeting
+    # El arco v -> w une las búsquedas; se orienta de source a target
+    if side == 0:
+        before, after = v, w
+    else:
+        before, after = w, v
+    forward = ids_path(edge_to[0], before)
+    forward.reverse()
+    backward = ids_path(edge_to[1], after)
+    return {'distance': mu,
+            'path': keys_path(graph, forward + backward),
+            'settled': num_settled,
+            }
+
+
+def multi_source_dijkstra(graph, sources):
+    """
+    Calcula, para cada vértice, el vértice de ``sources`` más cercano y la
+    distancia a él, en un solo recorrido.
+
+    El heap empieza con todos los orígenes a distancia cero, así que cada
+    vértice se fija una sola vez, desde el origen que lo alcanza primero.
+    Equivale a un Dijkstra desde un vértice ficticio unido a todos los
+    orígenes con arcos de peso cero.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - sources: array_list con las llaves de los orígenes
+    - dist_to: Arreglo con la distancia al origen más cercano (``math.inf`` si no es alcanzable)
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - nearest: Arreglo con el identificador del origen más cercano (-1 si no es alcanzable)
+    - graph: El grafo recorrido
+
+    ``has_path_to()``, ``dist_to()`` y ``path_to()`` aceptan esta estructura;
+    el camino empieza en el origen más cercano.
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer, con pesos no negativos
+        sources (array_list): Llaves de los vértices de origen; se ignoran las
+            que no están en el grafo
+
+    Returns:
+        dict: La estructura de búsqueda
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    dist = array('d', [math.inf]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    nearest = array('q', [-1]) * num_vertex
+    settled = bytearray(num_vertex)
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+
+    heap = []
+    for i in range(lt.size(sources)):
+        source_id = gr.vertex_id(graph, lt.get_element(sources, i))
+        if source_id is not None and nearest[source_id] == -1:
+            dist[source_id] = 0.0
+            nearest[source_id] = source_id
+            heap.append((0.0, source_id))
+    while heap:
+        d, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = 1
+        origin = nearest[v]
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                edge_to[w] = v
+                nearest[w] = origin
+                heapq.heappush(heap, (nd, w))
+
+    return {'sources': sources,
+            'dist_to': dist,
+            'edge_to': edge_to,
+            'nearest': nearest,
+            'graph': graph,
+            }
+
+
+def nearest_source(search, vertex):
+    """
+    Retorna el origen más cercano a ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``multi_source_dijkstra()``
+        vertex (any): Llave del vértice
+
+    Returns:
+        any: Llave del origen más cercano, o None si ningún origen alcanza a ``vertex``
+    """
+    if not has_path_to(search, vertex):
+        return None
+    return gr.vertex_key(search['graph'], search['nearest'][gr.vertex_id(search['graph'], vertex)])
+
+
+def ids_path(edge_to, vertex_id):
+    """
+    Sigue ``edge_to`` desde ``vertex_id`` hasta la raíz de la búsqueda.
+
+    Args:
+        edge_to (array): Vértice anterior de cada vértice (-1 en la raíz)
+        vertex_id (int): Identificador del vértice de partida
+
+    Returns:
+        list: Identificadores desde ``vertex_id`` hasta la raíz
+    """
+    ids = []
+    while vertex_id != -1:
+        ids.append(vertex_id)
+        vertex_id = edge_to[vertex_id]
+    return ids
+
+
+def keys_path(graph, ids):
+    """
+    Convierte una secuencia de identificadores en un array_list de llaves.
+
+    Args:
+        graph (adj_list_graph): El grafo de los vértices
+        ids (list): Identificadores de los vértices
+
+    Returns:
+        array_list: Llaves de los vértices en el mismo orden
+    """
+    path = lt.new_list()
+    for v in ids:
+        lt.add_last(path, gr.vertex_key(graph, v))
+    return path
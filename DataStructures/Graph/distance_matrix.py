@@ -0,0 +1,203 @@
+"""
+  Matriz de distancias mínimas entre un conjunto de orígenes y uno de destinos.
+
+  Cada fila de la matriz es un Dijkstra desde un origen que se detiene al
+  cerrar todos los destinos. Las filas se reparten entre los procesos de un
+  ``ProcessPoolExecutor``: el grafo se congela en arreglos CSR (ver
+  ``adj_list_graph.csr_arrays()``) que se envían una sola vez a cada proceso
+  al crearlo, en lugar de serializar el grafo en cada tarea.
+
+  El resultado guarda las distancias en un único ``array('d')`` por filas,
+  de modo que una matriz de 500 x 500 ocupa 2 MB y se puede ver sin copiar
+  como arreglo de dos dimensiones con ``as_memoryview()``.
+"""
+
+import heapq
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+
+# Número mínimo de orígenes para repartir las búsquedas en varios procesos
+PARALLEL_ROWS_THRESHOLD = 16
+
+# Grafo congelado y destinos de cada proceso, asignados por ``init_worker()``
+worker_state = None
+
+
+def distance_matrix(graph, sources, targets, processes=None):
+    """
+    Calcula la distancia mínima de cada vértice de ``sources`` a cada vértice de ``targets``.
+
+    La posición ``(i, j)`` de la matriz es la distancia del i-ésimo origen al
+    j-ésimo destino, ``math.inf`` si no hay camino o si alguno de los dos
+    vértices no está en el grafo. Los orígenes repetidos se calculan una sola vez.
+
+    Retorna una estructura con los siguientes atributos:
+    - rows: Número de orígenes
+    - columns: Número de destinos
+    - data: ``array('d')`` con las ``rows * columns`` distancias, fila por fila
+    - sources: array_list con las llaves de los orígenes
+    - targets: array_list con las llaves de los destinos
+
+    Args:
+        graph (adj_list_graph): El grafo, con pesos no negativos
+        sources (array_list): Llaves de los vértices de origen
+        targets (array_list): Llaves de los vértices destino
+        processes (int, optional): Número de procesos (por defecto ``os.cpu_count()``).
+            Con un proceso, o menos de ``PARALLEL_ROWS_THRESHOLD`` orígenes,
+            se calcula en el proceso actual.
+
+    Returns:
+        dict: La matriz de distancias
+    """
+    rows = lt.size(sources)
+    columns = lt.size(targets)
+    csr = gr.csr_arrays(graph)
+    target_ids = array('q')
+    for j in range(columns):
+        vid = gr.vertex_id(graph, lt.get_element(targets, j))
+        target_ids.append(-1 if vid is None else vid)
+
+    source_ids = []
+    seen = set()
+    for i in range(rows):
+        vid = gr.vertex_id(graph, lt.get_element(sources, i))
+        if vid is not None and vid not in seen:
+            seen.add(vid)
+            source_ids.append(vid)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or len(source_ids) < PARALLEL_ROWS_THRESHOLD:
+        results = [distance_row(csr, target_ids, vid) for vid in source_ids]
+    else:
+        chunk_size = max(1, len(source_ids) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker,
+                                 initargs=(csr, target_ids)) as executor:
+            results = list(executor.map(worker_row, source_ids, chunksize=chunk_size))
+    row_of = dict(zip(source_ids, results))
+
+    data = array('d')
+    missing = array('d', [math.inf]) * columns
+    for i in range(rows):
+        vid = gr.vertex_id(graph, lt.get_element(sources, i))
+        data.extend(row_of.get(vid, missing))
+    return {'rows': rows,
+            'columns': columns,
+            'data': data,
+            'sources': sources,
+            'targets': targets,
+            'type': 'DISTANCE_MATRIX',
+            }
+
+
+def init_worker(csr, target_ids):
+    """
+    Guarda el grafo congelado y los destinos en el proceso, es llamada una
+    vez al crear cada proceso de ``distance_matrix()``.
+    """
+    global worker_state
+    worker_state = (csr, target_ids)
+
+
+def worker_row(source_id):
+    """
+    Calcula una fila de la matriz en un proceso de ``distance_matrix()``.
+    """
+    csr, target_ids = worker_state
+    return distance_row(csr, target_ids, source_id)
+
+
+def distance_row(csr, target_ids, source_id):
+    """
+    Dijkstra desde ``source_id`` sobre los arreglos CSR que se detiene al
+    cerrar todos los destinos.
+
+    Args:
+        csr (dict): Arreglos retornados por ``adj_list_graph.csr_arrays()``
+        target_ids (array): Identificadores de los destinos (-1 si no existen)
+        source_id (int): Identificador del origen
+
+    Returns:
+        array: Distancia a cada destino, en el orden de ``target_ids``
+    """
+    offsets = csr['offsets']
+    adj_targets = csr['targets']
+    weights = csr['weights']
+    num_vertex = len(offsets) - 1
+    dist = array('d', [math.inf]) * num_vertex
+    settled = bytearray(num_vertex)
+    pending = set(target_ids)
+    pending.discard(-1)
+
+    dist[source_id] = 0.0
+    heap = [(0.0, source_id)]
+    while heap and pending:
+        d, v = heapq.heappop(heap)
+        if settled[v]:
+            continue
+        settled[v] = 1
+        pending.discard(v)
+        for i in range(offsets[v], offsets[v + 1]):
+            w = adj_targets[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                heapq.heappush(heap, (nd, w))
+
+    distances = array('d')
+    for vid in target_ids:
+        distances.append(math.inf if vid == -1 or not settled[vid] else dist[vid])
+    return distances
+
+
+def get_distance(matrix, source_pos, target_pos):
+    """
+    Retorna la distancia del origen en la posición ``source_pos`` al destino
+    en la posición ``target_pos``.
+
+    Args:
+        matrix (dict): Matriz retornada por ``distance_matrix()``
+        source_pos (int): Posición del origen en ``sources``, contando desde cero
+        target_pos (int): Posición del destino en ``targets``, contando desde cero
+
+    Returns:
+        float: La distancia, o ``math.inf`` si no hay camino
+    """
+    return matrix['data'][source_pos * matrix['columns'] + target_pos]
+
+
+def row(matrix, source_pos):
+    """
+    Retorna las distancias del origen en la posición ``source_pos`` a todos los destinos.
+
+    Args:
+        matrix (dict): Matriz retornada por ``distance_matrix()``
+        source_pos (int): Posición del origen en ``sources``, contando desde cero
+
+    Returns:
+        array: Distancias a cada destino, en el orden de ``targets`` (es una copia)
+    """
+    start = source_pos * matrix['columns']
+    return matrix['data'][start:start + matrix['columns']]
+
+
+def as_memoryview(matrix):
+    """
+    Retorna un ``memoryview`` de dos dimensiones (filas x columnas) sobre las
+    distancias, sin copiarlas; por ejemplo ``numpy.asarray(as_memoryview(m))``.
+
+    Args:
+        matrix (dict): Matriz retornada por ``distance_matrix()``
+
+    Returns:
+        memoryview: Vista con formato ``'d'`` y forma ``(rows, columns)``; si la
+        matriz no tiene filas o columnas, la vista vacía de una dimensión
+    """
+    if matrix['rows'] == 0 or matrix['columns'] == 0:
+        return memoryview(matrix['data'])
+    return memoryview(matrix['data']).cast('B').cast('d', [matrix['rows'], matrix['columns']])
@@ -1,3 +1,27 @@
+class Edge:
+    """
+    Registro compacto de un arco. Usa ``__slots__`` para no crear un
+    diccionario por cada arco; se sigue pudiendo acceder a los campos con
+    ``edge.weight`` por compatibilidad, aunque se recomienda usar las
+    funciones de este módulo.
+    """
+    __slots__ = ("vertex_a", "vertex_b", "weight")
+
+    def __init__(self, vertex_a, vertex_b, weight):
+        self.vertex_a = vertex_a
+        self.vertex_b = vertex_b
+        self.weight = weight
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        setattr(self, field, value)
+
+    def __repr__(self):
+        return "Edge({!r}, {!r}, {!r})".format(self.vertex_a, self.vertex_b, self.weight)
+
+
 def new_edge(v_a, v_b, weight=0):
     """
     Crea un nuevo arco entrelos vertices ``v_a`` y ``v_b`` con un peso ``weight``
@@ -18,8 +42,7 @@ def new_edge(v_a, v_b, weight=0):
     :returns: Arco creado
     :rtype: edge
     """
-    edge = {"vertex_a": v_a, "vertex_b": v_b, "weight": weight}
-    return edge
+    return Edge(v_a, v_b, weight)
 
 
 def weight(edge):
@@ -32,7 +55,7 @@ def weight(edge):
     :returns: Peso del arco
     :rtype: double
     """
-    return edge["weight"]
+    return edge.weight
 
 
 def either(edge):
@@ -45,7 +68,7 @@ def either(edge):
     :returns: Vertice A del arco
     :rtype: any
     """
-    return edge["vertex_a"]
+    return edge.vertex_a
 
 
 def other(edge, veither):
@@ -60,10 +83,10 @@ def other(edge, veither):
     :returns: Vertice B del arco
     :rtype: any
     """
-    if veither == edge["vertex_a"]:
-        return edge["vertex_b"]
-    elif veither == edge["vertex_b"]:
-        return edge["vertex_a"]
+    if veither == edge.vertex_a:
+        return edge.vertex_b
+    elif veither == edge.vertex_b:
+        return edge.vertex_a
 
 
 def set_weight(edge, weight):
@@ -75,7 +98,7 @@ def set_weight(edge, weight):
     :param weight: Nuevo peso del arco
     :type weight: double
     """
-    edge["weight"] = weight
+    edge.weight = weight
 
 
 def compare_edges(edge1, edge2):
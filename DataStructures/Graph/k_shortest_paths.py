@@ -0,0 +1,170 @@
+"""
+  Los k caminos más cortos sin ciclos entre dos vértices de un
+  ``adj_list_graph``, con el algoritmo de Yen.
+
+  Cada camino nuevo se obtiene desviándose de uno ya aceptado: para cada
+  vértice del camino (el vértice de desvío) se fija el prefijo hasta él, se
+  prohíben los arcos que usan los caminos aceptados con ese mismo prefijo y
+  se busca el camino más corto del vértice de desvío al destino sin pasar
+  por el prefijo. El mejor de los candidatos es el siguiente camino.
+
+  Las búsquedas desde el vértice de desvío son A* de un vértice a otro:
+  como heurística se usa la distancia exacta al destino en el grafo completo
+  (calculada una vez con ``dijkstra.shortest_path_tree()`` sobre los arcos
+  de entrada), que sigue siendo una cota inferior al quitar vértices y
+  arcos. Mientras el camino original no esté bloqueado la búsqueda avanza
+  directo por él. Además se recuerda, para cada prefijo, qué arcos estaban
+  prohibidos en su última búsqueda: si no han cambiado, el candidato ya se
+  generó y la búsqueda no se repite.
+"""
+
+import heapq
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+
+
+def k_shortest_paths(graph, source, target, k):
+    """
+    Calcula los ``k`` caminos sin ciclos de menor costo de ``source`` a ``target``.
+
+    Cada camino es una estructura con los siguientes atributos:
+    - distance: Suma de los pesos de los arcos del camino
+    - path: array_list con las llaves de los vértices, de ``source`` a ``target``
+
+    Args:
+        graph (adj_list_graph): El grafo a recorrer, con pesos no negativos
+        source (any): Llave del vértice de origen
+        target (any): Llave del vértice destino
+        k (int): Número máximo de caminos
+
+    Returns:
+        array_list: Los caminos en orden de costo no decreciente (menos de
+        ``k`` si no hay tantos), o None si algún vértice no está en el grafo
+    """
+    source_id = gr.vertex_id(graph, source)
+    target_id = gr.vertex_id(graph, target)
+    if source_id is None or target_id is None:
+        return None
+    result = lt.new_list()
+    if k <= 0:
+        return result
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+    reverse = gr.reverse_index(graph)
+    # Distancia de cada vértice al destino y siguiente vértice hacia él
+    h, next_to = dj.shortest_path_tree(reverse['adj_ids'], reverse['adj_weights'], target_id)
+    if h[source_id] == math.inf:
+        return result
+
+    first = dj.ids_path(next_to, source_id)
+    accepted = [(first, path_costs(graph, first))]
+    # Para cada prefijo de los caminos aceptados, los vértices que lo siguen
+    next_hops = {}
+    add_prefixes(next_hops, first)
+    searched = {}
+    seen = {tuple(first)}
+    candidates = []
+    removed = array('q', [-1]) * num_vertex
+    mark = 0
+
+    while len(accepted) < k:
+        ids, costs = accepted[-1]
+        for i in range(len(ids) - 1):
+            root = tuple(ids[:i + 1])
+            banned = next_hops[root]
+            if searched.get(root) == banned:
+                continue
+            searched[root] = frozenset(banned)
+            mark += 1
+            for v in ids[:i]:
+                removed[v] = mark
+            spur = spur_path(adj_ids, adj_weights, h, ids[i], target_id, removed, mark, banned)
+            if spur is None:
+                continue
+            spur_ids, spur_costs = spur
+            new_ids = ids[:i] + spur_ids
+            key = tuple(new_ids)
+            if key in seen:
+                continue
+            seen.add(key)
+            new_costs = costs[:i] + [costs[i] + c for c in spur_costs]
+            heapq.heappush(candidates, (new_costs[-1], len(new_ids), new_ids, new_costs))
+        if not candidates:
+            break
+        distance, length, new_ids, new_costs = heapq.heappop(candidates)
+        accepted.append((new_ids, new_costs))
+        add_prefixes(next_hops, new_ids)
+
+    for ids, costs in accepted:
+        lt.add_last(result, {'distance': costs[-1], 'path': dj.keys_path(graph, ids)})
+    return result
+
+
+def spur_path(adj_ids, adj_weights, h, spur, target_id, removed, mark, banned):
+    """
+    Busca con A* el camino más corto de ``spur`` a ``target_id`` sin pasar
+    por los vértices con ``removed[v] == mark`` ni usar los arcos de
+    ``spur`` hacia los vértices de ``banned``.
+
+    Args:
+        h (array): Distancia de cada vértice al destino en el grafo completo
+
+    Returns:
+        tuple: ``(ids, costs)``: los identificadores del camino y el costo
+        acumulado hasta cada uno, o None si no hay camino
+    """
+    dist = {spur: 0.0}
+    parent = {spur: -1}
+    closed = set()
+    # A igual prioridad se prefiere el vértice más lejano del desvío
+    heap = [(h[spur], -0.0, spur)]
+    found = False
+    while heap:
+        f, d, v = heapq.heappop(heap)
+        if v in closed:
+            continue
+        if v == target_id:
+            found = True
+            break
+        closed.add(v)
+        d = -d
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            if removed[w] == mark or h[w] == math.inf or (v == spur and w in banned):
+                continue
+            nd = d + weights[i]
+            if nd < dist.get(w, math.inf):
+                dist[w] = nd
+                parent[w] = v
+                heapq.heappush(heap, (nd + h[w], -nd, w))
+    if not found:
+        return None
+    ids = dj.ids_path(parent, target_id)
+    ids.reverse()
+    return ids, [dist[v] for v in ids]
+
+
+def path_costs(graph, ids):
+    """
+    Retorna el costo acumulado desde el primer vértice de ``ids`` hasta cada uno.
+    """
+    costs = [0.0]
+    for i in range(1, len(ids)):
+        pos = gr.find_adjacent_id(graph, ids[i - 1], ids[i])
+        costs.append(costs[-1] + gr.adjacent_weights(graph, ids[i - 1])['elements'][pos])
+    return costs
+
+
+def add_prefixes(next_hops, ids):
+    """
+    Registra en ``next_hops`` el vértice que sigue a cada prefijo de ``ids``.
+    """
+    for i in range(len(ids) - 1):
+        next_hops.setdefault(tuple(ids[:i + 1]), set()).add(ids[i + 1])
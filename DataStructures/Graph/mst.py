@@ -0,0 +1,153 @@
+"""
+  Árbol de recubrimiento mínimo (Minimum Spanning Tree) de un ``adj_list_graph``
+  no dirigido.
+
+  - ``prim_mst()``: Prim en su versión "eager", con una cola de prioridad
+    indexada (``index_min_pq``) que guarda para cada vértice fuera del árbol
+    el arco más liviano que lo conecta con él. O(E log V).
+  - ``kruskal_mst()``: Kruskal, ordena los arcos por peso y los agrega si
+    unen dos componentes distintos, verificándolo con ``union_find``. O(E log E).
+
+  Si el grafo no es conectado ambos calculan el bosque de recubrimiento
+  mínimo (un árbol por componente). Los arcos del resultado son objetos
+  ``edge`` nuevos, construidos a partir de ``adj_ids`` y ``adj_weights``.
+"""
+
+from array import array
+import math
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Priority_queue import index_min_pq as pq
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import union_find as uf
+from DataStructures.Graph import edge as e
+
+
+def prim_mst(graph):
+    """
+    Calcula el árbol de recubrimiento mínimo con el algoritmo de Prim (eager).
+
+    Retorna una estructura con los siguientes atributos:
+    - edges: array_list con los arcos del árbol, en el orden en que se agregaron
+    - weight: Peso total del árbol
+
+    Args:
+        graph (adj_list_graph): El grafo no dirigido
+
+    Returns:
+        dict: El árbol de recubrimiento mínimo, o None si el grafo es dirigido
+    """
+    if graph['directed']:
+        return None
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+    dist_to = array('d', [math.inf]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    edge_pos = array('q', [-1]) * num_vertex
+    marked = bytearray(num_vertex)
+    queue = pq.new_index_pq(num_vertex)
+
+    tree = lt.new_list()
+    total = 0.0
+    for source in range(num_vertex):
+        if marked[source]:
+            continue
+        dist_to[source] = 0.0
+        pq.insert(queue, source, 0.0)
+        while not pq.is_empty(queue):
+            v = pq.del_min(queue)
+            marked[v] = 1
+            if edge_to[v] != -1:
+                lt.add_last(tree, edge_at(graph, edge_to[v], edge_pos[v]))
+                total += dist_to[v]
+            neighbors = adj_ids[v]['elements']
+            weights = adj_weights[v]['elements']
+            for i in range(len(neighbors)):
+                w = neighbors[i]
+                if not marked[w] and weights[i] < dist_to[w]:
+                    dist_to[w] = weights[i]
+                    edge_to[w] = v
+                    edge_pos[w] = i
+                    pq.insert(queue, w, weights[i])
+    return {'edges': tree, 'weight': total}
+
+
+def kruskal_mst(graph):
+    """
+    Calcula el árbol de recubrimiento mínimo con el algoritmo de Kruskal.
+
+    Retorna una estructura con los siguientes atributos:
+    - edges: array_list con los arcos del árbol, de menor a mayor peso
+    - weight: Peso total del árbol
+
+    Args:
+        graph (adj_list_graph): El grafo no dirigido
+
+    Returns:
+        dict: El árbol de recubrimiento mínimo, o None si el grafo es dirigido
+    """
+    if graph['directed']:
+        return None
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+
+    # Cada arco no dirigido aparece en las listas de sus dos extremos; se toma una vez
+    candidates = []
+    for v in range(num_vertex):
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            if v < neighbors[i]:
+                candidates.append((weights[i], v, i))
+    candidates.sort()
+
+    components = uf.new_union_find(num_vertex)
+    tree = lt.new_list()
+    total = 0.0
+    for weight, v, i in candidates:
+        if uf.union(components, v, adj_ids[v]['elements'][i]):
+            lt.add_last(tree, edge_at(graph, v, i))
+            total += weight
+            if uf.count(components) == 1:
+                break
+    return {'edges': tree, 'weight': total}
+
+
+def edges(mst):
+    """
+    Retorna los arcos del árbol de recubrimiento mínimo.
+
+    Args:
+        mst (dict): Estructura retornada por ``prim_mst()`` o ``kruskal_mst()``
+
+    Returns:
+        array_list: Los arcos del árbol
+    """
+    return mst['edges']
+
+
+def weight(mst):
+    """
+    Retorna el peso total del árbol de recubrimiento mínimo.
+
+    Args:
+        mst (dict): Estructura retornada por ``prim_mst()`` o ``kruskal_mst()``
+
+    Returns:
+        float: La suma de los pesos de los arcos del árbol
+    """
+    return mst['weight']
+
+
+def edge_at(graph, vertex_id, pos):
+    """
+    Retorna el arco en la posición ``pos`` de la lista de adyacencia del
+    vértice con identificador ``vertex_id``.
+    """
+    target = gr.adjacent_ids(graph, vertex_id)['elements'][pos]
+    weight = gr.adjacent_weights(graph, vertex_id)['elements'][pos]
+    return e.new_edge(gr.vertex_key(graph, vertex_id), gr.vertex_key(graph, target), weight)
@@ -0,0 +1,156 @@
+"""
+  Algoritmos vectorizados con NumPy sobre la exportación CSR de un
+  ``adj_list_graph`` (ver ``adj_list_graph.to_numpy_csr()``).
+
+  Las funciones reciben la estructura CSR (``indptr``, ``indices``,
+  ``weights``) y trabajan con operaciones sobre arreglos completos, de modo
+  que los ciclos por arco se ejecutan en C dentro de NumPy en lugar de
+  llamadas de Python por cada arco:
+
+  - ``degree_stats()``: grados de salida y entrada, fuerza (suma de pesos) y
+    estadísticas del grado.
+  - ``bfs_levels()``: recorrido en anchura por niveles, expandiendo en cada
+    paso todo el arreglo de la frontera.
+  - ``pagerank()``: iteración de potencia sobre la matriz dispersa.
+
+  NumPy es una dependencia opcional del paquete: este módulo solo puede
+  importarse si está instalado.
+"""
+
+import numpy as np
+
+
+def degree_stats(csr):
+    """
+    Calcula los grados de todos los vértices y sus estadísticas.
+
+    Retorna una estructura con los siguientes atributos:
+    - out_degree: Arreglo con el número de arcos que salen de cada vértice
+    - in_degree: Arreglo con el número de arcos que llegan a cada vértice
+    - strength: Arreglo con la suma de los pesos de los arcos que salen de cada vértice
+    - min, max, mean, std: Estadísticas del grado de salida
+    - isolated: Número de vértices sin arcos de salida ni de entrada
+
+    En un grafo no dirigido los grados de entrada y salida son iguales.
+
+    Args:
+        csr (dict): Estructura retornada por ``adj_list_graph.to_numpy_csr()``
+
+    Returns:
+        dict: Los grados y sus estadísticas
+    """
+    indptr = csr['indptr']
+    num_vertex = indptr.size - 1
+    out_degree = np.diff(indptr)
+    in_degree = np.bincount(csr['indices'], minlength=num_vertex)
+    strength = np.bincount(source_ids(csr), weights=csr['weights'], minlength=num_vertex)
+    empty = num_vertex == 0
+    return {'out_degree': out_degree,
+            'in_degree': in_degree,
+            'strength': strength,
+            'min': 0 if empty else int(out_degree.min()),
+            'max': 0 if empty else int(out_degree.max()),
+            'mean': 0.0 if empty else float(out_degree.mean()),
+            'std': 0.0 if empty else float(out_degree.std()),
+            'isolated': int(np.count_nonzero((out_degree == 0) & (in_degree == 0))),
+            }
+
+
+def bfs_levels(csr, source_id):
+    """
+    Calcula el nivel (número de arcos del camino más corto) de cada vértice
+    desde ``source_id`` con un recorrido en anchura por fronteras.
+
+    En cada nivel se reúnen con operaciones vectorizadas los vecinos de todos
+    los vértices de la frontera, se descartan los ya visitados y los
+    restantes forman la frontera siguiente.
+
+    Args:
+        csr (dict): Estructura retornada por ``adj_list_graph.to_numpy_csr()``
+        source_id (int): Identificador del vértice de origen (ver ``adj_list_graph.vertex_id()``)
+
+    Returns:
+        numpy.ndarray: Nivel de cada vértice (int64), -1 si no es alcanzable
+    """
+    indptr = csr['indptr']
+    indices = csr['indices']
+    levels = np.full(indptr.size - 1, -1, dtype=np.int64)
+    levels[source_id] = 0
+    frontier = np.array([source_id], dtype=np.int64)
+    depth = 0
+    while frontier.size > 0:
+        depth += 1
+        neighbors = indices[edge_positions(indptr, frontier)]
+        neighbors = np.unique(neighbors[levels[neighbors] == -1])
+        levels[neighbors] = depth
+        frontier = neighbors
+    return levels
+
+
+def pagerank(csr, damping=0.85, tolerance=1e-10, max_iterations=100, weighted=False):
+    """
+    Calcula el PageRank de cada vértice por iteración de potencia.
+
+    En cada iteración cada vértice reparte su puntaje entre sus vecinos (en
+    proporción al peso de los arcos si ``weighted`` es True) y los vértices
+    sin arcos de salida lo reparten entre todos. Termina cuando la suma de
+    los cambios es menor que ``tolerance`` o tras ``max_iterations``.
+
+    Args:
+        csr (dict): Estructura retornada por ``adj_list_graph.to_numpy_csr()``
+        damping (float): Probabilidad de seguir un arco en lugar de saltar a un vértice al azar
+        tolerance (float): Cambio total mínimo para seguir iterando
+        max_iterations (int): Número máximo de iteraciones
+        weighted (bool): Si es True se usan los pesos de los arcos (deben ser no negativos)
+
+    Returns:
+        numpy.ndarray: Puntaje de cada vértice (float64), suman 1
+    """
+    indptr = csr['indptr']
+    indices = csr['indices']
+    num_vertex = indptr.size - 1
+    if num_vertex == 0:
+        return np.zeros(0, dtype=np.float64)
+    sources = source_ids(csr)
+    if weighted:
+        edge_weights = np.asarray(csr['weights'], dtype=np.float64)
+    else:
+        edge_weights = np.ones(indices.size, dtype=np.float64)
+    out_weight = np.bincount(sources, weights=edge_weights, minlength=num_vertex)
+    dangling = out_weight == 0
+    # Fracción del puntaje del origen que recibe cada arco
+    share = edge_weights / np.where(dangling, 1.0, out_weight)[sources]
+
+    rank = np.full(num_vertex, 1.0 / num_vertex)
+    for i in range(max_iterations):
+        received = np.bincount(indices, weights=rank[sources] * share, minlength=num_vertex)
+        new_rank = damping * (received + rank[dangling].sum() / num_vertex)
+        new_rank += (1.0 - damping) / num_vertex
+        change = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if change < tolerance:
+            break
+    return rank
+
+
+def source_ids(csr):
+    """
+    Retorna el vértice de origen de cada arco, alineado con ``indices``.
+    """
+    indptr = csr['indptr']
+    return np.repeat(np.arange(indptr.size - 1, dtype=np.int64), np.diff(indptr))
+
+
+def edge_positions(indptr, vertices):
+    """
+    Retorna las posiciones en ``indices`` de todos los arcos que salen de
+    ``vertices``, concatenadas en el orden de ``vertices``.
+    """
+    starts = indptr[vertices]
+    counts = indptr[vertices + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Desplazamiento de cada arco dentro del bloque de su vértice
+    block_start = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + (np.arange(total, dtype=np.int64) - block_start)
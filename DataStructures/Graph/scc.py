@@ -0,0 +1,190 @@
+"""
+  Componentes fuertemente conectados de un ``adj_list_graph`` dirigido.
+
+  Se usa el algoritmo de Tarjan en su versión iterativa: un solo recorrido en
+  profundidad con pila explícita, O(V + E), sin recursión. El componente de
+  cada vértice queda en un arreglo indexado por su identificador entero, de
+  modo que ``strongly_connected()`` responde en O(1).
+
+  Tarjan numera los componentes en orden topológico inverso del grafo de
+  componentes: si hay un arco del componente ``a`` al componente ``b``
+  entonces ``a > b``.
+"""
+
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Graph import adj_list_graph as gr
+
+
+def strongly_connected_components(graph):
+    """
+    Calcula los componentes fuertemente conectados del grafo.
+
+    Retorna una estructura con los siguientes atributos:
+    - id: Arreglo con el número de componente de cada vértice, indexado por identificador
+    - count: Número de componentes
+    - graph: El grafo analizado
+
+    En un grafo no dirigido los componentes son los componentes conectados.
+
+    Args:
+        graph (adj_list_graph): El grafo a analizar
+
+    Returns:
+        dict: La estructura de componentes
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    index = array('q', [-1]) * num_vertex
+    low = array('q', [0]) * num_vertex
+    component = array('q', [-1]) * num_vertex
+    on_stack = bytearray(num_vertex)
+    stack = []
+    counter = 0
+    count = 0
+
+    for source in range(num_vertex):
+        if index[source] != -1:
+            continue
+        index[source] = low[source] = counter
+        counter += 1
+        stack.append(source)
+        on_stack[source] = 1
+        work = [source]
+        next_pos = [0]
+        while work:
+            v = work[-1]
+            neighbors = adj_ids[v]['elements']
+            i = next_pos[-1]
+            if i < len(neighbors):
+                w = neighbors[i]
+                next_pos[-1] = i + 1
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append(w)
+                    next_pos.append(0)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                next_pos.pop()
+                # v es la raíz de un componente: se sacan sus vértices de la pila
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+                if work:
+                    u = work[-1]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+
+    return {'id': component,
+            'count': count,
+            'graph': graph,
+            }
+
+
+def count(scc):
+    """
+    Retorna el número de componentes fuertemente conectados.
+
+    Args:
+        scc (dict): Estructura retornada por ``strongly_connected_components()``
+
+    Returns:
+        int: Número de componentes
+    """
+    return scc['count']
+
+
+def component_of(scc, vertex):
+    """
+    Retorna el número de componente del vértice ``vertex``.
+
+    Args:
+        scc (dict): Estructura retornada por ``strongly_connected_components()``
+        vertex (any): Llave del vértice
+
+    Returns:
+        int: Número de componente, o None si el vértice no estaba en el grafo
+    """
+    vid = gr.vertex_id(scc['graph'], vertex)
+    if vid is None or vid >= len(scc['id']):
+        return None
+    return scc['id'][vid]
+
+
+def strongly_connected(scc, vertex_a, vertex_b):
+    """
+    Indica si ``vertex_a`` y ``vertex_b`` están en el mismo componente
+    fuertemente conectado, es decir, si cada uno es alcanzable desde el otro.
+
+    Args:
+        scc (dict): Estructura retornada por ``strongly_connected_components()``
+        vertex_a (any): Llave del primer vértice
+        vertex_b (any): Llave del segundo vértice
+
+    Returns:
+        bool: True si los vértices están fuertemente conectados
+    """
+    component_a = component_of(scc, vertex_a)
+    return component_a is not None and component_a == component_of(scc, vertex_b)
+
+
+def condensation(scc):
+    """
+    Construye el grafo de componentes (condensación) del grafo analizado.
+
+    Es un grafo dirigido acíclico cuyos vértices son los números de componente
+    ``0 .. count-1``; la información de cada vértice es un array_list con las
+    llaves de los vértices del componente. Hay un arco de ``a`` a ``b`` si algún
+    arco del grafo original va de un vértice de ``a`` a uno de ``b``, con el
+    menor peso entre esos arcos.
+
+    Args:
+        scc (dict): Estructura retornada por ``strongly_connected_components()``
+
+    Returns:
+        adj_list_graph: El grafo de componentes
+    """
+    graph = scc['graph']
+    component = scc['id']
+    keys = graph['keys']['elements']
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+
+    members = []
+    for c in range(scc['count']):
+        members.append(lt.new_list())
+    for v in range(len(component)):
+        lt.add_last(members[component[v]], keys[v])
+
+    dag = gr.new_graph(max(scc['count'], 1), directed=True)
+    for c in range(scc['count']):
+        gr.insert_vertex(dag, c, members[c])
+
+    # Menor peso entre cada par de componentes conectados
+    lightest = {}
+    for v in range(len(component)):
+        cv = component[v]
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            cw = component[neighbors[i]]
+            if cv != cw:
+                pair = (cv, cw)
+                weight = weights[i]
+                if pair not in lightest or weight < lightest[pair]:
+                    lightest[pair] = weight
+    for (cv, cw), weight in lightest.items():
+        gr.add_edge(dag, cv, cw, weight)
+    return dag
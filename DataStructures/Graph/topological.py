@@ -0,0 +1,299 @@
+"""
+  Orden topológico y caminos mínimos y máximos en grafos dirigidos acíclicos
+  (DAG) sobre un ``adj_list_graph``.
+
+  - ``topological_order()`` usa el algoritmo de Kahn: parte de los grados de
+    entrada que mantiene el grafo (ver ``adj_list_graph.in_degree()``), saca
+    de una cola los vértices sin arcos de entrada pendientes y descuenta los
+    arcos que salen de ellos. Si al final quedan vértices sin sacar, el
+    grafo tiene un ciclo y se reporta uno de ellos.
+  - ``dag_shortest_path()`` y ``dag_longest_path()`` relajan los arcos en
+    orden topológico, en O(V + E) y sin cola de prioridad; admiten pesos
+    negativos. El camino más largo es el camino crítico de una red de
+    actividades.
+
+  Los resultados de los caminos tienen la forma de ``dijkstra.dijkstra()``
+  (``dist_to``, ``edge_to``) más el ciclo encontrado, si lo hay.
+"""
+
+import math
+from array import array
+
+from DataStructures.Lists import array_list as lt
+from DataStructures.Lists import ring_array_list as queue
+from DataStructures.Graph import adj_list_graph as gr
+from DataStructures.Graph import dijkstra as dj
+
+
+def topological_order(graph):
+    """
+    Calcula un orden topológico de los vértices del grafo con el algoritmo de Kahn.
+
+    Retorna una estructura con los siguientes atributos:
+    - order: array_list con las llaves de los vértices en orden topológico, o
+      None si el grafo tiene un ciclo
+    - cycle: array_list con las llaves de un ciclo dirigido, en el sentido de
+      sus arcos y con el primero repetido al final, o None si el grafo es acíclico
+
+    Args:
+        graph (adj_list_graph): El grafo dirigido
+
+    Returns:
+        dict: La estructura con el orden o el ciclo
+    """
+    order_ids, cycle_ids = topological_order_ids(graph)
+    if cycle_ids is not None:
+        return {'order': None, 'cycle': dj.keys_path(graph, cycle_ids)}
+    return {'order': dj.keys_path(graph, order_ids), 'cycle': None}
+
+
+def topological_order_ids(graph):
+    """
+    Calcula el orden topológico del grafo como identificadores enteros.
+
+    Args:
+        graph (adj_list_graph): El grafo dirigido
+
+    Returns:
+        tuple: ``(order, cycle)``: la lista de identificadores en orden
+        topológico y None, o None y la lista de identificadores de un ciclo
+    """
+    gr.update_vertex_index(graph)
+    num_vertex = lt.size(graph['keys'])
+    adj_ids = graph['adj_ids']['elements']
+    pending = in_degree_ids(graph)
+
+    ready = queue.new_list(num_vertex)
+    for v in range(num_vertex):
+        if pending[v] == 0:
+            queue.add_last(ready, v)
+    order = []
+    while not queue.is_empty(ready):
+        v = queue.remove_first(ready)
+        order.append(v)
+        for w in adj_ids[v]['elements']:
+            pending[w] -= 1
+            if pending[w] == 0:
+                queue.add_last(ready, w)
+
+    if len(order) == num_vertex:
+        return order, None
+    return None, find_cycle(graph, pending)
+
+
+def in_degree_ids(graph):
+    """
+    Retorna el grado de entrada de cada vértice, indexado por identificador.
+
+    Se copian los grados que mantiene el grafo dirigido; si el grafo no es
+    dirigido se cuentan a partir de ``adj_ids`` en O(V + E).
+    """
+    if graph['directed']:
+        return array('q', graph['in_degree']['elements'])
+    counts = array('q', [0]) * lt.size(graph['keys'])
+    for neighbors in graph['adj_ids']['elements']:
+        for w in neighbors['elements']:
+            counts[w] += 1
+    return counts
+
+
+def find_cycle(graph, pending):
+    """
+    Busca un ciclo entre los vértices que Kahn no pudo sacar.
+
+    Cada uno de esos vértices tiene un arco de entrada desde otro de ellos,
+    así que caminando hacia atrás por esos arcos se repite un vértice.
+
+    Args:
+        graph (adj_list_graph): El grafo dirigido
+        pending (array): Grados de entrada pendientes al terminar Kahn
+
+    Returns:
+        list: Identificadores del ciclo en el sentido de los arcos, con el
+        primero repetido al final
+    """
+    reverse_ids = gr.reverse_index(graph)['adj_ids']['elements']
+    start = 0
+    while pending[start] == 0:
+        start += 1
+    position = {}
+    walk = []
+    v = start
+    while v not in position:
+        position[v] = len(walk)
+        walk.append(v)
+        for u in reverse_ids[v]['elements']:
+            if pending[u] > 0:
+                v = u
+                break
+    # ``walk`` va contra el sentido de los arcos
+    cycle = walk[position[v]:]
+    cycle.append(v)
+    cycle.reverse()
+    return cycle
+
+
+def dag_shortest_path(graph, source):
+    """
+    Calcula los caminos de costo mínimo desde ``source`` en un grafo dirigido acíclico.
+
+    Retorna una estructura de búsqueda con los siguientes atributos:
+    - source: Llave del vértice de origen
+    - source_id: Identificador entero del vértice de origen
+    - dist_to: Arreglo con la distancia mínima desde ``source`` (``math.inf`` si no es alcanzable)
+    - edge_to: Arreglo con el identificador del vértice anterior en el camino (-1 si no tiene)
+    - cycle: array_list con las llaves de un ciclo del grafo, o None si es acíclico
+    - longest: False
+    - graph: El grafo recorrido
+
+    Si el grafo tiene un ciclo no se calcula ningún camino.
+
+    Args:
+        graph (adj_list_graph): El grafo dirigido, los pesos pueden ser negativos
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    return dag_paths(graph, source, False)
+
+
+def dag_longest_path(graph, source):
+    """
+    Calcula los caminos de costo máximo desde ``source`` en un grafo dirigido acíclico.
+
+    Retorna la misma estructura de ``dag_shortest_path()``, con ``longest``
+    en True y ``-math.inf`` en ``dist_to`` para los vértices no alcanzables.
+
+    Args:
+        graph (adj_list_graph): El grafo dirigido, los pesos pueden ser negativos
+        source (any): Llave del vértice de origen
+
+    Returns:
+        dict: La estructura de búsqueda, o None si ``source`` no está en el grafo
+    """
+    return dag_paths(graph, source, True)
+
+
+def dag_paths(graph, source, longest):
+    """
+    Relaja los arcos en orden topológico, minimizando o maximizando el costo.
+    """
+    source_id = gr.vertex_id(graph, source)
+    if source_id is None:
+        return None
+    num_vertex = lt.size(graph['keys'])
+    unreached = -math.inf if longest else math.inf
+    dist = array('d', [unreached]) * num_vertex
+    edge_to = array('q', [-1]) * num_vertex
+    search = {'source': source,
+              'source_id': source_id,
+              'dist_to': dist,
+              'edge_to': edge_to,
+              'cycle': None,
+              'longest': longest,
+              'graph': graph,
+              }
+    order, cycle = topological_order_ids(graph)
+    if cycle is not None:
+        search['cycle'] = dj.keys_path(graph, cycle)
+        return search
+
+    adj_ids = graph['adj_ids']['elements']
+    adj_weights = graph['adj_weights']['elements']
+    dist[source_id] = 0.0
+    # Los vértices anteriores al origen en el orden no son alcanzables
+    for v in order[order.index(source_id):]:
+        d = dist[v]
+        if d == unreached:
+            continue
+        neighbors = adj_ids[v]['elements']
+        weights = adj_weights[v]['elements']
+        for i in range(len(neighbors)):
+            w = neighbors[i]
+            nd = d + weights[i]
+            if (nd > dist[w]) if longest else (nd < dist[w]):
+                dist[w] = nd
+                edge_to[w] = v
+    return search
+
+
+def has_cycle(search):
+    """
+    Indica si el grafo de la búsqueda tiene un ciclo.
+
+    Args:
+        search (dict): Estructura retornada por ``dag_shortest_path()`` o ``dag_longest_path()``
+
+    Returns:
+        bool: True si el grafo no es acíclico
+    """
+    return search['cycle'] is not None
+
+
+def cycle(search):
+    """
+    Retorna el ciclo que impidió calcular los caminos.
+
+    Args:
+        search (dict): Estructura retornada por ``dag_shortest_path()`` o ``dag_longest_path()``
+
+    Returns:
+        array_list: Llaves de los vértices del ciclo, con el primero repetido al final,
+        o None si el grafo es acíclico
+    """
+    return search['cycle']
+
+
+def has_path_to(search, vertex):
+    """
+    Indica si existe un camino desde el origen de la búsqueda hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dag_shortest_path()`` o ``dag_longest_path()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        bool: True si ``vertex`` es alcanzable desde el origen
+    """
+    vid = gr.vertex_id(search['graph'], vertex)
+    if vid is None or vid >= len(search['dist_to']):
+        return False
+    return abs(search['dist_to'][vid]) < math.inf
+
+
+def dist_to(search, vertex):
+    """
+    Retorna el costo del camino mínimo (o máximo) desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dag_shortest_path()`` o ``dag_longest_path()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        float: Costo del camino; si no hay camino ``math.inf`` en la búsqueda
+        de mínimos y ``-math.inf`` en la de máximos
+    """
+    if not has_path_to(search, vertex):
+        return -math.inf if search['longest'] else math.inf
+    return search['dist_to'][gr.vertex_id(search['graph'], vertex)]
+
+
+def path_to(search, vertex):
+    """
+    Retorna el camino de costo mínimo (o máximo) desde el origen hasta ``vertex``.
+
+    Args:
+        search (dict): Estructura retornada por ``dag_shortest_path()`` o ``dag_longest_path()``
+        vertex (any): Llave del vértice destino
+
+    Returns:
+        array_list: Llaves de los vértices del camino, desde el origen hasta ``vertex``,
+        o None si no hay camino
+    """
+    if not has_path_to(search, vertex):
+        return None
+    graph = search['graph']
+    ids = dj.ids_path(search['edge_to'], gr.vertex_id(graph, vertex))
+    ids.reverse()
+    return dj.keys_path(graph, ids)
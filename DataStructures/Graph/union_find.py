@@ -0,0 +1,129 @@
+"""
+  Conjuntos disjuntos (Union-Find) sobre los enteros ``0 .. n-1``.
+
+  Usa unión por tamaño y compresión de caminos por mitades (cada vértice
+  visitado en ``find()`` pasa a apuntar a su abuelo), por lo que una
+  secuencia de operaciones cuesta casi O(1) amortizado por operación. Los
+  padres y tamaños se guardan en ``array('q')``.
+"""
+
+from array import array
+
+
+def new_union_find(n=0):
+    """
+    Crea una estructura con ``n`` conjuntos de un elemento.
+
+    Args:
+        n (int): Número de elementos iniciales
+
+    Returns:
+        union_find: La estructura creada
+    """
+    return {'parent': array('q', range(n)),
+            'size': array('q', [1]) * n,
+            'count': n,
+            'type': 'UNION_FIND',
+            }
+
+
+def add(uf):
+    """
+    Agrega un nuevo elemento en su propio conjunto.
+
+    Args:
+        uf (union_find): La estructura
+
+    Returns:
+        int: El nuevo elemento (igual al número de elementos antes de agregarlo)
+    """
+    element = len(uf['parent'])
+    uf['parent'].append(element)
+    uf['size'].append(1)
+    uf['count'] += 1
+    return element
+
+
+def find(uf, element):
+    """
+    Retorna el representante del conjunto de ``element``.
+
+    Args:
+        uf (union_find): La estructura
+        element (int): El elemento
+
+    Returns:
+        int: El representante del conjunto
+    """
+    parent = uf['parent']
+    while parent[element] != element:
+        parent[element] = parent[parent[element]]
+        element = parent[element]
+    return element
+
+
+def union(uf, element_a, element_b):
+    """
+    Une los conjuntos de ``element_a`` y ``element_b``.
+
+    Args:
+        uf (union_find): La estructura
+        element_a (int): Un elemento del primer conjunto
+        element_b (int): Un elemento del segundo conjunto
+
+    Returns:
+        bool: True si los conjuntos eran distintos y se unieron
+    """
+    root_a = find(uf, element_a)
+    root_b = find(uf, element_b)
+    if root_a == root_b:
+        return False
+    sizes = uf['size']
+    if sizes[root_a] < sizes[root_b]:
+        root_a, root_b = root_b, root_a
+    uf['parent'][root_b] = root_a
+    sizes[root_a] += sizes[root_b]
+    uf['count'] -= 1
+    return True
+
+
+def connected(uf, element_a, element_b):
+    """
+    Indica si ``element_a`` y ``element_b`` están en el mismo conjunto.
+
+    Args:
+        uf (union_find): La estructura
+        element_a (int): El primer elemento
+        element_b (int): El segundo elemento
+
+    Returns:
+        bool: True si están en el mismo conjunto
+    """
+    return find(uf, element_a) == find(uf, element_b)
+
+
+def count(uf):
+    """
+    Retorna el número de conjuntos.
+
+    Args:
+        uf (union_find): La estructura
+
+    Returns:
+        int: El número de conjuntos
+    """
+    return uf['count']
+
+
+def set_size(uf, element):
+    """
+    Retorna el número de elementos del conjunto de ``element``.
+
+    Args:
+        uf (union_find): La estructura
+        element (int): El elemento
+
+    Returns:
+        int: El tamaño del conjunto
+    """
+    return uf['size'][find(uf, element)]
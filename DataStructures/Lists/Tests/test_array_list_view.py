@@ -0,0 +1,110 @@
+import pytest
+from DataStructures.Lists import array_list as al
+from DataStructures.Lists import array_list_view as lv
+
+
+def setup_tests():
+    lista = al.new_list()
+    for i in range(10):
+        al.add_last(lista, i)
+    return lista
+
+
+def compare_from_tests(element1, element2):
+    if element1 == element2:
+        return 0
+    elif element1 > element2:
+        return 1
+    return -1
+
+
+def test_new_view():
+    lista = setup_tests()
+
+    view = lv.new_view(lista, 2, 5)
+    assert lv.size(view) == 5
+    assert view["storage"] is lista["elements"]
+    assert lv.first_element(view) == 2
+    assert lv.last_element(view) == 6
+    assert lv.get_element(view, 3) == 5
+
+    # El tamaño se recorta al final de la lista
+    assert lv.size(lv.new_view(lista, 8, 5)) == 2
+    assert lv.new_view(lista, 10, 1) is None
+    assert lv.new_view(lista, -1, 1) is None
+
+
+def test_iterator_and_is_present():
+    lista = setup_tests()
+
+    view = lv.new_view(lista, 3, 4)
+    assert list(lv.iterator(view)) == [3, 4, 5, 6]
+    assert lv.is_present(view, 5, compare_from_tests) == 2
+    assert lv.is_present(view, 8, compare_from_tests) == -1
+
+
+def test_nested_view():
+    lista = setup_tests()
+
+    page = lv.sub_list(lv.new_view(lista, 2, 6), 1, 3)
+    assert page["storage"] is lista["elements"]
+    assert list(lv.iterator(page)) == [3, 4, 5]
+
+
+def test_view_sees_parent_changes():
+    lista = setup_tests()
+
+    view = lv.new_view(lista, 0, 3)
+    al.change_info(lista, 1, 100)
+    assert lv.get_element(view, 1) == 100
+
+
+def test_write_materializes():
+    lista = setup_tests()
+
+    view = lv.new_view(lista, 4, 3)
+    lv.change_info(view, 0, 40)
+    assert view["owned"]
+    assert view["storage"] is not lista["elements"]
+    assert list(lv.iterator(view)) == [40, 5, 6]
+    assert lista["elements"] == list(range(10))
+
+    lv.add_last(view, 7)
+    lv.add_first(view, 3)
+    lv.exchange(view, 0, 4)
+    assert list(lv.iterator(view)) == [7, 40, 5, 6, 3]
+    assert lista["elements"] == list(range(10))
+
+
+def test_to_list():
+    lista = setup_tests()
+
+    copy = lv.to_list(lv.new_view(lista, 5, 3))
+    assert al.size(copy) == 3
+    assert copy["elements"] == [5, 6, 7]
+
+
+def test_array_list_functions_reject_view():
+    lista = setup_tests()
+
+    view = lv.new_view(lista, 4, 3)
+    with pytest.raises(KeyError):
+        al.get_element(view, 0)
+    with pytest.raises(KeyError):
+        al.size(view)
+
+
+def test_page():
+    lista = setup_tests()
+
+    assert lv.num_pages(lista, 4) == 3
+    pages = [list(lv.iterator(lv.page(lista, n, 4))) for n in range(lv.num_pages(lista, 4))]
+    assert pages == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert lv.page(lista, 1, 4)["storage"] is lista["elements"]
+    assert lv.page(lista, 3, 4) is None
+    assert lv.page(lista, 0, 0) is None
+
+    # Una página de una vista se cuenta desde el inicio de la vista
+    view = lv.new_view(lista, 3, 6)
+    assert lv.num_pages(view, 4) == 2
+    assert list(lv.iterator(lv.page(view, 1, 4))) == [7, 8]
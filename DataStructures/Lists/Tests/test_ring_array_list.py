@@ -0,0 +1,124 @@
+import pytest
+from DataStructures.Lists import ring_array_list as lt
+
+
+def setup_tests():
+    return lt.new_list(4)
+
+
+def compare_from_tests(element1, element2):
+    if element1 == element2:
+        return 0
+    elif element1 > element2:
+        return 1
+    return -1
+
+
+def to_python_list(lista):
+    return [lt.get_element(lista, i) for i in range(lt.size(lista))]
+
+
+def test_new_list():
+    lista = setup_tests()
+    assert lt.size(lista) == 0
+    assert lt.is_empty(lista)
+    assert lt.capacity(lista) == 4
+    assert lista["type"] == "RING_ARRAY_LIST"
+
+
+def test_add_first_and_last():
+    lista = setup_tests()
+
+    for i in range(10):
+        lt.add_first(lista, i)
+        lt.add_last(lista, i + 100)
+
+    assert lt.size(lista) == 20
+    assert lt.capacity(lista) >= 20
+    assert to_python_list(lista) == list(range(9, -1, -1)) + list(range(100, 110))
+    assert lt.first_element(lista) == 9
+    assert lt.last_element(lista) == 109
+
+
+def test_remove_first_and_last():
+    lista = setup_tests()
+
+    assert lt.remove_first(lista) is None
+    assert lt.remove_last(lista) is None
+
+    for i in range(6):
+        lt.add_last(lista, i)
+
+    assert lt.remove_first(lista) == 0
+    assert lt.remove_last(lista) == 5
+    assert lt.remove_first(lista) == 1
+    assert to_python_list(lista) == [2, 3, 4]
+
+
+def test_queue_wraps_around():
+    lista = setup_tests()
+
+    # Uso como cola: el inicio avanza y el arreglo da la vuelta sin crecer
+    for i in range(100):
+        lt.add_last(lista, i)
+        assert lt.remove_first(lista) == i
+    assert lt.is_empty(lista)
+    assert lt.capacity(lista) == 4
+
+
+def test_reserve_and_shrink_to_fit():
+    lista = setup_tests()
+
+    lt.add_last(lista, 1)
+    lt.add_first(lista, 0)
+    lt.reserve(lista, 100)
+    assert lt.capacity(lista) == 100
+    assert to_python_list(lista) == [0, 1]
+
+    lt.reserve(lista, 10)
+    assert lt.capacity(lista) == 100
+
+    lt.shrink_to_fit(lista)
+    assert lt.capacity(lista) == 2
+    assert to_python_list(lista) == [0, 1]
+
+
+def test_insert_and_delete_element():
+    lista = setup_tests()
+
+    for i in range(5):
+        lt.add_last(lista, i)
+    lt.insert_element(lista, 10, 1)
+    lt.insert_element(lista, 20, 5)
+    lt.insert_element(lista, 30, 0)
+    lt.insert_element(lista, 40, lt.size(lista))
+    assert to_python_list(lista) == [30, 0, 10, 1, 2, 3, 20, 4, 40]
+
+    lt.delete_element(lista, 2)
+    lt.delete_element(lista, 6)
+    lt.delete_element(lista, 0)
+    assert to_python_list(lista) == [0, 1, 2, 3, 20, 40]
+
+
+def test_change_info_exchange_is_present():
+    lista = setup_tests()
+
+    for i in range(5):
+        lt.add_first(lista, i)
+
+    lt.change_info(lista, 0, 10)
+    lt.exchange(lista, 1, 4)
+    assert to_python_list(lista) == [10, 0, 2, 1, 3]
+    assert lt.is_present(lista, 2, compare_from_tests) == 2
+    assert lt.is_present(lista, 7, compare_from_tests) == -1
+
+
+def test_sub_list():
+    lista = setup_tests()
+
+    for i in range(6):
+        lt.add_first(lista, i)
+
+    sub = lt.sub_list(lista, 1, 3)
+    assert to_python_list(sub) == [4, 3, 2]
+    assert lt.sub_list(lista, 6, 1) is None
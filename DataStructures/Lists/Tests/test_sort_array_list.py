@@ -183,7 +183,6 @@ def test_merge_sort():
     for i in range(0, 14):
         assert lt.get_element(back_up, i) == reference_inverted_list[i]
 
-@pytest.mark.skip(reason="No implementado aun")
 def test_quick_sort():
     empty_list, one_element_list, random_lista, inverted_list = setup_tests()
     back_up = random_lista
@@ -220,3 +219,116 @@ def test_quick_sort():
     assert lt.size(back_up) == 15
     for i in range(0, 14):
         assert lt.get_element(back_up, i) == reference_inverted_list[i]
+
+
+def test_quick_sort_sorted_and_duplicates():
+    import sys
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        sorted_list = lt.new_list()
+        for i in range(5000):
+            lt.add_last(sorted_list, i)
+        lt.quick_sort(sorted_list, sort_criteria_increasingly)
+        assert sorted_list["elements"] == list(range(5000))
+
+        lt.quick_sort(sorted_list, sort_criteria_decreasingly)
+        assert sorted_list["elements"] == list(range(4999, -1, -1))
+
+        duplicates = lt.new_list()
+        for i in range(5000):
+            lt.add_last(duplicates, (i * 7919) % 3)
+        lt.quick_sort(duplicates, lt.default_sort_criteria)
+        assert duplicates["elements"] == sorted((i * 7919) % 3 for i in range(5000))
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_heap_sort():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.heap_sort(empty_list, sort_criteria_increasingly)
+    assert lt.size(empty_list) == 0
+
+    lt.heap_sort(one_element_list, sort_criteria_increasingly)
+    assert lt.first_element(one_element_list) == 10
+
+    lt.heap_sort(random_lista, sort_criteria_increasingly)
+    assert random_lista["elements"] == ordered_list
+
+    lt.heap_sort(inverted_list, lt.default_sort_criteria)
+    assert inverted_list["elements"] == list(range(1, 16))
+
+    lt.heap_sort(random_lista, sort_criteria_decreasingly)
+    assert random_lista["elements"] == reference_inverted_list
+
+
+def test_top_k():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    assert lt.size(lt.top_k(empty_list, 3, sort_criteria_increasingly)) == 0
+    assert lt.size(lt.top_k(random_lista, 0, sort_criteria_increasingly)) == 0
+
+    top = lt.top_k(one_element_list, 3, sort_criteria_increasingly)
+    assert lt.size(top) == 1
+    assert lt.first_element(top) == 10
+
+    top = lt.top_k(random_lista, 4, sort_criteria_increasingly)
+    assert lt.size(top) == 4
+    for i in range(0, 4):
+        assert lt.get_element(top, i) == ordered_list[i]
+
+    top = lt.top_k(random_lista, 5, sort_criteria_decreasingly)
+    assert lt.size(top) == 5
+    for i in range(0, 5):
+        assert lt.get_element(top, i) == reference_inverted_list[i]
+
+    # La lista original no se modifica
+    for i in range(0, 15):
+        assert lt.get_element(random_lista, i) == un_ordered_list[i]
+
+
+def test_nth_element():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    assert lt.nth_element(empty_list, 0, sort_criteria_increasingly) is None
+    assert lt.nth_element(one_element_list, 0, sort_criteria_increasingly) == 10
+    assert lt.nth_element(random_lista, 15, sort_criteria_increasingly) is None
+
+    for i in range(0, 15):
+        assert lt.nth_element(random_lista, i, sort_criteria_increasingly) == ordered_list[i]
+        assert lt.nth_element(inverted_list, i, sort_criteria_decreasingly) == 15 - i
+
+    big_list = lt.new_list()
+    for i in range(1000):
+        lt.add_last(big_list, (i * 7919) % 1000)
+    assert lt.nth_element(big_list, 500, lt.default_sort_criteria) == 500
+
+
+def test_parallel_merge_sort(monkeypatch):
+    from operator import itemgetter
+
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.parallel_merge_sort(empty_list, processes=2)
+    assert lt.size(empty_list) == 0
+
+    lt.parallel_merge_sort(one_element_list, processes=2)
+    assert lt.first_element(one_element_list) == 10
+
+    # Por debajo del umbral se ordena en el proceso actual
+    lt.parallel_merge_sort(random_lista, processes=2)
+    assert random_lista["elements"] == ordered_list
+
+    monkeypatch.setattr(lt, "PARALLEL_SORT_THRESHOLD", 0)
+    edges = lt.new_list()
+    for i in range(1000):
+        lt.add_last(edges, {"id": i, "weight": (i * 7919) % 10})
+    lt.parallel_merge_sort(edges, key=itemgetter("weight"), processes=2, chunk_size=128)
+    assert lt.size(edges) == 1000
+    expected = sorted(({"id": i, "weight": (i * 7919) % 10} for i in range(1000)),
+                      key=itemgetter("weight"))
+    assert edges["elements"] == expected
+
+    lt.parallel_merge_sort(inverted_list, reverse=True, processes=2, chunk_size=4)
+    assert inverted_list["elements"] == list(range(15, 0, -1))
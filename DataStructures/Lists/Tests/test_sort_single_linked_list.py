@@ -220,3 +220,68 @@ def test_quick_sort():
     assert lt.size(back_up) == 15
     for i in range(0, 14):
         assert lt.get_element(back_up, i) == reference_inverted_list[i]
+
+
+def test_top_k():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    assert lt.size(lt.top_k(empty_list, 3, sort_criteria_increasingly)) == 0
+    assert lt.size(lt.top_k(random_lista, 0, sort_criteria_increasingly)) == 0
+
+    top = lt.top_k(one_element_list, 3, sort_criteria_increasingly)
+    assert lt.size(top) == 1
+    assert lt.first_element(top) == 10
+
+    top = lt.top_k(random_lista, 4, sort_criteria_increasingly)
+    assert lt.size(top) == 4
+    for i in range(0, 4):
+        assert lt.get_element(top, i) == ordered_list[i]
+
+    top = lt.top_k(random_lista, 5, sort_criteria_decreasingly)
+    assert lt.size(top) == 5
+    for i in range(0, 5):
+        assert lt.get_element(top, i) == reference_inverted_list[i]
+
+    # La lista original no se modifica
+    for i in range(0, 15):
+        assert lt.get_element(random_lista, i) == un_ordered_list[i]
+
+
+def test_nth_element():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    assert lt.nth_element(empty_list, 0, sort_criteria_increasingly) is None
+    assert lt.nth_element(one_element_list, 0, sort_criteria_increasingly) == 10
+    assert lt.nth_element(random_lista, 15, sort_criteria_increasingly) is None
+
+    for i in range(0, 15):
+        assert lt.nth_element(random_lista, i, sort_criteria_increasingly) == ordered_list[i]
+        assert lt.nth_element(inverted_list, i, sort_criteria_decreasingly) == 15 - i
+
+    big_list = lt.new_list()
+    for i in range(1000):
+        lt.add_last(big_list, (i * 7919) % 1000)
+    assert lt.nth_element(big_list, 500, lt.default_sort_criteria) == 500
+
+
+def test_quick_sort_sorted_input():
+    import sys
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        sorted_list = lt.new_list()
+        for i in range(1500):
+            lt.add_last(sorted_list, i)
+        lt.quick_sort(sorted_list, sort_criteria_increasingly)
+        assert [lt.get_element(sorted_list, i) for i in range(0, 1500, 100)] == list(range(0, 1500, 100))
+
+        lt.quick_sort(sorted_list, sort_criteria_decreasingly)
+        assert lt.first_element(sorted_list) == 1499
+        assert lt.last_element(sorted_list) == 0
+
+        random_list = setup_tests()[2]
+        lt.quick_sort(random_list, sort_criteria_increasingly)
+        for i in range(0, 15):
+            assert lt.get_element(random_list, i) == ordered_list[i]
+    finally:
+        sys.setrecursionlimit(limit)
@@ -0,0 +1,110 @@
+import struct
+
+import pytest
+from DataStructures.Lists import typed_array_list as lt
+
+
+def setup_tests():
+    return lt.new_list('d')
+
+
+def compare_from_tests(element1, element2):
+    if element1 == element2:
+        return 0
+    elif element1 > element2:
+        return 1
+    return -1
+
+
+def test_new_list():
+    lista = setup_tests()
+    assert lt.size(lista) == 0
+    assert lt.is_empty(lista)
+    assert lista["typecode"] == "d"
+
+    ids = lt.new_list('q', range(5))
+    assert lt.size(ids) == 5
+    assert lt.last_element(ids) == 4
+
+    with pytest.raises(ValueError):
+        lt.new_list('x')
+
+
+def test_add_and_get():
+    lista = setup_tests()
+
+    lt.add_last(lista, 1.5)
+    lt.add_last(lista, 2.5)
+    lt.add_first(lista, 0.5)
+    lt.insert_element(lista, 1.0, 1)
+    lt.insert_element(lista, 9.0, 10)
+
+    assert lt.size(lista) == 4
+    assert [lt.get_element(lista, i) for i in range(4)] == [0.5, 1.0, 1.5, 2.5]
+    assert lt.first_element(lista) == 0.5
+    assert lt.last_element(lista) == 2.5
+
+    lt.add_all(lista, [3.5, 4.5])
+    assert lt.size(lista) == 6
+
+    with pytest.raises(TypeError):
+        lt.add_last(lista, "no numerico")
+    assert lt.size(lista) == 6
+
+
+def test_remove_and_delete():
+    lista = lt.new_list('i', [1, 2, 3, 4, 5])
+
+    assert lt.remove_first(lista) == 1
+    assert lt.remove_last(lista) == 5
+    lt.delete_element(lista, 1)
+    assert lt.size(lista) == 2
+    assert list(lista["elements"]) == [2, 4]
+
+    empty = setup_tests()
+    assert lt.remove_first(empty) is None
+    assert lt.remove_last(empty) is None
+
+
+def test_change_exchange_present():
+    lista = lt.new_list('q', [5, 6, 7])
+
+    lt.change_info(lista, 0, 50)
+    lt.exchange(lista, 1, 2)
+    assert list(lista["elements"]) == [50, 7, 6]
+    assert lt.is_present(lista, 7, compare_from_tests) == 1
+    assert lt.is_present(lista, 8, compare_from_tests) == -1
+
+
+def test_sub_list_and_sort():
+    lista = lt.new_list('d', [3.0, 1.0, 2.0, 5.0])
+
+    sub = lt.sub_list(lista, 1, 2)
+    assert sub["typecode"] == "d"
+    assert list(sub["elements"]) == [1.0, 2.0]
+
+    lt.sort(lista)
+    assert list(lista["elements"]) == [1.0, 2.0, 3.0, 5.0]
+    lt.sort(lista, reverse=True)
+    assert list(lista["elements"]) == [5.0, 3.0, 2.0, 1.0]
+
+
+def test_as_memoryview():
+    lista = lt.new_list('d', [1.0, 2.0, 3.0])
+
+    view = lt.as_memoryview(lista)
+    assert view.format == "d"
+    assert view.nbytes == 3 * 8
+    assert struct.unpack("3d", view) == (1.0, 2.0, 3.0)
+
+    # Los cambios por el memoryview se ven en la lista sin copiar
+    view[1] = 20.0
+    assert lt.get_element(lista, 1) == 20.0
+
+    with pytest.raises(BufferError):
+        lt.add_last(lista, 4.0)
+    assert lt.size(lista) == 3
+
+    view.release()
+    lt.add_last(lista, 4.0)
+    assert lt.size(lista) == 4
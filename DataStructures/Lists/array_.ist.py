@@ -1,3 +1,7 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 def new_list():
     """Inicializa una nueva lista.
 
@@ -169,6 +173,9 @@ def exchange(my_list, pos1, pos2):
 def sub_list(my_list, pos, numelem):
     """Devuelve una sublista comenzando desde una posición con un número específico de elementos.
 
+    Los elementos se copian a una lista nueva. Para recorrer o paginar un
+    segmento sin copiarlo ver ``array_list_view.new_view()`` y ``array_list_view.page()``.
+
     Args:
         my_list (array_list): La lista de la cual obtener la sublista.
         pos (int): La posición inicial de la sublista, contando desde cero.
@@ -342,16 +349,28 @@ def shell_sort(my_list, sort_crit):
             h //= 3    # h se decrementa en un tercio
     return my_list
 
+# Segmentos de este tamaño o menores se ordenan con insertion sort en merge sort y quick sort
+INSERTION_SORT_CUTOFF = 16
+# Segmentos mayores a este tamaño eligen el pivot con la ninther de Tukey
+NINTHER_CUTOFF = 40
+
 def merge_sort(my_list, sort_crit):
     """ Función de ordenamiento que implementa el algoritmo de **Merge Sort**
 
         Se divide la lista en dos partes, se ordenan las partes y se combinan
         las partes ordenadas.
 
+        Las partes se manejan como rangos de posiciones sobre la misma lista, sin
+        crear sublistas: se usa un solo arreglo auxiliar, en el que se copia la
+        mitad izquierda de cada rango justo antes de combinarla. Si las dos
+        mitades ya están en orden no se combinan. El ordenamiento es estable.
+
         Si la lista es vacía o tiene un solo elemento, se retorna la lista original.
 
         Dependiendo de la función de comparación, se ordena la lista de manera ascendente o descendente.
 
+        Para listas de millones de elementos ver ``parallel_merge_sort()``.
+
         :param my_list: Lista a ordenar
         :type my_list: array_list
         :param sort_crit: Función de comparación de elementos para ordenar
@@ -363,49 +382,158 @@ def merge_sort(my_list, sort_crit):
     """
     n = size(my_list)
     if n > 1:
-        mid = (n // 2)
-        #se divide la lista original, en dos partes, izquierda y derecha, desde el punto mid.
-        left_list = sub_list(my_list, 0, mid)
-        right_list = sub_list(my_list, mid, n - mid)
-
-        #se hace el llamado recursivo con la lista izquierda y derecha 
-        merge_sort(left_list, sort_crit)
-        merge_sort(right_list, sort_crit)
-
-        #i recorre la lista izquierda, j la derecha y k la lista original
-        i = j = k = 0
-
-        left_elements = size(left_list)
-        righ_telements = size(right_list)
-
-        while (i < left_elements) and (j < righ_telements):
-            elem_i = get_element(left_list, i)
-            elem_j = get_element(right_list, j)
-            # compara y ordena los elementos
-            if sort_crit(elem_j, elem_i):   # caso estricto elem_j < elem_i
-                change_info(my_list, k, elem_j)
-                j += 1
-            else:                            # caso elem_i <= elem_j
-                change_info(my_list, k, elem_i)
-                i += 1
-            k += 1
-
-        # Agrega los elementos que no se comprararon y estan ordenados
-        while i < left_elements:
-            change_info(my_list, k, get_element(left_list, i))
-            i += 1
-            k += 1
+        aux = [None] * ((n + 1) // 2)
+        merge_sort_recursive(my_list, aux, 0, n, sort_crit)
+    return my_list
+
+def merge_sort_recursive(my_list, aux, lo, hi, sort_crit):
+    """ Función recursiva que ordena el rango ``[lo, hi)``, esta es llamada por la función ``merge_sort()``
 
-        while j < righ_telements:
-            change_info(my_list, k, get_element(right_list, j))
+        Los rangos de hasta ``INSERTION_SORT_CUTOFF`` elementos se ordenan con
+        insertion sort.
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param aux: Arreglo auxiliar de al menos la mitad del tamaño de la lista
+        :type aux: list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param hi: Posición siguiente al último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+    """
+    if hi - lo <= INSERTION_SORT_CUTOFF:
+        insertion_sort_range(my_list, lo, hi - 1, sort_crit)
+        return
+    mid = (lo + hi) // 2
+    merge_sort_recursive(my_list, aux, lo, mid, sort_crit)
+    merge_sort_recursive(my_list, aux, mid, hi, sort_crit)
+    elements = my_list['elements']
+    # caso en que las dos mitades ya estan en orden
+    if not sort_crit(elements[mid], elements[mid-1]):
+        return
+    merge(elements, aux, lo, mid, hi, sort_crit)
+
+def merge(elements, aux, lo, mid, hi, sort_crit):
+    """ Combina los rangos ordenados ``[lo, mid)`` y ``[mid, hi)`` de ``elements``
+
+        Se copia solo la mitad izquierda a ``aux`` y se va escribiendo el
+        resultado en ``elements`` desde ``lo``; la mitad derecha nunca se
+        sobreescribe antes de ser leída.
+
+        :param elements: Arreglo con los elementos de la lista
+        :type elements: list
+        :param aux: Arreglo auxiliar de al menos ``mid - lo`` posiciones
+        :type aux: list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param mid: Posición del primer elemento de la mitad derecha
+        :type mid: int
+        :param hi: Posición siguiente al último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+    """
+    left_elements = mid - lo
+    aux[0:left_elements] = elements[lo:mid]
+    #i recorre la mitad izquierda (en aux), j la derecha y k el resultado
+    i = 0
+    j = mid
+    k = lo
+    while i < left_elements and j < hi:
+        elem_i = aux[i]
+        elem_j = elements[j]
+        if sort_crit(elem_j, elem_i) and not sort_crit(elem_i, elem_j):   # caso estricto elem_j < elem_i
+            elements[k] = elem_j
             j += 1
-            k += 1
+        else:                            # caso elem_i <= elem_j
+            elements[k] = elem_i
+            i += 1
+        k += 1
+    # Los elementos que quedan en la derecha ya estan en su lugar
+    if i < left_elements:
+        elements[k:hi] = aux[i:left_elements]
+
+# Listas más pequeñas que esto se ordenan en un solo proceso en parallel_merge_sort
+PARALLEL_SORT_THRESHOLD = 100000
+
+def parallel_merge_sort(my_list, key=None, reverse=False, processes=None, chunk_size=None):
+    """ Función de ordenamiento que implementa un **Merge Sort** paralelo con varios procesos
+
+        Los elementos se dividen en bloques de ``chunk_size`` elementos, cada
+        bloque se ordena en un proceso distinto de un ``ProcessPoolExecutor`` y
+        los bloques ordenados se combinan con un merge de k vías basado en un heap.
+        El ordenamiento es estable.
+
+        A diferencia de ``merge_sort()``, el criterio de ordenamiento se expresa
+        con una función ``key`` que debe poder serializarse con ``pickle`` para
+        enviarse a los procesos: una función definida a nivel de módulo o
+        ``operator.itemgetter`` / ``operator.attrgetter``, nunca una lambda.
+        Los elementos también deben poder serializarse.
+
+        Si la lista tiene menos de ``PARALLEL_SORT_THRESHOLD`` elementos o se
+        pide un solo proceso, se ordena en el proceso actual.
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param key: Función que retorna la llave de ordenamiento de cada elemento (por defecto el elemento)
+        :type key: function
+        :param reverse: Si es ``True`` se ordena de manera descendente
+        :type reverse: bool
+        :param processes: Número de procesos a utilizar (por defecto ``os.cpu_count()``)
+        :type processes: int
+        :param chunk_size: Número de elementos por bloque (por defecto ``n / processes``)
+        :type chunk_size: int
+
+        :returns: Lista ordenada
+        :rtype: array_list
+    """
+    n = size(my_list)
+    if n <= 1:
+        return my_list
+    if processes is None:
+        processes = os.cpu_count() or 1
+    elements = my_list['elements']
+    if processes <= 1 or n < PARALLEL_SORT_THRESHOLD:
+        elements.sort(key=key, reverse=reverse)
+        return my_list
+    if chunk_size is None:
+        chunk_size = -(-n // processes)
+    chunk_size = max(chunk_size, 1)
+    chunks = [elements[i:i + chunk_size] for i in range(0, n, chunk_size)]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        sorted_chunks = list(executor.map(sort_chunk, chunks,
+                                          [key] * len(chunks),
+                                          [reverse] * len(chunks)))
+    my_list['elements'] = list(heapq.merge(*sorted_chunks, key=key, reverse=reverse))
     return my_list
 
+def sort_chunk(chunk, key, reverse):
+    """ Ordena un bloque de elementos, es llamada por ``parallel_merge_sort()`` en cada proceso
+
+        :param chunk: Elementos a ordenar
+        :type chunk: list
+        :param key: Función que retorna la llave de ordenamiento de cada elemento
+        :type key: function
+        :param reverse: Si es ``True`` se ordena de manera descendente
+        :type reverse: bool
+
+        :returns: Bloque ordenado
+        :rtype: list
+    """
+    chunk.sort(key=key, reverse=reverse)
+    return chunk
+
 def quick_sort(my_list, sort_crit):
     """ Función de ordenamiento que implementa el algoritmo de **Quick Sort**
+        en su variante **Introsort**
 
-        Se selecciona un elemento como **pivot** y se ordenan los elementos
+        Se selecciona un **pivot** con la mediana de tres (o la *ninther* en
+        segmentos grandes) y se particiona la lista en tres partes: menores,
+        iguales y mayores al **pivot**. Los segmentos pequeños se ordenan con
+        insertion sort y, si la profundidad supera ``2*log2(n)``, el segmento
+        se termina de ordenar con heap sort, garantizando O(n log n).
 
         Si la lista es vacía o tiene un solo elemento, se retorna la lista original.
 
@@ -420,16 +548,21 @@ def quick_sort(my_list, sort_crit):
         :rtype: array_list
 
     """
-    quick_sort_recursive(my_list, 0, size(my_list)-1, sort_crit)
+    n = size(my_list)
+    if n > 1:
+        depth_limit = 2 * (n.bit_length() - 1)
+        quick_sort_recursive(my_list, 0, n-1, sort_crit, depth_limit)
     return my_list
 
-def quick_sort_recursive(my_list, lo, hi, sort_crit):
-    """ Función recursiva que implementa el algoritmo de **quick sort**, esta es llamada por la función ``quick_sort()``
+def quick_sort_recursive(my_list, lo, hi, sort_crit, depth_limit=None):
+    """ Función que implementa el ciclo principal de **quick sort**, esta es llamada por la función ``quick_sort()``
 
-        Se localiza el **pivot**, utilizando la funcion de particion.
+        Se particiona el segmento ``[lo, hi]`` en tres partes utilizando la
+        función ``partition_three_way()``. Se hace la recursión sobre la parte
+        más pequeña y se itera sobre la más grande, de modo que la profundidad
+        de la pila es O(log n).
 
-        Luego se hace la recursión con los elementos a la izquierda del **pivot**
-        y los elementos a la derecha del **pivot**
+        Cuando ``depth_limit`` llega a cero el segmento se ordena con heap sort.
 
         :param my_list: Lista a ordenar
         :type my_list: array_list
@@ -439,16 +572,29 @@ def quick_sort_recursive(my_list, lo, hi, sort_crit):
         :type hi: int
         :param sort_crit: Función de comparación de elementos para ordenar
         :type sort_crit: function
+        :param depth_limit: Número de particiones permitidas antes de usar heap sort
+        :type depth_limit: int
     """
-    if (lo >= hi):
-        return
-    pivot = partition(my_list, lo, hi, sort_crit)
-    quick_sort_recursive(my_list, lo, pivot-1, sort_crit)
-    quick_sort_recursive(my_list, pivot+1, hi, sort_crit)
+    if depth_limit is None:
+        depth_limit = 2 * max(hi - lo + 1, 1).bit_length()
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            heap_sort_range(my_list, lo, hi, sort_crit)
+            return
+        depth_limit -= 1
+        lt, gt = partition_three_way(my_list, lo, hi, sort_crit)
+        # Recursión sobre la parte menor, iteración sobre la mayor
+        if lt - lo < hi - gt:
+            quick_sort_recursive(my_list, lo, lt-1, sort_crit, depth_limit)
+            lo = gt + 1
+        else:
+            quick_sort_recursive(my_list, gt+1, hi, sort_crit, depth_limit)
+            hi = lt - 1
+    insertion_sort_range(my_list, lo, hi, sort_crit)
 
 def partition(my_list, lo, hi, sort_crit):
 
-    """ Función que implementa la partición de la lista en **quick sort**, esta es llamada por la función ``quick_sort_recursive()``
+    """ Función que implementa la partición de la lista en **quick sort**
 
         Se selecciona un **pivot** y se ordenan los elementos menores a la izquierda del **pivot**
         y los elementos mayores a la derecha del **pivot**
@@ -475,6 +621,201 @@ def partition(my_list, lo, hi, sort_crit):
     exchange(my_list, follower, hi)
     return follower
 
+def partition_three_way(my_list, lo, hi, sort_crit):
+    """ Función que implementa la partición de Dijkstra en tres partes, esta es llamada por la función ``quick_sort_recursive()``
+
+        Se selecciona el **pivot** con ``select_pivot()`` y se reorganiza el
+        segmento para que queden los elementos que van antes del **pivot** en
+        ``[lo, lt-1]``, los equivalentes al **pivot** en ``[lt, gt]`` y los que
+        van después en ``[gt+1, hi]``.
+
+        Dos elementos son equivalentes si ninguno va antes que el otro, o si
+        ambos pueden ir antes que el otro (criterios con ``<=``).
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param hi: Posición del último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Límites ``(lt, gt)`` de los elementos equivalentes al **pivot**
+        :rtype: tuple
+    """
+    elements = my_list['elements']
+    p = select_pivot(my_list, lo, hi, sort_crit)
+    elements[lo], elements[p] = elements[p], elements[lo]
+    pivot = elements[lo]
+    lt = lo
+    i = lo + 1
+    gt = hi
+    while i <= gt:
+        element = elements[i]
+        before = sort_crit(element, pivot)
+        after = sort_crit(pivot, element)
+        if before and not after:
+            elements[lt], elements[i] = element, elements[lt]
+            lt += 1
+            i += 1
+        elif after and not before:
+            elements[gt], elements[i] = element, elements[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def select_pivot(my_list, lo, hi, sort_crit):
+    """ Selecciona la posición del **pivot** para el segmento ``[lo, hi]``
+
+        Se usa la mediana de tres (primero, centro y último) y, para segmentos
+        de más de ``NINTHER_CUTOFF`` elementos, la mediana de tres medianas
+        (*ninther* de Tukey).
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param hi: Posición del último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Posición del **pivot**
+        :rtype: int
+    """
+    mid = lo + (hi - lo) // 2
+    if hi - lo + 1 > NINTHER_CUTOFF:
+        step = (hi - lo + 1) // 8
+        m1 = median_of_three(my_list, lo, lo + step, lo + 2*step, sort_crit)
+        m2 = median_of_three(my_list, mid - step, mid, mid + step, sort_crit)
+        m3 = median_of_three(my_list, hi - 2*step, hi - step, hi, sort_crit)
+        return median_of_three(my_list, m1, m2, m3, sort_crit)
+    return median_of_three(my_list, lo, mid, hi, sort_crit)
+
+def median_of_three(my_list, i, j, k, sort_crit):
+    """ Retorna la posición del elemento mediano entre las posiciones ``i``, ``j`` y ``k``
+
+        :param my_list: Lista a examinar
+        :type my_list: array_list
+        :param i: Primera posición
+        :type i: int
+        :param j: Segunda posición
+        :type j: int
+        :param k: Tercera posición
+        :type k: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Posición del elemento mediano
+        :rtype: int
+    """
+    elements = my_list['elements']
+    a, b, c = elements[i], elements[j], elements[k]
+    if sort_crit(a, b):
+        if sort_crit(b, c):
+            return j
+        return k if sort_crit(a, c) else i
+    if sort_crit(a, c):
+        return i
+    return k if sort_crit(b, c) else j
+
+def insertion_sort_range(my_list, lo, hi, sort_crit):
+    """ Ordena el segmento ``[lo, hi]`` de la lista con **Insertion Sort**
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param hi: Posición del último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+    """
+    elements = my_list['elements']
+    for i in range(lo + 1, hi + 1):
+        element = elements[i]
+        j = i
+        while j > lo and sort_crit(element, elements[j-1]) and \
+                not sort_crit(elements[j-1], element):
+            elements[j] = elements[j-1]
+            j -= 1
+        elements[j] = element
+
+def heap_sort(my_list, sort_crit):
+    """ Función de ordenamiento que implementa el algoritmo de **Heap Sort**
+
+        Se construye un heap con el elemento que debe ir de último en la raíz,
+        se intercambia la raíz con el último elemento del heap y se repara el
+        heap con el resto de elementos. Garantiza O(n log n) sin memoria adicional.
+
+        Si la lista es vacía o tiene un solo elemento, se retorna la lista original.
+
+        Dependiendo de la función de comparación, se ordena la lista de manera ascendente o descendente.
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Lista ordenada
+        :rtype: array_list
+    """
+    if size(my_list) > 1:
+        heap_sort_range(my_list, 0, size(my_list)-1, sort_crit)
+    return my_list
+
+def heap_sort_range(my_list, lo, hi, sort_crit):
+    """ Ordena el segmento ``[lo, hi]`` de la lista con **Heap Sort**
+
+        :param my_list: Lista a ordenar
+        :type my_list: array_list
+        :param lo: Posición del primer elemento
+        :type lo: int
+        :param hi: Posición del último elemento
+        :type hi: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+    """
+    elements = my_list['elements']
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(elements, lo, start, n, sort_crit)
+    for end in range(n - 1, 0, -1):
+        elements[lo], elements[lo + end] = elements[lo + end], elements[lo]
+        sift_down(elements, lo, 0, end, sort_crit)
+
+def sift_down(elements, offset, pos, n, sort_crit):
+    """ Hunde el elemento en la posición ``pos`` del heap almacenado en
+        ``elements[offset:offset+n]`` hasta restablecer la propiedad de heap.
+
+        La raíz del heap es el elemento que, según ``sort_crit``, debe ir de último.
+
+        :param elements: Arreglo que contiene el heap
+        :type elements: list
+        :param offset: Posición de la raíz del heap en el arreglo
+        :type offset: int
+        :param pos: Posición relativa del elemento a hundir
+        :type pos: int
+        :param n: Número de elementos del heap
+        :type n: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+    """
+    element = elements[offset + pos]
+    child = 2*pos + 1
+    while child < n:
+        if child + 1 < n and sort_crit(elements[offset + child],
+                                       elements[offset + child + 1]):
+            child += 1
+        if not sort_crit(element, elements[offset + child]):
+            break
+        elements[offset + pos] = elements[offset + child]
+        pos = child
+        child = 2*pos + 1
+    elements[offset + pos] = element
+
 def default_sort_criteria(element1, element2):
     """ Función de comparación por defecto para ordenar de manera ascendente.
 
@@ -491,4 +832,86 @@ def default_sort_criteria(element1, element2):
     is_sorted = False
     if element1 < element2:
         is_sorted = True
-    return is_sorted
\ No newline at end of file
+    return is_sorted
+
+def top_k(my_list, k, sort_crit):
+    """ Retorna una lista nueva con los ``k`` primeros elementos de ``my_list``
+        según el criterio de ordenamiento, sin ordenar la lista completa.
+
+        Se mantiene un heap de tamaño ``k`` cuya raíz es el elemento que va de
+        último entre los seleccionados; cada elemento que debe ir antes que la
+        raíz la reemplaza. Al final se ordenan los ``k`` elementos seleccionados.
+        Tiene complejidad O(n log k) y solo copia ``k`` elementos.
+
+        La lista original no se modifica.
+
+        :param my_list: Lista a examinar
+        :type my_list: array_list
+        :param k: Número de elementos a seleccionar
+        :type k: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Lista ordenada con los ``k`` primeros elementos
+        :rtype: array_list
+    """
+    result = new_list()
+    n = size(my_list)
+    k = min(k, n)
+    if k <= 0:
+        return result
+    elements = my_list['elements']
+    heap = elements[:k]
+    for start in range(k // 2 - 1, -1, -1):
+        sift_down(heap, 0, start, k, sort_crit)
+    for i in range(k, n):
+        element = elements[i]
+        root = heap[0]
+        if sort_crit(element, root) and not sort_crit(root, element):
+            heap[0] = element
+            sift_down(heap, 0, 0, k, sort_crit)
+    result['elements'] = heap
+    result['size'] = k
+    heap_sort_range(result, 0, k-1, sort_crit)
+    return result
+
+def nth_element(my_list, pos, sort_crit):
+    """ Retorna el elemento que quedaría en la posición ``pos`` si la lista
+        estuviera ordenada según ``sort_crit`` (**Quickselect**).
+
+        La lista se reorganiza parcialmente: al terminar, el elemento en ``pos``
+        es el retornado, ningún elemento antes de ``pos`` va después de él y
+        ningún elemento después de ``pos`` va antes de él. Se usa la partición
+        en tres partes de ``quick_sort`` y se descarta en cada paso la parte que
+        no contiene ``pos``, con complejidad esperada O(n).
+
+        :param my_list: Lista a examinar
+        :type my_list: array_list
+        :param pos: Posición buscada en la lista ordenada, contando desde cero
+        :type pos: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: El elemento de la posición ``pos`` en el orden dado, o None si ``pos`` no es válida
+        :rtype: any
+    """
+    n = size(my_list)
+    if pos < 0 or pos >= n:
+        return None
+    lo = 0
+    hi = n - 1
+    depth_limit = 2 * (n.bit_length() - 1)
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            heap_sort_range(my_list, lo, hi, sort_crit)
+            return get_element(my_list, pos)
+        depth_limit -= 1
+        lt, gt = partition_three_way(my_list, lo, hi, sort_crit)
+        if pos < lt:
+            hi = lt - 1
+        elif pos > gt:
+            lo = gt + 1
+        else:
+            return get_element(my_list, pos)
+    insertion_sort_range(my_list, lo, hi, sort_crit)
+    return get_element(my_list, pos)
@@ -0,0 +1,285 @@
+"""
+  Vista de solo lectura sobre un segmento de un ``array_list``.
+
+  La vista comparte el arreglo ``elements`` de la lista original (en su llave
+  ``storage``) y guarda solo el desplazamiento (``offset``) y el número de
+  elementos (``length``), por lo que crearla es O(1) sin importar su tamaño.
+  Como no tiene las llaves ``elements`` ni ``size`` de un ``array_list``, pasar
+  una vista a una función de ``array_list`` produce un ``KeyError`` en lugar de
+  operar en silencio sobre los primeros elementos de la lista original. Los cambios hechos a la lista original sobre
+  el segmento se ven a través de la vista. La primera operación de escritura
+  sobre la vista copia el segmento a un arreglo propio (materialización), de
+  modo que la lista original nunca se modifica a través de la vista.
+
+  ``page()`` retorna la página ``n`` de una lista como una vista, para
+  recorrer resultados grandes por partes sin copiarlos.
+"""
+
+from DataStructures.Lists import array_list as al
+
+def new_view(my_list, pos, numelem):
+    """Crea una vista de ``numelem`` elementos de ``my_list`` a partir de ``pos``.
+
+    ``my_list`` puede ser un ``array_list`` o a su vez una vista.
+
+    Args:
+        my_list (array_list): La lista sobre la cual crear la vista.
+        pos (int): La posición inicial de la vista, contando desde cero.
+        numelem (int): El número de elementos de la vista.
+
+    Returns:
+        array_list_view: La vista creada, o None si ``pos`` o ``numelem`` no son válidos.
+    """
+    if my_list.get('type') == 'ARRAY_LIST_VIEW':
+        storage, offset, list_size = my_list['storage'], my_list['offset'], my_list['length']
+    else:
+        storage, offset, list_size = my_list['elements'], 0, my_list['size']
+    if pos < 0 or pos >= list_size or numelem < 0:
+        return None
+    end_pos = min(pos + numelem, list_size)
+    return {'storage': storage,
+            'offset': offset + pos,
+            'length': end_pos - pos,
+            'owned': False,
+            'type': 'ARRAY_LIST_VIEW',
+            }
+
+def page(my_list, page_number, page_size):
+    """Retorna la página ``page_number`` de ``my_list`` como una vista, sin copiar elementos.
+
+    Args:
+        my_list (array_list): La lista a paginar, o una vista.
+        page_number (int): El número de la página, contando desde cero.
+        page_size (int): El número de elementos por página.
+
+    Returns:
+        array_list_view: La vista con los elementos de la página (la última
+        puede tener menos), o None si la página no existe.
+    """
+    if page_number < 0 or page_size <= 0:
+        return None
+    return new_view(my_list, page_number * page_size, page_size)
+
+def num_pages(my_list, page_size):
+    """Retorna el número de páginas de ``page_size`` elementos de ``my_list``.
+
+    Args:
+        my_list (array_list): La lista a paginar, o una vista.
+        page_size (int): El número de elementos por página.
+
+    Returns:
+        int: El número de páginas.
+    """
+    list_size = my_list['length'] if my_list.get('type') == 'ARRAY_LIST_VIEW' else my_list['size']
+    return -(-list_size // page_size)
+
+def size(my_view):
+    """Obtiene el número de elementos de la vista.
+
+    Args:
+        my_view (array_list_view): La vista a examinar.
+
+    Returns:
+        int: El tamaño de la vista.
+    """
+    return my_view['length']
+
+def is_empty(my_view):
+    """Indica si la vista está vacía.
+
+    Args:
+        my_view (array_list_view): La vista a examinar.
+
+    Returns:
+        bool: True si la vista no tiene elementos.
+    """
+    return my_view['length'] == 0
+
+def get_element(my_view, pos):
+    """Obtiene el elemento en la posición ``pos`` de la vista.
+
+    Args:
+        my_view (array_list_view): La vista de la cual obtener el elemento.
+        pos (int): La posición del elemento contando desde cero.
+
+    Returns:
+        Any: El elemento en la posición especificada.
+    """
+    return my_view['storage'][my_view['offset'] + pos]
+
+def first_element(my_view):
+    """Obtiene el primer elemento de la vista.
+
+    Args:
+        my_view (array_list_view): La vista a examinar.
+
+    Returns:
+        Any: El primer elemento de la vista.
+    """
+    return get_element(my_view, 0)
+
+def last_element(my_view):
+    """Obtiene el último elemento de la vista.
+
+    Args:
+        my_view (array_list_view): La vista a examinar.
+
+    Returns:
+        Any: El último elemento de la vista.
+    """
+    return get_element(my_view, my_view['length'] - 1)
+
+def iterator(my_view):
+    """Recorre los elementos de la vista en orden sin copiarlos.
+
+    Args:
+        my_view (array_list_view): La vista a recorrer.
+
+    Returns:
+        generator: Generador con los elementos de la vista.
+    """
+    elements = my_view['storage']
+    offset = my_view['offset']
+    for i in range(offset, offset + my_view['length']):
+        yield elements[i]
+
+def is_present(my_view, element, cmp_function):
+    """Verifica si un elemento está presente en la vista usando una función de comparación.
+
+    Args:
+        my_view (array_list_view): La vista en la cual buscar.
+        element (Any): El elemento a buscar.
+        cmp_function (function): La función de comparación a usar.
+
+    Returns:
+        int: La posición del elemento si se encuentra, de lo contrario -1.
+    """
+    pos = 0
+    for info in iterator(my_view):
+        if cmp_function(element, info) == 0:
+            return pos
+        pos += 1
+    return -1
+
+def sub_list(my_view, pos, numelem):
+    """Retorna una vista sobre un segmento de la vista, sin copiar elementos.
+
+    Args:
+        my_view (array_list_view): La vista original.
+        pos (int): La posición inicial del segmento, contando desde cero.
+        numelem (int): El número de elementos del segmento.
+
+    Returns:
+        array_list_view: La nueva vista.
+    """
+    return new_view(my_view, pos, numelem)
+
+def to_list(my_view):
+    """Copia los elementos de la vista a un ``array_list`` nuevo.
+
+    Args:
+        my_view (array_list_view): La vista a copiar.
+
+    Returns:
+        array_list: Lista con los elementos de la vista.
+    """
+    new_list = al.new_list()
+    offset = my_view['offset']
+    new_list['elements'] = my_view['storage'][offset:offset + my_view['length']]
+    new_list['size'] = my_view['length']
+    return new_list
+
+def materialize(my_view):
+    """Copia el segmento de la vista a un arreglo propio, si aún no lo tiene.
+
+    A partir de este momento la vista deja de compartir memoria con la lista original.
+
+    Args:
+        my_view (array_list_view): La vista a materializar.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    if not my_view['owned']:
+        offset = my_view['offset']
+        my_view['storage'] = my_view['storage'][offset:offset + my_view['length']]
+        my_view['offset'] = 0
+        my_view['owned'] = True
+    return my_view
+
+def change_info(my_view, pos, new_info):
+    """Cambia el elemento en la posición ``pos`` de la vista, materializándola primero.
+
+    Args:
+        my_view (array_list_view): La vista a modificar.
+        pos (int): La posición del elemento a cambiar, contando desde cero.
+        new_info (Any): La nueva información.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    if pos < 0 or pos >= my_view['length']:
+        return my_view
+    materialize(my_view)
+    my_view['storage'][pos] = new_info
+    return my_view
+
+def exchange(my_view, pos1, pos2):
+    """Intercambia dos elementos de la vista, materializándola primero.
+
+    Args:
+        my_view (array_list_view): La vista a modificar.
+        pos1 (int): La posición del primer elemento, contando desde cero.
+        pos2 (int): La posición del segundo elemento, contando desde cero.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    if pos1 < 0 or pos1 >= my_view['length'] or pos2 < 0 or pos2 >= my_view['length']:
+        return my_view
+    materialize(my_view)
+    elements = my_view['storage']
+    elements[pos1], elements[pos2] = elements[pos2], elements[pos1]
+    return my_view
+
+def insert_element(my_view, element, pos):
+    """Inserta un elemento en la posición ``pos`` de la vista, materializándola primero.
+
+    Args:
+        my_view (array_list_view): La vista a modificar.
+        element (Any): El elemento a insertar.
+        pos (int): La posición en la cual insertar el elemento contando desde cero.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    if pos < 0 or pos > my_view['length']:
+        return my_view
+    materialize(my_view)
+    my_view['storage'].insert(pos, element)
+    my_view['length'] += 1
+    return my_view
+
+def add_first(my_view, element):
+    """Añade un elemento al principio de la vista, materializándola primero.
+
+    Args:
+        my_view (array_list_view): La vista a modificar.
+        element (Any): El elemento a añadir.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    return insert_element(my_view, element, 0)
+
+def add_last(my_view, element):
+    """Añade un elemento al final de la vista, materializándola primero.
+
+    Args:
+        my_view (array_list_view): La vista a modificar.
+        element (Any): El elemento a añadir.
+
+    Returns:
+        array_list_view: La vista actualizada.
+    """
+    return insert_element(my_view, element, my_view['length'])
@@ -3,6 +3,51 @@
 """
 
 
+class SingleNode:
+    """ Nodo compacto de una lista sencillamente encadenada.
+
+        Usa ``__slots__`` para no crear un diccionario por cada nodo; se sigue
+        pudiendo acceder a los campos con ``node['info']`` por compatibilidad.
+    """
+    __slots__ = ('info', 'next')
+
+    def __init__(self, element):
+        self.info = element
+        self.next = None
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        setattr(self, field, value)
+
+    def __repr__(self):
+        return 'SingleNode({!r})'.format(self.info)
+
+
+class DoubleNode:
+    """ Nodo compacto de una lista doblemente encadenada.
+
+        Usa ``__slots__`` para no crear un diccionario por cada nodo; se sigue
+        pudiendo acceder a los campos con ``node['info']`` por compatibilidad.
+    """
+    __slots__ = ('info', 'next', 'prev')
+
+    def __init__(self, element):
+        self.info = element
+        self.next = None
+        self.prev = None
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        setattr(self, field, value)
+
+    def __repr__(self):
+        return 'DoubleNode({!r})'.format(self.info)
+
+
 def new_single_node(element):
     """ Estructura que contiene la información a guardar en una lista encadenada
 
@@ -10,10 +55,9 @@ def new_single_node(element):
         :type element: any
 
         :returns: Nodo creado
-        :rtype: dict
+        :rtype: list_node
     """
-    node = {'info': element, 'next': None}
-    return (node)
+    return SingleNode(element)
 
 
 def get_element(node):
@@ -25,14 +69,10 @@ def get_element(node):
         :returns: La información almacenada en el nodo
         :rtype: any
     """
-    return node['info']
+    return node.info
 
 
 def new_double_node(element):
     """ Estructura que contiene la información a guardar en un nodo de una lista doblemente encadenada
     """
-    node = {'info': element,
-            'next': None,
-            'prev': None
-            }
-    return node
\ No newline at end of file
+    return DoubleNode(element)
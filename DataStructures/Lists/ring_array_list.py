@@ -0,0 +1,360 @@
+"""
+  Lista implementada sobre un arreglo circular (ring buffer) de capacidad explícita.
+
+  Ofrece la misma interfaz funcional de ``array_list`` pero ``add_first``,
+  ``add_last``, ``remove_first`` y ``remove_last`` son O(1) amortizado, por lo
+  que sirve como cola doble (deque), por ejemplo para las colas de un BFS.
+"""
+
+DEFAULT_CAPACITY = 16
+
+def new_list(capacity=DEFAULT_CAPACITY):
+    """Inicializa una nueva lista circular vacía.
+
+    La lista tiene los siguientes atributos:
+    - elements: Arreglo de tamaño ``capacity`` con los elementos
+    - first: Posición en ``elements`` del primer elemento de la lista
+    - size: Número de elementos de la lista
+    - capacity: Tamaño del arreglo ``elements``
+
+    Args:
+        capacity (int): Capacidad inicial del arreglo (por defecto=16)
+
+    Returns:
+        ring_array_list: La lista vacía.
+    """
+    capacity = max(capacity, 1)
+    return {'elements': [None] * capacity,
+            'first': 0,
+            'size': 0,
+            'capacity': capacity,
+            'type': 'RING_ARRAY_LIST',
+            }
+
+def size(my_list):
+    """Obtiene el tamaño de la lista.
+
+    Args:
+        my_list (ring_array_list): La lista de la cual obtener el tamaño.
+
+    Returns:
+        int: El tamaño de la lista.
+    """
+    return my_list['size']
+
+def is_empty(my_list):
+    """Indica si la lista está vacía.
+
+    Args:
+        my_list (ring_array_list): La lista a examinar.
+
+    Returns:
+        bool: True si la lista está vacía.
+    """
+    return my_list['size'] == 0
+
+def capacity(my_list):
+    """Obtiene el número de elementos que la lista puede guardar sin crecer.
+
+    Args:
+        my_list (ring_array_list): La lista a examinar.
+
+    Returns:
+        int: La capacidad del arreglo de la lista.
+    """
+    return my_list['capacity']
+
+def resize(my_list, new_capacity):
+    """Cambia la capacidad del arreglo de la lista a ``new_capacity``.
+
+    Los elementos se copian en orden al nuevo arreglo, empezando en la posición cero.
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+        new_capacity (int): La nueva capacidad, mayor o igual al tamaño de la lista.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    new_capacity = max(new_capacity, my_list['size'], 1)
+    elements = my_list['elements']
+    first = my_list['first']
+    old_capacity = my_list['capacity']
+    end = first + my_list['size']
+    if end <= old_capacity:
+        new_elements = elements[first:end]
+    else:
+        new_elements = elements[first:] + elements[:end - old_capacity]
+    new_elements.extend([None] * (new_capacity - my_list['size']))
+    my_list['elements'] = new_elements
+    my_list['first'] = 0
+    my_list['capacity'] = new_capacity
+    return my_list
+
+def reserve(my_list, new_capacity):
+    """Garantiza que la lista pueda guardar ``new_capacity`` elementos sin crecer.
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+        new_capacity (int): La capacidad mínima deseada.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if new_capacity > my_list['capacity']:
+        resize(my_list, new_capacity)
+    return my_list
+
+def shrink_to_fit(my_list):
+    """Reduce la capacidad de la lista a su tamaño actual.
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if my_list['capacity'] > max(my_list['size'], 1):
+        resize(my_list, my_list['size'])
+    return my_list
+
+def get_element(my_list, pos):
+    """Obtiene un elemento de la lista en una posición específica.
+
+    Args:
+        my_list (ring_array_list): La lista de la cual obtener el elemento.
+        pos (int): La posición del elemento a recuperar contando desde cero.
+
+    Returns:
+        Any: El elemento en la posición especificada.
+    """
+    index = my_list['first'] + pos
+    if index >= my_list['capacity']:
+        index -= my_list['capacity']
+    return my_list['elements'][index]
+
+def first_element(my_list):
+    """Obtiene el primer elemento de la lista.
+
+    Args:
+        my_list (ring_array_list): La lista de la cual obtener el primer elemento.
+
+    Returns:
+        Any: El primer elemento de la lista.
+    """
+    return my_list['elements'][my_list['first']]
+
+def last_element(my_list):
+    """Retorna el último elemento de una lista no vacía. Esta función NO elimina el elemento de la lista.
+
+    Args:
+        my_list (ring_array_list): La lista a examinar.
+
+    Returns:
+        any: Último elemento de la lista.
+    """
+    return get_element(my_list, my_list['size'] - 1)
+
+def add_first(my_list, element):
+    """Añade un elemento al principio de la lista en O(1) amortizado.
+
+    Args:
+        my_list (ring_array_list): La lista a la cual añadir el elemento.
+        element (Any): El elemento a añadir.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if my_list['size'] == my_list['capacity']:
+        resize(my_list, 2 * my_list['capacity'])
+    first = my_list['first'] - 1
+    if first < 0:
+        first += my_list['capacity']
+    my_list['elements'][first] = element
+    my_list['first'] = first
+    my_list['size'] += 1
+    return my_list
+
+def add_last(my_list, element):
+    """Añade un elemento al final de la lista en O(1) amortizado.
+
+    Args:
+        my_list (ring_array_list): La lista a la cual añadir el elemento.
+        element (Any): El elemento a añadir.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if my_list['size'] == my_list['capacity']:
+        resize(my_list, 2 * my_list['capacity'])
+    index = my_list['first'] + my_list['size']
+    if index >= my_list['capacity']:
+        index -= my_list['capacity']
+    my_list['elements'][index] = element
+    my_list['size'] += 1
+    return my_list
+
+def remove_first(my_list):
+    """Elimina y retorna el primer elemento de la lista en O(1).
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+
+    Returns:
+        Any: El elemento eliminado, o None si la lista está vacía.
+    """
+    if my_list['size'] == 0:
+        return None
+    first = my_list['first']
+    element = my_list['elements'][first]
+    my_list['elements'][first] = None
+    first += 1
+    if first == my_list['capacity']:
+        first = 0
+    my_list['first'] = first
+    my_list['size'] -= 1
+    return element
+
+def remove_last(my_list):
+    """Elimina y retorna el último elemento de la lista en O(1).
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+
+    Returns:
+        Any: El elemento eliminado, o None si la lista está vacía.
+    """
+    if my_list['size'] == 0:
+        return None
+    index = my_list['first'] + my_list['size'] - 1
+    if index >= my_list['capacity']:
+        index -= my_list['capacity']
+    element = my_list['elements'][index]
+    my_list['elements'][index] = None
+    my_list['size'] -= 1
+    return element
+
+def insert_element(my_list, element, pos):
+    """Inserta un elemento en una posición específica en la lista.
+
+    Se desplazan los elementos del lado más corto, por lo que insertar cerca
+    de cualquiera de los extremos es económico.
+
+    Args:
+        my_list (ring_array_list): La lista en la cual insertar el elemento.
+        element (Any): El elemento a insertar.
+        pos (int): La posición en la cual insertar el elemento contando desde cero.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    n = my_list['size']
+    if pos < 0 or pos > n:
+        return my_list
+    if pos < n - pos:
+        add_first(my_list, element)
+        for i in range(pos):
+            change_info(my_list, i, get_element(my_list, i + 1))
+    else:
+        add_last(my_list, element)
+        for i in range(n, pos, -1):
+            change_info(my_list, i, get_element(my_list, i - 1))
+    change_info(my_list, pos, element)
+    return my_list
+
+def delete_element(my_list, pos):
+    """Elimina el elemento en la posición ``pos`` de la lista.
+
+    Args:
+        my_list (ring_array_list): La lista a modificar.
+        pos (int): La posición del elemento a eliminar contando desde cero.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    n = my_list['size']
+    if pos < 0 or pos >= n:
+        return my_list
+    if pos < n - pos - 1:
+        for i in range(pos, 0, -1):
+            change_info(my_list, i, get_element(my_list, i - 1))
+        remove_first(my_list)
+    else:
+        for i in range(pos, n - 1):
+            change_info(my_list, i, get_element(my_list, i + 1))
+        remove_last(my_list)
+    return my_list
+
+def change_info(my_list, pos, new_info):
+    """
+    Cambia la información de un elemento en una posición específica.
+
+    Args:
+        my_list (ring_array_list): La lista que contiene el elemento.
+        pos (int): La posición del elemento a cambiar, contando desde cero.
+        new_info (Any): La nueva información a establecer.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if pos < 0 or pos >= my_list['size']:
+        return my_list
+    index = my_list['first'] + pos
+    if index >= my_list['capacity']:
+        index -= my_list['capacity']
+    my_list['elements'][index] = new_info
+    return my_list
+
+def exchange(my_list, pos1, pos2):
+    """
+    Intercambia los elementos en dos posiciones en la lista.
+
+    Args:
+        my_list (ring_array_list): La lista que contiene los elementos.
+        pos1 (int): La posición del primer elemento, contando desde cero.
+        pos2 (int): La posición del segundo elemento, contando desde cero.
+
+    Returns:
+        ring_array_list: La lista actualizada.
+    """
+    if pos1 < 0 or pos1 >= my_list['size'] or pos2 < 0 or pos2 >= my_list['size']:
+        return my_list
+    temp = get_element(my_list, pos1)
+    change_info(my_list, pos1, get_element(my_list, pos2))
+    change_info(my_list, pos2, temp)
+    return my_list
+
+def is_present(my_list, element, cmp_function):
+    """Verifica si un elemento está presente en la lista usando una función de comparación.
+
+    Args:
+        my_list (ring_array_list): La lista en la cual buscar.
+        element (Any): El elemento a buscar.
+        cmp_function (function): La función de comparación a usar.
+
+    Returns:
+        int: La posición del elemento si se encuentra, de lo contrario -1.
+    """
+    for pos in range(my_list['size']):
+        if cmp_function(element, get_element(my_list, pos)) == 0:
+            return pos
+    return -1
+
+def sub_list(my_list, pos, numelem):
+    """Devuelve una sublista comenzando desde una posición con un número específico de elementos.
+
+    Args:
+        my_list (ring_array_list): La lista de la cual obtener la sublista.
+        pos (int): La posición inicial de la sublista, contando desde cero.
+        numelem (int): El número de elementos en la sublista.
+
+    Returns:
+        ring_array_list: La sublista creada.
+    """
+    if pos < 0 or pos >= my_list['size'] or numelem < 0:
+        return None
+    end_pos = min(pos + numelem, my_list['size'])
+    sub = new_list(end_pos - pos)
+    for i in range(pos, end_pos):
+        add_last(sub, get_element(my_list, i))
+    return sub
@@ -1,4 +1,5 @@
 from DataStructures.Lists import list_node as node
+from DataStructures.Lists import array_list as al
 
 def new_list():
     
@@ -33,7 +34,7 @@ def add_first(my_list, element):
     :rtype: single_linked_list
     """
     new_node = node.new_single_node(element)
-    new_node['next'] = my_list['first']
+    new_node.next = my_list['first']
     my_list['first'] = new_node
     if (my_list['size'] == 0):
         my_list['last'] = my_list['first']
@@ -61,7 +62,7 @@ def add_last(my_list, element):
     if my_list['size'] == 0:
         my_list['first'] = new_node
     else:
-        my_list['last']['next'] = new_node
+        my_list['last'].next = new_node
     my_list['last'] = new_node
     my_list['size'] += 1
     return my_list
@@ -104,7 +105,7 @@ def first_element(my_list):
         :rtype: any
     """
     if my_list['first'] is not None:
-        return my_list['first']['info']
+        return my_list['first'].info
     return None
 
 
@@ -122,7 +123,7 @@ def last_element(my_list):
     """
     
     if my_list['last'] is not None:
-        return my_list['last']['info']
+        return my_list['last'].info
     return None
 
 
@@ -145,9 +146,9 @@ def get_element(my_list, pos):
     searchpos = 0
     node = my_list['first']
     while searchpos < pos:
-        node = node['next']
+        node = node.next
         searchpos += 1
-    return node['info']  
+    return node.info  
 
 
 def delete_element(my_list, pos):
@@ -168,15 +169,15 @@ def delete_element(my_list, pos):
     """
     if (my_list['size'] > 0):
         if (pos == 0):
-            my_list['first'] = my_list['first']['next']
+            my_list['first'] = my_list['first'].next
             my_list['size'] -= 1
         elif (pos > 1):
             temp = my_list['first']
             searchpos = 1
             while searchpos < pos:
-                temp = temp['next']
+                temp = temp.next
                 searchpos += 1
-            temp['next'] = temp['next']['next']
+            temp.next = temp.next.next
             if (pos == my_list['size']-1):
                 my_list['last'] = temp
             my_list['size'] -= 1
@@ -197,13 +198,13 @@ def remove_first(my_list):
         :rtype: any
     """
     if my_list['first'] is not None:
-        temp = my_list['first']['next']
+        temp = my_list['first'].next
         node = my_list['first']
         my_list['first'] = temp
         my_list['size'] -= 1
         if (my_list['size'] == 0):
             my_list['last'] = my_list['first']
-        return node['info']
+        return node.info
     else:
         return None
 
@@ -228,13 +229,13 @@ def remove_last(my_list):
             my_list['first'] = None
         else:
             temp = my_list['first']
-            while temp['next'] != my_list['last']:
-                temp = temp['next']
+            while temp.next != my_list['last']:
+                temp = temp.next
             node = my_list['last']
             my_list['last'] = temp
-            my_list['last']['next'] = None
+            my_list['last'].next = None
         my_list['size'] -= 1
-        return node['info']
+        return node.info
     else:
         return None
 
@@ -262,17 +263,17 @@ def insert_element(my_list, element, pos):
         my_list['last'] = new_node
 
     elif ((my_list['size'] > 0) and (pos == 0)):
-        new_node['next'] = my_list['first']
+        new_node.next = my_list['first']
         my_list['first'] = new_node
 
     else:
         cont = 1
         temp = my_list['first']
         while cont < pos:
-            temp = temp['next']
+            temp = temp.next
             cont += 1
-        new_node['next'] = temp['next']
-        temp['next'] = new_node
+        new_node.next = temp.next
+        temp.next = new_node
 
         if (pos == my_list['size']):
             my_list['last'] = new_node
@@ -304,10 +305,10 @@ def is_present(my_list, element, cmp_function):
     temp = my_list['first']
     count = 0
     while not is_in_array and temp is not None:
-        if cmp_function(element, temp['info']) == 0:
+        if cmp_function(element, temp.info) == 0:
             is_in_array = True
         else:
-            temp = temp['next']
+            temp = temp.next
             count += 1
 
     if not is_in_array:
@@ -331,9 +332,9 @@ def change_info(my_list, pos, new_info):
     current = my_list['first']
     cont = 0
     while cont < pos:
-        current = current['next']
+        current = current.next
         cont += 1
-    current['info'] = new_info
+    current.info = new_info
     return my_list
 
 
@@ -614,12 +615,13 @@ def quick_sort(my_list, sort_crit):
     return my_list
 
 def quick_sort_recursive(my_list, lo, hi, sort_crit):
-    """ Función recursiva que implementa el algoritmo de **quick sort**, esta es llamada por la función ``quick_sort()``
+    """ Función que implementa el ciclo principal de **quick sort**, esta es llamada por la función ``quick_sort()``
 
         Se localiza el **pivot**, utilizando la funcion de particion.
 
-        Luego se hace la recursión con los elementos a la izquierda del **pivot**
-        y los elementos a la derecha del **pivot**
+        Luego se hace la recursión sobre la parte más pequeña a cada lado del
+        **pivot** y se itera sobre la más grande, de modo que la profundidad de
+        la pila es O(log n) aun si la lista ya está ordenada.
 
         :param my_list: Lista a ordenar
         :type my_list: single_linked_list
@@ -630,11 +632,14 @@ def quick_sort_recursive(my_list, lo, hi, sort_crit):
         :param sort_crit: Función de comparación de elementos para ordenar
         :type sort_crit: function
     """
-    if (lo >= hi):
-        return
-    pivot = partition(my_list, lo, hi, sort_crit)
-    quick_sort_recursive(my_list, lo, pivot-1, sort_crit)
-    quick_sort_recursive(my_list, pivot+1, hi, sort_crit)
+    while lo < hi:
+        pivot = partition(my_list, lo, hi, sort_crit)
+        if pivot - lo < hi - pivot:
+            quick_sort_recursive(my_list, lo, pivot-1, sort_crit)
+            lo = pivot + 1
+        else:
+            quick_sort_recursive(my_list, pivot+1, hi, sort_crit)
+            hi = pivot - 1
 
 def partition(my_list, lo, hi, sort_crit):
 
@@ -655,14 +660,23 @@ def partition(my_list, lo, hi, sort_crit):
         :returns: Posición del **pivot**
         :rtype: int
     """
-    follower = leader = lo
-    while leader < hi:
-        if sort_crit(
-           get_element(my_list, leader), get_element(my_list, hi)):
-            exchange(my_list, follower, leader)
+    # Se recorren los nodos una sola vez en lugar de buscar cada posición
+    start = my_list['first']
+    for i in range(lo):
+        start = start.next
+    pivot_node = start
+    for i in range(lo, hi):
+        pivot_node = pivot_node.next
+    pivot = pivot_node.info
+    follower = lo
+    follower_node = leader_node = start
+    while leader_node is not pivot_node:
+        if sort_crit(leader_node.info, pivot):
+            follower_node.info, leader_node.info = leader_node.info, follower_node.info
+            follower_node = follower_node.next
             follower += 1
-        leader += 1
-    exchange(my_list, follower, hi)
+        leader_node = leader_node.next
+    follower_node.info, pivot_node.info = pivot_node.info, follower_node.info
     return follower
 
 def default_sort_criteria(element1, element2):
@@ -681,4 +695,79 @@ def default_sort_criteria(element1, element2):
     is_sorted = False
     if element1 < element2:
         is_sorted = True
-    return is_sorted
\ No newline at end of file
+    return is_sorted
+
+
+def top_k(my_list, k, sort_crit):
+    """ Retorna una lista nueva con los ``k`` primeros elementos de ``my_list``
+        según el criterio de ordenamiento, sin ordenar la lista completa.
+
+        Se recorre la lista una sola vez manteniendo un heap de tamaño ``k``
+        cuya raíz es el elemento que va de último entre los seleccionados.
+        Tiene complejidad O(n log k) y solo guarda ``k`` elementos.
+
+        La lista original no se modifica.
+
+        :param my_list: Lista a examinar
+        :type my_list: single_linked_list
+        :param k: Número de elementos a seleccionar
+        :type k: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: Lista ordenada con los ``k`` primeros elementos
+        :rtype: single_linked_list
+    """
+    result = new_list()
+    k = min(k, size(my_list))
+    if k <= 0:
+        return result
+    heap = []
+    current = my_list['first']
+    while current is not None and len(heap) < k:
+        heap.append(current.info)
+        current = current.next
+    for start in range(k // 2 - 1, -1, -1):
+        al.sift_down(heap, 0, start, k, sort_crit)
+    while current is not None:
+        element = current.info
+        root = heap[0]
+        if sort_crit(element, root) and not sort_crit(root, element):
+            heap[0] = element
+            al.sift_down(heap, 0, 0, k, sort_crit)
+        current = current.next
+    selected = al.new_list()
+    selected['elements'] = heap
+    selected['size'] = k
+    al.heap_sort_range(selected, 0, k-1, sort_crit)
+    for element in heap:
+        add_last(result, element)
+    return result
+
+def nth_element(my_list, pos, sort_crit):
+    """ Retorna el elemento que quedaría en la posición ``pos`` si la lista
+        estuviera ordenada según ``sort_crit`` (**Quickselect**).
+
+        Como la lista encadenada no tiene acceso aleatorio, los elementos se
+        pasan a un arreglo auxiliar sobre el que se ejecuta el quickselect de
+        ``array_list``, con complejidad esperada O(n). La lista original no se modifica.
+
+        :param my_list: Lista a examinar
+        :type my_list: single_linked_list
+        :param pos: Posición buscada en la lista ordenada, contando desde cero
+        :type pos: int
+        :param sort_crit: Función de comparación de elementos para ordenar
+        :type sort_crit: function
+
+        :returns: El elemento de la posición ``pos`` en el orden dado, o None si ``pos`` no es válida
+        :rtype: any
+    """
+    if pos < 0 or pos >= size(my_list):
+        return None
+    elements = al.new_list()
+    current = my_list['first']
+    while current is not None:
+        elements['elements'].append(current.info)
+        current = current.next
+    elements['size'] = len(elements['elements'])
+    return al.nth_element(elements, pos, sort_crit)
@@ -0,0 +1,292 @@
+"""
+  Lista de valores numéricos guardados en un ``array.array``.
+
+  Tiene la misma interfaz funcional de ``array_list``, pero los elementos se
+  guardan sin empaquetar (por ejemplo como ``double`` de 8 bytes) en lugar de
+  objetos de Python, lo que reduce el uso de memoria de columnas numéricas como
+  distancias, pesos o identificadores enteros. Los códigos de tipo usuales son:
+
+  - ``'d'``: números reales de doble precisión (distancias, pesos)
+  - ``'q'``: enteros con signo de 64 bits
+  - ``'i'``: enteros con signo de 32 bits (identificadores de vértices)
+
+  El arreglo soporta el protocolo de buffer, por lo que ``as_memoryview()``
+  permite pasar los datos sin copiarlos a ``memoryview``, ``struct`` o
+  ``numpy.frombuffer``.
+"""
+
+from array import array
+
+def new_list(typecode='d', elements=None):
+    """Inicializa una nueva lista tipada.
+
+    Args:
+        typecode (str): Código de tipo de ``array.array`` de los elementos (por defecto='d')
+        elements (iterable, optional): Valores iniciales de la lista
+
+    Returns:
+        typed_array_list: La lista creada.
+    """
+    values = array(typecode) if elements is None else array(typecode, elements)
+    return {'elements': values,
+            'size': len(values),
+            'typecode': typecode,
+            'type': 'TYPED_ARRAY_LIST',
+            }
+
+def size(my_list):
+    """Obtiene el tamaño de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista de la cual obtener el tamaño.
+
+    Returns:
+        int: El tamaño de la lista.
+    """
+    return my_list['size']
+
+def is_empty(my_list):
+    """Indica si la lista está vacía.
+
+    Args:
+        my_list (typed_array_list): La lista a examinar.
+
+    Returns:
+        bool: True si la lista está vacía.
+    """
+    return my_list['size'] == 0
+
+def is_present(my_list, element, cmp_function):
+    """Verifica si un elemento está presente en la lista usando una función de comparación.
+
+    Args:
+        my_list (typed_array_list): La lista en la cual buscar.
+        element (int | float): El elemento a buscar.
+        cmp_function (function): La función de comparación a usar.
+
+    Returns:
+        int: La posición del elemento si se encuentra, de lo contrario -1.
+    """
+    elements = my_list['elements']
+    for pos in range(my_list['size']):
+        if cmp_function(element, elements[pos]) == 0:
+            return pos
+    return -1
+
+def get_element(my_list, pos):
+    """Obtiene un elemento de la lista en una posición específica.
+
+    Args:
+        my_list (typed_array_list): La lista de la cual obtener el elemento.
+        pos (int): La posición del elemento a recuperar contando desde cero.
+
+    Returns:
+        int | float: El elemento en la posición especificada.
+    """
+    return my_list['elements'][pos]
+
+def first_element(my_list):
+    """Obtiene el primer elemento de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista de la cual obtener el primer elemento.
+
+    Returns:
+        int | float: El primer elemento de la lista.
+    """
+    return my_list['elements'][0]
+
+def last_element(my_list):
+    """Retorna el último elemento de una lista no vacía. Esta función NO elimina el elemento de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a examinar.
+
+    Returns:
+        int | float: Último elemento de la lista.
+    """
+    return my_list['elements'][my_list['size'] - 1]
+
+def insert_element(my_list, element, pos):
+    """Inserta un elemento en una posición específica en la lista.
+
+    Args:
+        my_list (typed_array_list): La lista en la cual insertar el elemento.
+        element (int | float): El elemento a insertar.
+        pos (int): La posición en la cual insertar el elemento contando desde cero.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    if pos < 0 or pos > my_list['size']:
+        return my_list
+    my_list['elements'].insert(pos, element)
+    my_list['size'] += 1
+    return my_list
+
+def add_first(my_list, element):
+    """Añade un elemento al principio de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a la cual añadir el elemento.
+        element (int | float): El elemento a añadir.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    return insert_element(my_list, element, 0)
+
+def add_last(my_list, element):
+    """Añade un elemento al final de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a la cual añadir el elemento.
+        element (int | float): El elemento a añadir.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    my_list['elements'].append(element)
+    my_list['size'] += 1
+    return my_list
+
+def add_all(my_list, elements):
+    """Añade todos los valores de ``elements`` al final de la lista en bloque.
+
+    Args:
+        my_list (typed_array_list): La lista a la cual añadir los elementos.
+        elements (iterable): Los valores a añadir.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    my_list['elements'].extend(elements)
+    my_list['size'] = len(my_list['elements'])
+    return my_list
+
+def remove_first(my_list):
+    """Elimina y retorna el primer elemento de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a modificar.
+
+    Returns:
+        int | float: El elemento eliminado, o None si la lista está vacía.
+    """
+    if my_list['size'] == 0:
+        return None
+    element = my_list['elements'].pop(0)
+    my_list['size'] -= 1
+    return element
+
+def remove_last(my_list):
+    """Elimina y retorna el último elemento de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a modificar.
+
+    Returns:
+        int | float: El elemento eliminado, o None si la lista está vacía.
+    """
+    if my_list['size'] == 0:
+        return None
+    element = my_list['elements'].pop()
+    my_list['size'] -= 1
+    return element
+
+def delete_element(my_list, pos):
+    """Elimina el elemento en la posición ``pos`` de la lista.
+
+    Args:
+        my_list (typed_array_list): La lista a modificar.
+        pos (int): La posición del elemento a eliminar contando desde cero.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    if pos < 0 or pos >= my_list['size']:
+        return my_list
+    del my_list['elements'][pos]
+    my_list['size'] -= 1
+    return my_list
+
+def change_info(my_list, pos, new_info):
+    """
+    Cambia la información de un elemento en una posición específica.
+
+    Args:
+        my_list (typed_array_list): La lista que contiene el elemento.
+        pos (int): La posición del elemento a cambiar, contando desde cero.
+        new_info (int | float): La nueva información a establecer.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    if pos < 0 or pos >= my_list['size']:
+        return my_list
+    my_list['elements'][pos] = new_info
+    return my_list
+
+def exchange(my_list, pos1, pos2):
+    """
+    Intercambia los elementos en dos posiciones en la lista.
+
+    Args:
+        my_list (typed_array_list): La lista que contiene los elementos.
+        pos1 (int): La posición del primer elemento, contando desde cero.
+        pos2 (int): La posición del segundo elemento, contando desde cero.
+
+    Returns:
+        typed_array_list: La lista actualizada.
+    """
+    if pos1 < 0 or pos1 >= my_list['size'] or pos2 < 0 or pos2 >= my_list['size']:
+        return my_list
+    elements = my_list['elements']
+    elements[pos1], elements[pos2] = elements[pos2], elements[pos1]
+    return my_list
+
+def sub_list(my_list, pos, numelem):
+    """Devuelve una sublista comenzando desde una posición con un número específico de elementos.
+
+    Args:
+        my_list (typed_array_list): La lista de la cual obtener la sublista.
+        pos (int): La posición inicial de la sublista, contando desde cero.
+        numelem (int): El número de elementos en la sublista.
+
+    Returns:
+        typed_array_list: La sublista creada, del mismo tipo de la lista original.
+    """
+    if pos < 0 or pos >= my_list['size'] or numelem < 0:
+        return None
+    end_pos = min(pos + numelem, my_list['size'])
+    return new_list(my_list['typecode'], my_list['elements'][pos:end_pos])
+
+def sort(my_list, reverse=False):
+    """Ordena la lista de manera ascendente (o descendente si ``reverse`` es True).
+
+    Args:
+        my_list (typed_array_list): La lista a ordenar.
+        reverse (bool): Indica si se ordena de manera descendente.
+
+    Returns:
+        typed_array_list: La lista ordenada.
+    """
+    elements = my_list['elements']
+    elements[:] = array(my_list['typecode'], sorted(elements, reverse=reverse))
+    return my_list
+
+def as_memoryview(my_list):
+    """Retorna un ``memoryview`` sobre los datos de la lista, sin copiarlos.
+
+    Mientras el ``memoryview`` (o un arreglo de NumPy construido sobre él) exista,
+    la lista no puede cambiar de tamaño: ``add_last``, ``insert_element`` y las
+    funciones de eliminación lanzan ``BufferError``. ``change_info`` y los
+    cambios a través del ``memoryview`` sí están permitidos.
+
+    Args:
+        my_list (typed_array_list): La lista a exportar.
+
+    Returns:
+        memoryview: Vista de los datos con el formato de ``typecode``.
+    """
+    return memoryview(my_list['elements'])
@@ -2,6 +2,28 @@
   Estructura que contiene la información a guardar en una ``entry`` de un Map
 """
 
+class MapEntry:
+    """
+    Registro compacto de una pareja llave-valor. Usa ``__slots__`` para no
+    crear un diccionario por cada entrada; se sigue pudiendo acceder a los
+    campos con ``entry["key"]`` por compatibilidad.
+    """
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        setattr(self, field, value)
+
+    def __repr__(self):
+        return 'MapEntry({!r}, {!r})'.format(self.key, self.value)
+
+
 def new_map_entry(key, value):
     """ Retorna una pareja llave valor para ser guardada en un Map
 
@@ -11,10 +33,9 @@ def new_map_entry(key, value):
         :type value: any
 
         :return: Una entrada con la pareja llave-valor
-        :rtype: dict
+        :rtype: map_entry
     """
-    entry = {'key': key, 'value': value}
-    return entry
+    return MapEntry(key, value)
 
 
 def set_key(my_entry, key):
@@ -28,7 +49,7 @@ def set_key(my_entry, key):
         :return: La pareja modificada
         :rtype: map_entry
     """
-    my_entry['key'] = key
+    my_entry.key = key
     return my_entry
 
 
@@ -43,7 +64,7 @@ def set_value(my_entry, value):
         :return: La pareja modificada
         :rtype: map_entry
     """
-    my_entry['value'] = value
+    my_entry.value = value
     return my_entry
 
 
@@ -57,7 +78,7 @@ def get_key(my_entry):
     :return: La llave de la pareja
     :rtype: any
     """
-    return my_entry['key']
+    return my_entry.key
 
 
 def get_value(my_entry):
@@ -70,4 +91,4 @@ def get_value(my_entry):
     :return: El valor de la pareja
     :rtype: any
     """
-    return my_entry['value']
\ No newline at end of file
+    return my_entry.value
\ No newline at end of file
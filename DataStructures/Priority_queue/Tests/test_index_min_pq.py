@@ -0,0 +1,85 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Priority_queue import index_min_pq as pq
+
+
+@handle_not_implemented
+def test_new_index_pq():
+    my_pq = pq.new_index_pq(10)
+
+    assert pq.size(my_pq) == 0
+    assert pq.is_empty(my_pq)
+    assert pq.min_index(my_pq) is None
+    assert pq.min_key(my_pq) is None
+    assert pq.del_min(my_pq) is None
+    assert not pq.contains(my_pq, 3)
+    assert not pq.contains(my_pq, 10)
+
+
+@handle_not_implemented
+def test_insert_and_del_min():
+    my_pq = pq.new_index_pq(10)
+    pq.insert(my_pq, 4, 2.5)
+    pq.insert(my_pq, 7, 1.0)
+    pq.insert(my_pq, 0, 3.0)
+
+    assert pq.size(my_pq) == 3
+    assert pq.contains(my_pq, 7)
+    assert pq.get_key(my_pq, 4) == 2.5
+    assert pq.get_key(my_pq, 5) is None
+    assert pq.min_index(my_pq) == 7
+    assert pq.min_key(my_pq) == 1.0
+    assert pq.del_min(my_pq) == 7
+    assert not pq.contains(my_pq, 7)
+    assert pq.del_min(my_pq) == 4
+    assert pq.del_min(my_pq) == 0
+    assert pq.is_empty(my_pq)
+
+
+@handle_not_implemented
+def test_change_key():
+    my_pq = pq.new_index_pq(5)
+    for index, key in enumerate([5.0, 4.0, 3.0, 2.0, 1.0]):
+        pq.insert(my_pq, index, key)
+
+    pq.decrease_key(my_pq, 0, 0.5)
+    assert pq.min_index(my_pq) == 0
+    pq.decrease_key(my_pq, 1, 10.0)
+    assert pq.get_key(my_pq, 1) == 4.0
+    pq.change_key(my_pq, 0, 9.0)
+    assert pq.min_index(my_pq) == 4
+    pq.insert(my_pq, 4, 8.0)
+    assert pq.size(my_pq) == 5
+    pq.delete(my_pq, 3)
+    assert not pq.contains(my_pq, 3)
+    assert [pq.del_min(my_pq) for i in range(4)] == [2, 1, 4, 0]
+
+
+@handle_not_implemented
+def test_random_operations():
+    rnd = random.Random(5)
+    my_pq = pq.new_index_pq(50)
+    expected = {}
+    for step in range(2000):
+        index = rnd.randrange(50)
+        operation = rnd.randrange(4)
+        if operation == 0:
+            key = rnd.uniform(0, 100)
+            pq.insert(my_pq, index, key)
+            expected[index] = key
+        elif operation == 1 and index in expected:
+            key = rnd.uniform(0, 100)
+            pq.change_key(my_pq, index, key)
+            expected[index] = key
+        elif operation == 2 and index in expected:
+            pq.delete(my_pq, index)
+            del expected[index]
+        elif operation == 3 and expected:
+            smallest = min(expected.values())
+            assert pq.min_key(my_pq) == smallest
+            removed = pq.del_min(my_pq)
+            assert expected.pop(removed) == smallest
+        assert pq.size(my_pq) == len(expected)
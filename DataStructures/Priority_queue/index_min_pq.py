@@ -0,0 +1,279 @@
+"""
+  Cola de prioridad indexada orientada a menor (Index Min Priority Queue).
+
+  Guarda a lo sumo un elemento por cada índice entero ``0 .. capacity-1``,
+  cada uno con una llave (prioridad) real. Además de sacar el mínimo permite
+  consultar y cambiar la llave de un índice en O(log n), que es lo que
+  necesitan Prim "eager" y Dijkstra para actualizar la prioridad de un vértice
+  en lugar de insertarlo de nuevo.
+
+  Se implementa con un heap binario en arreglos: ``pq`` guarda los índices en
+  orden de heap, ``qp`` la posición de cada índice en el heap (-1 si no está)
+  y ``keys`` la llave de cada índice.
+"""
+
+import math
+from array import array
+
+
+def new_index_pq(capacity):
+    """
+    Crea una cola de prioridad indexada vacía.
+
+    Args:
+        capacity (int): Número de índices posibles, de 0 a ``capacity - 1``
+
+    Returns:
+        index_min_pq: La cola vacía
+    """
+    return {'keys': array('d', [math.inf]) * capacity,
+            'pq': array('q', [0]) * capacity,
+            'qp': array('q', [-1]) * capacity,
+            'size': 0,
+            'capacity': capacity,
+            'type': 'INDEX_MIN_PQ',
+            }
+
+
+def size(my_pq):
+    """
+    Retorna el número de índices en la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+
+    Returns:
+        int: El número de índices
+    """
+    return my_pq['size']
+
+
+def is_empty(my_pq):
+    """
+    Indica si la cola está vacía.
+
+    Args:
+        my_pq (index_min_pq): La cola
+
+    Returns:
+        bool: True si la cola no tiene índices
+    """
+    return my_pq['size'] == 0
+
+
+def contains(my_pq, index):
+    """
+    Indica si ``index`` está en la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice a buscar
+
+    Returns:
+        bool: True si el índice está en la cola
+    """
+    return 0 <= index < my_pq['capacity'] and my_pq['qp'][index] != -1
+
+
+def insert(my_pq, index, key):
+    """
+    Inserta ``index`` con llave ``key``. Si el índice ya está en la cola,
+    se cambia su llave.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice a insertar
+        key (float): La llave del índice
+
+    Returns:
+        index_min_pq: La cola actualizada
+    """
+    if my_pq['qp'][index] != -1:
+        return change_key(my_pq, index, key)
+    pos = my_pq['size']
+    my_pq['size'] += 1
+    my_pq['qp'][index] = pos
+    my_pq['pq'][pos] = index
+    my_pq['keys'][index] = key
+    swim(my_pq, pos)
+    return my_pq
+
+
+def get_key(my_pq, index):
+    """
+    Retorna la llave de ``index``.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice
+
+    Returns:
+        float: La llave del índice, o None si no está en la cola
+    """
+    if not contains(my_pq, index):
+        return None
+    return my_pq['keys'][index]
+
+
+def min_index(my_pq):
+    """
+    Retorna el índice con la menor llave, sin sacarlo de la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+
+    Returns:
+        int: El índice, o None si la cola está vacía
+    """
+    if my_pq['size'] == 0:
+        return None
+    return my_pq['pq'][0]
+
+
+def min_key(my_pq):
+    """
+    Retorna la menor llave de la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+
+    Returns:
+        float: La llave, o None si la cola está vacía
+    """
+    if my_pq['size'] == 0:
+        return None
+    return my_pq['keys'][my_pq['pq'][0]]
+
+
+def del_min(my_pq):
+    """
+    Saca de la cola el índice con la menor llave.
+
+    Args:
+        my_pq (index_min_pq): La cola
+
+    Returns:
+        int: El índice eliminado, o None si la cola está vacía
+    """
+    if my_pq['size'] == 0:
+        return None
+    pq = my_pq['pq']
+    index = pq[0]
+    last = my_pq['size'] - 1
+    exchange(my_pq, 0, last)
+    my_pq['size'] = last
+    sink(my_pq, 0)
+    my_pq['qp'][index] = -1
+    my_pq['keys'][index] = math.inf
+    return index
+
+
+def change_key(my_pq, index, key):
+    """
+    Cambia la llave de ``index``, que debe estar en la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice
+        key (float): La nueva llave
+
+    Returns:
+        index_min_pq: La cola actualizada
+    """
+    pos = my_pq['qp'][index]
+    if pos == -1:
+        return my_pq
+    old_key = my_pq['keys'][index]
+    my_pq['keys'][index] = key
+    if key < old_key:
+        swim(my_pq, pos)
+    else:
+        sink(my_pq, pos)
+    return my_pq
+
+
+def decrease_key(my_pq, index, key):
+    """
+    Disminuye la llave de ``index`` a ``key``; si ``key`` no es menor que la
+    llave actual la cola no cambia.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice
+        key (float): La nueva llave
+
+    Returns:
+        index_min_pq: La cola actualizada
+    """
+    pos = my_pq['qp'][index]
+    if pos != -1 and key < my_pq['keys'][index]:
+        my_pq['keys'][index] = key
+        swim(my_pq, pos)
+    return my_pq
+
+
+def delete(my_pq, index):
+    """
+    Elimina ``index`` de la cola.
+
+    Args:
+        my_pq (index_min_pq): La cola
+        index (int): El índice a eliminar
+
+    Returns:
+        index_min_pq: La cola actualizada
+    """
+    pos = my_pq['qp'][index]
+    if pos == -1:
+        return my_pq
+    last = my_pq['size'] - 1
+    exchange(my_pq, pos, last)
+    my_pq['size'] = last
+    if pos < last:
+        swim(my_pq, pos)
+        sink(my_pq, pos)
+    my_pq['qp'][index] = -1
+    my_pq['keys'][index] = math.inf
+    return my_pq
+
+
+def swim(my_pq, pos):
+    """
+    Sube el índice en la posición ``pos`` del heap hasta restaurar el orden.
+    """
+    keys = my_pq['keys']
+    pq = my_pq['pq']
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if keys[pq[parent]] <= keys[pq[pos]]:
+            break
+        exchange(my_pq, pos, parent)
+        pos = parent
+
+
+def sink(my_pq, pos):
+    """
+    Baja el índice en la posición ``pos`` del heap hasta restaurar el orden.
+    """
+    keys = my_pq['keys']
+    pq = my_pq['pq']
+    n = my_pq['size']
+    while 2 * pos + 1 < n:
+        child = 2 * pos + 1
+        if child + 1 < n and keys[pq[child + 1]] < keys[pq[child]]:
+            child += 1
+        if keys[pq[pos]] <= keys[pq[child]]:
+            break
+        exchange(my_pq, pos, child)
+        pos = child
+
+
+def exchange(my_pq, i, j):
+    """
+    Intercambia las posiciones ``i`` y ``j`` del heap.
+    """
+    pq = my_pq['pq']
+    qp = my_pq['qp']
+    pq[i], pq[j] = pq[j], pq[i]
+    qp[pq[i]] = i
+    qp[pq[j]] = j